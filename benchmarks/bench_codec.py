@@ -0,0 +1,140 @@
+"""Measure the JSON codec and compression savings per call.
+
+Three sections are reported:
+
+- ``decode``/``encode``: CPU time to parse an ``/api/episodes`` body and to
+  render it as tool output, stdlib ``json`` versus ``podhome_mcp.codec``
+  (orjson when installed)
+- ``list_episodes[<encoding>]``: bytes on the wire and client CPU time per
+  ``list_episodes(include_transcript=True)`` call against the fake API for
+  each response encoding the client can negotiate
+- ``modify_episode[image_data]``: request body bytes with and without gzip
+
+Run from the repository root:
+
+    python -m benchmarks.bench_codec --episodes 500 --calls 20
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+
+import httpx
+
+from podhome_mcp import codec
+from podhome_mcp.client import PodhomeClient
+from podhome_mcp.metrics import Metrics
+
+from .fake_podhome import FakePodhome, FakeSettings
+
+
+@dataclass
+class Result:
+    """One measurement: CPU milliseconds and bytes per call."""
+
+    scenario: str
+    cpu_ms: float
+    bytes: int | None = None
+
+
+def cpu_per_call(fn, calls: int) -> float:
+    """Return the mean process CPU time of ``fn()`` in milliseconds."""
+    start = time.process_time()
+    for _ in range(calls):
+        fn()
+    return 1000 * (time.process_time() - start) / calls
+
+
+def stdlib_dumps(value) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+async def measure_wire(app: FakePodhome, encoding: str, calls: int) -> Result:
+    """Time uncached list_episodes calls with one Accept-Encoding."""
+    metrics = Metrics()
+    client = PodhomeClient(
+        "key0",
+        "http://podhome.test",
+        name="show0",
+        metrics=metrics,
+        transport=httpx.ASGITransport(app=app),
+    )
+    client._client.headers["Accept-Encoding"] = encoding
+    await client.list_episodes(include_transcript=True)  # warm the fake's body cache
+    before = metrics.counter(
+        "podhome_http_response_bytes_total", show="show0", endpoint="GET /api/episodes", tool=None
+    )
+    start = time.process_time()
+    for _ in range(calls):
+        await client.list_episodes(include_transcript=True)
+    cpu = time.process_time() - start
+    total = metrics.counter(
+        "podhome_http_response_bytes_total", show="show0", endpoint="GET /api/episodes", tool=None
+    )
+    await client.aclose()
+    return Result(f"list_episodes[{encoding}]", 1000 * cpu / calls, round((total - before) / calls))
+
+
+async def run(args: argparse.Namespace) -> list[Result]:
+    """Run every measurement and print one line per result."""
+    app = FakePodhome(
+        FakeSettings(episodes=args.episodes, transcript_bytes=args.transcript_bytes, compress=True)
+    )
+    body = app._episodes_body(app._show("key0"), {"includeTranscript": ["true"]})
+    episodes = json.loads(body)
+    results = [
+        Result("decode[stdlib]", cpu_per_call(lambda: json.loads(body), args.calls), len(body)),
+        Result("decode[codec]", cpu_per_call(lambda: codec.loads(body), args.calls), len(body)),
+        Result("encode[stdlib]", cpu_per_call(lambda: stdlib_dumps(episodes), args.calls)),
+        Result("encode[codec]", cpu_per_call(lambda: codec.dumps_str(episodes), args.calls)),
+    ]
+    for encoding in ["identity", *codec.accepted_encodings()]:
+        if encoding != "deflate":
+            results.append(await measure_wire(app, encoding, args.calls))
+
+    # Base64 of incompressible image bytes, as modify_episode sends it
+    payload = {
+        "episode_id": "e1",
+        "image_data": base64.b64encode(os.urandom(args.image_kb * 1024)).decode(),
+    }
+    for label, threshold in (("plain", None), ("gzip", 0)):
+        request = codec.encode_body(payload, threshold)
+        results.append(
+            Result(
+                f"modify_episode[image_data,{label}]",
+                cpu_per_call(lambda: codec.encode_body(payload, threshold), args.calls),
+                len(request["content"]),
+            )
+        )
+
+    if not codec.orjson_available():
+        print("note: orjson is not installed; codec uses the stdlib", file=sys.stderr)
+    for r in results:
+        size = f"{r.bytes:>12,} B" if r.bytes is not None else " " * 14
+        print(f"{r.scenario:36} {r.cpu_ms:9.3f} ms/call {size}", flush=True)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--episodes", type=int, default=200)
+    parser.add_argument("--transcript-bytes", type=int, default=20_000)
+    parser.add_argument("--calls", type=int, default=20, help="Calls per measurement")
+    parser.add_argument("--image-kb", type=int, default=512, help="Size of image_data before base64")
+    parser.add_argument("--json", help="Write results as JSON to this path")
+    args = parser.parse_args(argv)
+    results = asyncio.run(run(args))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"results": [asdict(r) for r in results]}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
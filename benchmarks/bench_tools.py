@@ -0,0 +1,433 @@
+"""Load-test every MCP tool against the local fake Podhome API.
+
+Each scenario calls one tool through an in-memory MCP client at several
+concurrency levels and reports p50/p99 latency, calls per second and the
+process's peak RSS. Run from the repository root:
+
+    python -m benchmarks.bench_tools --episodes 10 500 --concurrency 1 8 32
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+
+import httpx
+from fastmcp import Client, FastMCP
+
+from podhome_mcp.client import ClientRegistry
+from podhome_mcp.config import Config
+from podhome_mcp.tools import register_tools
+from podhome_mcp.webhooks import WebhookReceiver
+
+from .fake_podhome import FakePodhome, FakeSettings
+
+
+@dataclass
+class Result:
+    """Measurements for one scenario at one concurrency level."""
+
+    scenario: str
+    episodes: int
+    concurrency: int
+    calls: int
+    errors: int
+    p50_ms: float
+    p99_ms: float
+    calls_per_s: float
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Return the ``q`` percentile (0-1) of ``values`` by nearest rank."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def peak_rss_mb() -> float:
+    """Return this process's peak resident set size in MiB."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1 << 20) if sys.platform == "darwin" else rss / 1024
+
+
+STORAGE_TOOLS = {"get_r2_public_url", "upload_media"}
+
+
+def start_fake_s3() -> tuple[object, str] | None:
+    """Start moto's S3 server on a free port, if moto is installed.
+
+    Returns:
+        ``(server, endpoint_url)``, or None when moto is unavailable.
+    """
+    try:
+        import boto3
+        from moto.server import ThreadedMotoServer
+    except ImportError:
+        return None
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = ThreadedMotoServer(port=0, verbose=False)
+    server.start()
+    host, port = server.get_host_and_port()
+    endpoint = f"http://{host}:{port}"
+    boto3.client(
+        "s3",
+        endpoint_url=endpoint,
+        region_name="us-east-1",
+        aws_access_key_id="bench",
+        aws_secret_access_key="bench",
+    ).create_bucket(Bucket="bench")
+    return server, endpoint
+
+
+def write_cover(path: str, side: int = 2000) -> None:
+    """Write a JPEG cover larger than the bench's image limits, so it gets resized.
+
+    Without Pillow this is a JPEG signature followed by filler, which is
+    sent as is.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        with open(path, "wb") as f:
+            f.write(b"\xff\xd8\xff\xe0" + bytes(200 * 1024))
+        return
+    Image.linear_gradient("L").resize((side, side)).convert("RGB").save(path, quality=90)
+
+
+def scenarios(
+    show: str,
+    episode_ids: list[str],
+    media_path: str | None = None,
+    image_path: str | None = None,
+) -> list[tuple[str, str, dict]]:
+    """Return ``(label, tool, arguments)`` for every benchmarked tool call.
+
+    Storage scenarios are only included when a media file is given, and
+    cover image scenarios when an image file is given.
+    """
+    eid = episode_ids[0]
+    batch = episode_ids[:20]
+    plan = [
+        ("list_shows", "list_shows", {}),
+        ("cache_stats", "cache_stats", {}),
+        ("server_stats", "server_stats", {}),
+        # n=0 only reports; arming would profile the scenarios that follow
+        ("profile_next_calls", "profile_next_calls", {"n": 0}),
+        ("list_episodes", "list_episodes", {"show": show}),
+        ("list_episodes[all]", "list_episodes", {"show": "*", "max_items": 50}),
+        (
+            "list_episodes[transcript]",
+            "list_episodes",
+            {"show": show, "include_transcript": True, "max_items": 20},
+        ),
+        ("get_episode", "get_episode", {"show": show, "episode_id": eid}),
+        ("find_episodes", "find_episodes", {"show": show, "status": 2, "max_items": 20}),
+        ("sync_episodes", "sync_episodes", {"show": show}),
+        (
+            "wait_for_episode",
+            "wait_for_episode",
+            {"show": show, "episode_id": eid, "require_fields": ["title"], "timeout": 10},
+        ),
+        ("download_stats", "download_stats", {"show": show}),
+        ("download_stats[all]", "download_stats", {"show": "*"}),
+        (
+            "search_transcripts",
+            "search_transcripts",
+            {"show": show, "query": "linux security", "limit": 5},
+        ),
+        (
+            "create_episode",
+            "create_episode",
+            {"show": show, "file_url": "https://cdn.example.com/new.mp3", "title": "New"},
+        ),
+        ("modify_episode", "modify_episode", {"show": show, "episode_id": eid, "title": "Renamed"}),
+        (
+            "schedule_episode",
+            "schedule_episode",
+            {"show": show, "episode_id": eid, "publish_date": "2030-01-01T10:00:00Z"},
+        ),
+        (
+            "create_clip",
+            "create_clip",
+            {"show": show, "episode_id": eid, "title": "Clip", "start_time": 1.5, "duration": 30},
+        ),
+        (
+            "create_episodes_bulk",
+            "create_episodes_bulk",
+            {
+                "show": show,
+                "episodes": [
+                    {"file_url": f"https://cdn.example.com/{i}.mp3", "title": f"Bulk {i}"}
+                    for i in range(len(batch))
+                ],
+            },
+        ),
+        (
+            "modify_episodes_bulk",
+            "modify_episodes_bulk",
+            {"show": show, "episodes": [{"episode_id": e, "season_nr": 2} for e in batch]},
+        ),
+        (
+            "schedule_episodes_bulk",
+            "schedule_episodes_bulk",
+            {"show": show, "episodes": [{"episode_id": e, "publish_now": True} for e in batch]},
+        ),
+        (
+            "create_clips_bulk",
+            "create_clips_bulk",
+            {
+                "show": show,
+                "clips": [
+                    {"episode_id": e, "title": "Clip", "start_time": 0, "duration": 10}
+                    for e in batch
+                ],
+            },
+        ),
+        ("list_webhooks", "list_webhooks", {"show": show}),
+        ("list_webhooks[all]", "list_webhooks", {"show": "*"}),
+        (
+            "register_webhook",
+            "register_webhook",
+            {"show": show, "url": "https://hooks.example.com/x", "action_type": "episode_published"},
+        ),
+        (
+            "register_webhook[receiver]",
+            "register_webhook",
+            {"show": show, "action_type": "episode_live"},
+        ),
+        ("delete_webhook", "delete_webhook", {"show": show, "integration_id": "missing"}),
+        ("test_webhook", "test_webhook", {"show": show}),
+        (
+            "wait_for_event",
+            "wait_for_event",
+            {"show": show, "episode_id": eid, "after": 0, "timeout": 5},
+        ),
+    ]
+    if image_path:
+        plan += [
+            (
+                "modify_episode[image]",
+                "modify_episode",
+                {"show": show, "episode_id": eid, "image_path": image_path},
+            ),
+            (
+                "set_episode_images_bulk",
+                "set_episode_images_bulk",
+                {
+                    "show": show,
+                    "images": [{"episode_id": e, "image_path": image_path} for e in batch[:4]],
+                },
+            ),
+        ]
+    if media_path:
+        plan += [
+            ("upload_media", "upload_media", {"path": media_path, "object_key": "bench.mp3"}),
+            (
+                "get_r2_public_url",
+                "get_r2_public_url",
+                {"bucket": "bench", "object_key": "bench.mp3"},
+            ),
+        ]
+    return plan
+
+
+async def run_scenario(
+    client: Client, tool: str, arguments: dict, concurrency: int, calls: int
+) -> tuple[list[float], int, float]:
+    """Call ``tool`` ``calls`` times with ``concurrency`` workers.
+
+    Returns:
+        Per-call latencies in seconds, the error count and the wall time.
+    """
+    latencies: list[float] = []
+    errors = 0
+    remaining = calls
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            start = time.perf_counter()
+            result = await client.call_tool(tool, arguments, raise_on_error=False)
+            latencies.append(time.perf_counter() - start)
+            text = result.content[0].text if result.content else ""
+            if result.is_error or text.startswith("Error:"):
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+async def run(args: argparse.Namespace) -> list[Result]:
+    """Run every scenario for every catalogue size and concurrency level."""
+    results: list[Result] = []
+    fake_s3 = start_fake_s3()
+    storage_settings = {}
+    media_path = None
+    if fake_s3 is None:
+        print("note: moto is not installed; skipping storage tools", file=sys.stderr)
+    else:
+        storage_settings = dict(
+            s3_endpoint_url=fake_s3[1],
+            s3_region="us-east-1",
+            r2_access_key_id="bench",
+            r2_secret_access_key="bench",
+            storage_bucket="bench",
+            upload_part_size=5 * 1024 * 1024,
+        )
+        media = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
+        with media:
+            for _ in range(args.media_mb):
+                media.write(os.urandom(1024 * 1024))
+        media_path = media.name
+    cover = tempfile.NamedTemporaryFile(suffix=".jpg", delete=False)
+    cover.close()
+    write_cover(cover.name)
+    try:
+        for size in args.episodes:
+            results.extend(
+                await run_size(args, size, storage_settings, media_path, cover.name)
+            )
+    finally:
+        os.unlink(cover.name)
+        if fake_s3 is not None:
+            fake_s3[0].stop()
+            os.unlink(media_path)
+    return results
+
+
+async def run_size(
+    args: argparse.Namespace,
+    size: int,
+    storage_settings: dict,
+    media_path: str | None,
+    image_path: str | None = None,
+) -> list[Result]:
+    """Run every scenario against one catalogue size."""
+    results: list[Result] = []
+    app = FakePodhome(
+        FakeSettings(
+            episodes=size,
+            transcript_bytes=args.transcript_bytes,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+        )
+    )
+    shows = {f"show{i}": f"key{i}" for i in range(args.shows)}
+    config = Config(
+        shows=shows,
+        base_url="http://podhome.test",
+        rate_limit=args.rate_limit,
+        cache_ttl=args.cache_ttl,
+        retry_base_delay=0.01,
+        # Under the 2000 px bench cover, so every image call resizes it
+        image_max_dimension=1400,
+        # The media and cover files are created in the temp directory
+        media_root=tempfile.gettempdir(),
+        **storage_settings,
+    )
+    registry = ClientRegistry(config, transport=httpx.ASGITransport(app=app))
+    registry.receiver = await WebhookReceiver(
+        registry, public_url="https://hooks.podhome.test", secret="bench"
+    ).start()
+    mcp = FastMCP("podhome-bench")
+    register_tools(mcp, config, registry)
+
+    # Build every fake catalogue up front so it isn't timed
+    for key in shows.values():
+        app._show(key)
+    episode_ids = list(app._show("key0").episodes)
+    # Deliver one webhook so wait_for_event finds an event to return
+    async with httpx.AsyncClient() as hooks:
+        await hooks.post(
+            registry.receiver.url_for("show0", "episode_published", local=True),
+            json={"episode_id": episode_ids[0]},
+        )
+    plan = scenarios("show0", episode_ids, media_path, image_path)
+    async with Client(mcp) as client:
+        registered = {t.name for t in await client.list_tools()}
+        missing = registered - {tool for _, tool, _ in plan}
+        if media_path is None:
+            missing -= STORAGE_TOOLS
+        if missing:
+            print(f"warning: no scenario for tools: {sorted(missing)}", file=sys.stderr)
+        for label, tool, arguments in plan:
+            if args.only and label not in args.only:
+                continue
+            for concurrency in args.concurrency:
+                calls = max(args.calls, concurrency)
+                latencies, errors, wall = await run_scenario(
+                    client, tool, arguments, concurrency, calls
+                )
+                result = Result(
+                    scenario=label,
+                    episodes=size,
+                    concurrency=concurrency,
+                    calls=calls,
+                    errors=errors,
+                    p50_ms=round(1000 * percentile(latencies, 0.5), 2),
+                    p99_ms=round(1000 * percentile(latencies, 0.99), 2),
+                    calls_per_s=round(calls / wall, 1),
+                )
+                results.append(result)
+                print(
+                    f"{label:28} n={size:<5} c={concurrency:<3} "
+                    f"p50={result.p50_ms:8.2f}ms p99={result.p99_ms:8.2f}ms "
+                    f"{result.calls_per_s:8.1f}/s errors={errors}",
+                    flush=True,
+                )
+    await registry.receiver.aclose()
+    await registry.aclose()
+    print(f"peak RSS after n={size}: {peak_rss_mb():.1f} MiB", flush=True)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--episodes", type=int, nargs="+", default=[10, 500])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--calls", type=int, default=50, help="Calls per scenario and level")
+    parser.add_argument("--shows", type=int, default=3)
+    parser.add_argument("--transcript-bytes", type=int, default=20_000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Fake API latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Injected 429/503 rate")
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="Client rate limit")
+    parser.add_argument("--cache-ttl", type=float, default=60.0)
+    parser.add_argument(
+        "--media-mb", type=int, default=12, help="Size of the file upload_media sends (MiB)"
+    )
+    parser.add_argument("--only", nargs="+", help="Run only these scenario labels")
+    parser.add_argument("--json", help="Write results as JSON to this path")
+    parser.add_argument(
+        "--max-p99-ms", type=float, help="Exit non-zero if any scenario's p99 exceeds this"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(run(args))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {"results": [asdict(r) for r in results], "peak_rss_mb": round(peak_rss_mb(), 1)},
+                f,
+                indent=2,
+            )
+    if args.max_p99_ms is not None:
+        slow = [r for r in results if r.p99_ms > args.max_p99_ms]
+        for r in slow:
+            print(f"p99 budget exceeded: {r.scenario} n={r.episodes} c={r.concurrency}", file=sys.stderr)
+        return 1 if slow else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""A local stand-in for the Podhome Integration API.
+
+``FakePodhome`` is a plain ASGI application implementing the endpoints the
+MCP server calls, with configurable latency, catalogue and transcript sizes
+and injected 429/5xx errors. Each API key gets its own catalogue.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import random
+import uuid
+from dataclasses import dataclass, field
+from urllib.parse import parse_qs
+
+
+@dataclass
+class FakeSettings:
+    """Behaviour of the fake API."""
+
+    episodes: int = 100
+    transcript_bytes: int = 20_000
+    description_bytes: int = 500
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    # Compress responses with the best encoding the client accepts
+    compress: bool = False
+    seed: int = 1
+
+
+@dataclass
+class _Show:
+    episodes: dict[str, dict]
+    webhooks: dict[str, dict] = field(default_factory=dict)
+    version: int = 0
+    bodies: dict[tuple, bytes] = field(default_factory=dict)
+
+
+def _compressors() -> dict:
+    compressors = {"gzip": lambda data: gzip.compress(data, compresslevel=6, mtime=0)}
+    try:
+        import brotli
+
+        compressors["br"] = lambda data: brotli.compress(data, quality=5)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+
+        compressors["zstd"] = zstandard.ZstdCompressor(level=3).compress
+    except ImportError:
+        pass
+    return compressors
+
+
+COMPRESSORS = _compressors()
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress a body with one of the encodings in ``COMPRESSORS``."""
+    return COMPRESSORS[encoding](data)
+
+
+STATUSES = ["Draft", "Scheduled", "Published", "LivePending", "Live", "LiveEnded"]
+
+
+class FakePodhome:
+    """ASGI app emulating ``/api/episodes``, episode writes, clips and hooks."""
+
+    def __init__(self, settings: FakeSettings | None = None):
+        """Initialize with empty per-key catalogues, built on first use."""
+        self.settings = settings or FakeSettings()
+        self._random = random.Random(self.settings.seed)
+        self._shows: dict[str, _Show] = {}
+        self.requests = 0
+        self.errors_injected = 0
+
+    # ========== Data ==========
+
+    def _show(self, api_key: str) -> _Show:
+        show = self._shows.get(api_key)
+        if show is None:
+            show = self._shows[api_key] = _Show(self._catalogue(api_key))
+        return show
+
+    def _catalogue(self, api_key: str) -> dict[str, dict]:
+        s = self.settings
+        rng = random.Random(f"{s.seed}:{api_key}")
+        words = ["podcast", "episode", "linux", "python", "news", "security", "open", "source"]
+        episodes = {}
+        for i in range(s.episodes):
+            eid = str(uuid.UUID(int=rng.getrandbits(128)))
+            text = " ".join(rng.choice(words) for _ in range(s.transcript_bytes // 7 + 1))
+            episodes[eid] = {
+                "episode_id": eid,
+                "title": f"Episode {i + 1}",
+                "description": "x" * s.description_bytes,
+                "status": STATUSES[2 if i < s.episodes - 2 else 1],
+                "publish_date": f"{2020 + i // 365:04d}-{i % 12 + 1:02d}-{i % 28 + 1:02d}T10:00:00Z",
+                "episode_nr": i + 1,
+                "season_nr": i // 50 + 1,
+                "duration": "01:00:00",
+                "enclosure_url": f"https://cdn.example.com/{eid}.mp3",
+                "link": f"https://example.com/{i + 1}",
+                "image_url": f"https://cdn.example.com/{eid}.jpg",
+                "downloads": rng.randint(100, 100_000),
+                "chapters": [{"start_time": 0, "title": "Intro"}, {"start_time": 60, "title": "Main"}],
+                "transcript": {
+                    "language": "en",
+                    "transcript_url": f"https://cdn.example.com/{eid}.vtt",
+                    "text": text[: s.transcript_bytes],
+                },
+                "people": [{"name": "Host", "role": "host"}],
+            }
+        return episodes
+
+    def _episodes_body(self, show: _Show, query: dict[str, list[str]]) -> bytes:
+        flags = tuple(
+            query.get(name, ["false"])[0] == "true"
+            for name in ("includeTranscript", "includeChapters", "includeDownloads", "includePeople")
+        )
+        status = query.get("status", [None])[0]
+        key = (status, flags)
+        body = show.bodies.get(key)
+        if body is None:
+            include_transcript, include_chapters, include_downloads, include_people = flags
+            dropped = {
+                name
+                for name, keep in (
+                    ("transcript", include_transcript),
+                    ("chapters", include_chapters),
+                    ("downloads", include_downloads),
+                    ("people", include_people),
+                )
+                if not keep
+            }
+            wanted = STATUSES[int(status)] if status is not None else None
+            episodes = [
+                {k: v for k, v in e.items() if k not in dropped}
+                for e in show.episodes.values()
+                if wanted is None or e["status"] == wanted
+            ]
+            body = show.bodies[key] = json.dumps(episodes).encode()
+        return body
+
+    def _compressed_body(self, show: _Show, query: dict[str, list[str]], encoding: str) -> bytes:
+        # Episode bodies are compressed once per version, like a caching CDN
+        key = ("compressed", encoding, *sorted((k, tuple(v)) for k, v in query.items()))
+        body = show.bodies.get(key)
+        if body is None:
+            body = show.bodies[key] = compress(self._episodes_body(show, query), encoding)
+        return body
+
+    def _changed(self, show: _Show) -> None:
+        show.version += 1
+        show.bodies.clear()
+
+    # ========== ASGI ==========
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+
+        chunks = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body"):
+                break
+        body = b"".join(chunks)
+        headers = {k.decode().lower(): v.decode() for k, v in scope["headers"]}
+        if headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        status, payload, extra = await self.handle(
+            scope["method"], scope["path"], parse_qs(scope["query_string"].decode()), headers, body
+        )
+        out_headers = [(b"content-type", b"application/json")] + [
+            (k.encode(), v.encode()) for k, v in extra.items()
+        ]
+        if not isinstance(payload, bytes):
+            payload = json.dumps(payload).encode() if payload is not None else b""
+        encoding = self._encoding(headers.get("accept-encoding", "")) if len(payload) >= 1024 else None
+        if encoding is not None and "Content-Encoding" not in extra:
+            payload = compress(payload, encoding)
+            out_headers.append((b"content-encoding", encoding.encode()))
+        out_headers.append((b"content-length", str(len(payload)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": out_headers})
+        await send({"type": "http.response.body", "body": payload})
+
+    def _encoding(self, accept: str) -> str | None:
+        if not self.settings.compress:
+            return None
+        offered = {e.split(";")[0].strip() for e in accept.split(",")}
+        return next((e for e in ("zstd", "br", "gzip") if e in offered and e in COMPRESSORS), None)
+
+    async def handle(self, method: str, path: str, query: dict, headers: dict, body: bytes):
+        """Route one request; returns ``(status, payload, extra_headers)``."""
+        s = self.settings
+        self.requests += 1
+        if s.latency or s.jitter:
+            await asyncio.sleep(s.latency + self._random.uniform(0, s.jitter))
+        if s.error_rate and self._random.random() < s.error_rate:
+            self.errors_injected += 1
+            if self._random.random() < 0.5:
+                return 429, {"error": "Too Many Requests"}, {"Retry-After": "0"}
+            return 503, {"error": "Service Unavailable"}, {}
+
+        api_key = headers.get("x-api-key")
+        if not api_key:
+            return 401, {"error": "Invalid API key"}, {}
+        show = self._show(api_key)
+        data = json.loads(body) if body else {}
+
+        if path == "/api/episodes" and method == "GET":
+            etag = f'"{hashlib.md5(f"{api_key}:{show.version}".encode()).hexdigest()}"'
+            if headers.get("if-none-match") == etag:
+                return 304, None, {"ETag": etag}
+            encoding = self._encoding(headers.get("accept-encoding", ""))
+            if encoding is not None:
+                body = self._compressed_body(show, query, encoding)
+                return 200, body, {"ETag": etag, "Content-Encoding": encoding}
+            return 200, self._episodes_body(show, query), {"ETag": etag}
+        if path == "/api/createepisode" and method == "POST":
+            eid = str(uuid.uuid4())
+            show.episodes[eid] = {"episode_id": eid, "status": "Draft", **data}
+            self._changed(show)
+            return 200, {"episodeId": eid}, {}
+        if path in ("/api/modify_episode", "/api/schedule_episode") and method == "POST":
+            episode = show.episodes.get(data.get("episode_id", ""))
+            if episode is None:
+                return 404, {"error": "Episode not found"}, {}
+            if path == "/api/schedule_episode":
+                episode["status"] = "Published" if data.get("publish_now") else "Scheduled"
+                if data.get("publish_date"):
+                    episode["publish_date"] = data["publish_date"]
+            else:
+                episode.update({k: v for k, v in data.items() if k not in ("image_data",)})
+            self._changed(show)
+            return 200, {"episode_id": episode["episode_id"], "status": episode["status"]}, {}
+        if path == "/api/createclip" and method == "POST":
+            if data.get("episode_id") not in show.episodes:
+                return 404, {"error": "Episode not found"}, {}
+            return 200, {"clipId": str(uuid.uuid4())}, {}
+        if path == "/api/hook":
+            if method == "GET":
+                return 200, list(show.webhooks.values()), {}
+            if method == "POST":
+                hid = str(uuid.uuid4())
+                show.webhooks[hid] = {"integration_id": hid, **data}
+                return 200, show.webhooks[hid], {}
+            if method == "DELETE":
+                show.webhooks.pop(data.get("integration_id", ""), None)
+                return 200, {"deleted": True}, {}
+        if path == "/api/hooktest" and method == "POST":
+            return 200, {"tested": len(show.webhooks)}, {}
+        return 404, {"error": "Not found"}, {}
@@ -0,0 +1,171 @@
+"""PodHome MCP Server - Download Analytics Module."""
+
+import importlib.util
+import math
+from typing import Any, Sequence
+
+from .index import episode_id
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0)
+
+
+def numpy_available() -> bool:
+    """Return True if the optional ``numpy`` package used for analytics is installed."""
+    return importlib.util.find_spec("numpy") is not None
+
+
+def _percentile(ordered: list[int], q: float) -> float:
+    """Linear-interpolated percentile of a sorted list, matching ``numpy.percentile``."""
+    pos = (len(ordered) - 1) * q / 100
+    lo, hi = math.floor(pos), math.ceil(pos)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def _kernels_numpy(downloads, seasons, n_seasons, dates, top_n, percentiles, window):
+    import numpy as np
+
+    d = np.asarray(downloads, dtype=np.int64)
+    k = min(top_n, len(d))
+    top = np.argpartition(-d, k - 1)[:k] if k else np.empty(0, dtype=np.intp)
+    top = top[np.lexsort((top, -d[top]))]
+    codes = np.asarray(seasons, dtype=np.intp)
+    season_totals = np.bincount(codes, weights=d, minlength=n_seasons)
+    season_counts = np.bincount(codes, minlength=n_seasons)
+    dated = np.flatnonzero(np.asarray([x is not None for x in dates], dtype=bool))
+    by_date = d[dated[np.argsort(np.asarray([dates[i] for i in dated]), kind="stable")]]
+    return (
+        int(d.sum()),
+        np.percentile(d, percentiles).tolist(),
+        top.tolist(),
+        [int(x) for x in season_totals],
+        season_counts.tolist(),
+        by_date[-window:].tolist(),
+        by_date[-2 * window : -window].tolist(),
+    )
+
+
+def _kernels_python(downloads, seasons, n_seasons, dates, top_n, percentiles, window):
+    ordered = sorted(downloads)
+    top = sorted(range(len(downloads)), key=lambda i: (-downloads[i], i))[:top_n]
+    season_totals = [0] * n_seasons
+    season_counts = [0] * n_seasons
+    for code, value in zip(seasons, downloads):
+        season_totals[code] += value
+        season_counts[code] += 1
+    dated = sorted((i for i, x in enumerate(dates) if x is not None), key=lambda i: dates[i])
+    by_date = [downloads[i] for i in dated]
+    return (
+        sum(downloads),
+        [_percentile(ordered, q) for q in percentiles],
+        top,
+        season_totals,
+        season_counts,
+        by_date[-window:],
+        by_date[-2 * window : -window],
+    )
+
+
+def _season_number(value: Any) -> int | None:
+    """Return a ``season_nr`` as an int; None when missing or not a number."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _growth(current: float, previous: float) -> float | None:
+    return round((current - previous) / previous, 4) if previous else None
+
+
+def _mean(values: Sequence[int]) -> float | None:
+    return round(sum(values) / len(values), 2) if values else None
+
+
+def download_stats(
+    episodes: list[dict],
+    *,
+    top_n: int = 10,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    window: int = 10,
+    use_numpy: bool | None = None,
+) -> dict[str, Any]:
+    """Summarize the ``downloads`` counts of a list of episode records.
+
+    Returns totals, the ``top_n`` episodes, percentiles, per-season totals
+    with season-over-season growth of the mean, and the growth of the mean
+    of the latest ``window`` episodes (by publish date) over the ``window``
+    before them. Episodes without a download count are only counted in
+    ``episodes``. The arithmetic runs on NumPy arrays when NumPy is
+    installed and falls back to plain Python otherwise.
+
+    Raises:
+        ValueError: If ``top_n`` or ``window`` is less than 1 or a percentile
+            is outside 0-100.
+    """
+    if top_n < 1:
+        raise ValueError("top_n must be at least 1")
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    for q in percentiles:
+        if not 0 <= q <= 100:
+            raise ValueError(f"Percentiles must be between 0 and 100, got {q:g}")
+    rows = [e for e in episodes if isinstance(e.get("downloads"), (int, float))]
+    downloads = [int(e["downloads"]) for e in rows]
+    summary: dict[str, Any] = {"episodes": len(episodes), "counted": len(rows)}
+    if not rows:
+        return summary
+
+    season_codes: dict[int | None, int] = {}
+    seasons = [
+        season_codes.setdefault(_season_number(e.get("season_nr")), len(season_codes))
+        for e in rows
+    ]
+    dates = [e.get("publish_date") for e in rows]
+    if use_numpy is None:
+        use_numpy = numpy_available()
+    kernels = _kernels_numpy if use_numpy else _kernels_python
+    total, pcts, top, season_totals, season_counts, recent, previous = kernels(
+        downloads, seasons, len(season_codes), dates, top_n, list(percentiles), window
+    )
+
+    season_rows: list[dict[str, Any]] = []
+    for season, code in sorted(season_codes.items(), key=lambda kv: (kv[0] is None, kv[0] or 0)):
+        mean = round(season_totals[code] / season_counts[code], 2)
+        season_rows.append(
+            {
+                "season_nr": season,
+                "episodes": season_counts[code],
+                "total": season_totals[code],
+                "mean": mean,
+                "growth": (
+                    _growth(mean, season_rows[-1]["mean"])
+                    if season_rows and season is not None
+                    else None
+                ),
+            }
+        )
+
+    summary.update(
+        total=total,
+        mean=round(total / len(rows), 2),
+        percentiles={f"p{q:g}": round(v, 2) for q, v in zip(percentiles, pcts)},
+        top=[
+            {
+                "episode_id": episode_id(rows[i]),
+                "title": rows[i].get("title"),
+                **({"show": rows[i]["show"]} if "show" in rows[i] else {}),
+                "season_nr": rows[i].get("season_nr"),
+                "episode_nr": rows[i].get("episode_nr"),
+                "downloads": downloads[i],
+            }
+            for i in top
+        ],
+        seasons=season_rows,
+        recent={
+            "window": window,
+            "mean": _mean(recent),
+            "previous_mean": _mean(previous),
+            "growth": _growth(_mean(recent) or 0, _mean(previous) or 0),
+        },
+    )
+    return summary
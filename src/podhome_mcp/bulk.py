@@ -0,0 +1,55 @@
+"""PodHome MCP Server - Bulk Operation Helpers."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from .index import episode_id
+
+logger = logging.getLogger(__name__)
+
+
+async def run_bulk(
+    func: Callable[[dict], Awaitable[Any]],
+    payloads: list[dict],
+    concurrency: int,
+    required: tuple[str, ...] = (),
+) -> dict:
+    """Run ``func`` over every payload with at most ``concurrency`` in flight.
+
+    ``None`` values are dropped from each payload, matching the single-item
+    tools. Failures are recorded per item and never abort the batch.
+
+    Returns:
+        A compact summary: totals plus one ``{"i", "ok", "id"|"error"}``
+        entry per payload, in input order.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def run_one(i: int, payload: dict) -> dict:
+        payload = {k: v for k, v in payload.items() if v is not None}
+        missing = [key for key in required if key not in payload]
+        if missing:
+            return {"i": i, "ok": False, "error": f"missing {', '.join(missing)}"}
+        async with semaphore:
+            try:
+                result = await func(payload)
+            except Exception as e:
+                logger.warning("Bulk item %d failed: %s", i, e)
+                return {"i": i, "ok": False, "error": str(e)}
+        item: dict[str, Any] = {"i": i, "ok": True}
+        eid = episode_id(result) if isinstance(result, dict) else None
+        if eid is None:
+            eid = episode_id(payload)
+        if eid is not None:
+            item["id"] = eid
+        return item
+
+    items = await asyncio.gather(*(run_one(i, p) for i, p in enumerate(payloads)))
+    succeeded = sum(1 for item in items if item["ok"])
+    return {
+        "total": len(items),
+        "succeeded": succeeded,
+        "failed": len(items) - succeeded,
+        "items": items,
+    }
@@ -0,0 +1,122 @@
+"""PodHome MCP Server - Response Cache Module."""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body plus the validators needed to revalidate it."""
+
+    value: Any
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class ResponseCache:
+    """Size-bounded LRU cache with a TTL and HTTP revalidation support.
+
+    Entries older than ``ttl`` are not discarded straight away: they are kept
+    so that their ``ETag``/``Last-Modified`` validators can be sent with the
+    next request, and refreshed in place when the server answers 304.
+    Cached values are shared with callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is served without contacting the API
+            max_entries: Maximum number of entries before LRU eviction
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def lookup(
+        self, key: Hashable, max_age: float | None = None
+    ) -> tuple[CacheEntry | None, bool]:
+        """Return ``(entry, fresh)`` for a key and update the hit/miss counters.
+
+        A stale entry is still returned so its validators can be reused.
+        ``max_age`` tightens the TTL for this lookup only.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None, False
+        self._entries.move_to_end(key)
+        age = self._clock() - entry.stored_at
+        if age < self.ttl and (max_age is None or age <= max_age):
+            self.hits += 1
+            return entry, True
+        self.misses += 1
+        return entry, False
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        age: float = 0.0,
+    ) -> None:
+        """Store a value, evicting the least recently used entries if full.
+
+        ``age`` backdates the entry, e.g. for a value read from a slower cache.
+        """
+        self._entries[key] = CacheEntry(value, self._clock() - age, etag, last_modified)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def revalidated(self, key: Hashable) -> Any:
+        """Mark an entry as confirmed unchanged (HTTP 304) and return its value."""
+        entry = self._entries[key]
+        entry.stored_at = self._clock()
+        self.not_modified += 1
+        return entry.value
+
+    def discard(self, key: Hashable) -> None:
+        """Drop a single entry if present."""
+        if self._entries.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. after a write that changes the episode list."""
+        if self._entries:
+            self.invalidations += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss counters and current size."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
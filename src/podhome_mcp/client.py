@@ -1,27 +1,301 @@
 """PodHome MCP Server - HTTP Client Module."""
 
+import asyncio
+import hashlib
+import importlib.util
+import logging
+import os
+import time
+from contextlib import asynccontextmanager, nullcontext
+from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator
+
 import httpx
 
+from .cache import CacheEntry, ResponseCache
+from .codec import ACCEPT_ENCODING, encode_body, loads
+from .config import Config
+from .images import CoverImage, image_body
+from .index import EpisodeIndex
+from .jobs import EpisodeTracker
+from .jsonstream import iter_json_array
+from .metrics import Metrics, current_tool
+from .profiling import Profiler, phase
+from .resilience import (
+    RETRYABLE_STATUS,
+    SERVER_ERROR_STATUS,
+    CircuitBreaker,
+    RetryPolicy,
+    TokenBucket,
+    parse_retry_after,
+)
+from .singleflight import SingleFlight
+from .storage import MediaStorage
+from .store import EpisodeStore
+from .sync import EpisodeSync
+from .transcripts import TranscriptIndex
+from .webhooks import EventLog, WebhookReceiver
+
+if TYPE_CHECKING:
+    from .warmup import WarmupScheduler
+
+logger = logging.getLogger(__name__)
+
+# Episode cache key of the webhook list (episode keys are 5-tuples of filters)
+_HOOKS_KEY = ("hooks",)
+
+
+def http2_available() -> bool:
+    """Return True if the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _episode_params(
+    status: int | None,
+    include_transcript: bool | None,
+    include_chapters: bool | None,
+    include_downloads: bool | None,
+    include_people: bool | None,
+) -> dict:
+    """Build the query parameters for ``/api/episodes``."""
+    params: dict = {}
+    if status is not None:
+        params["status"] = status
+    if include_transcript is not None:
+        params["includeTranscript"] = include_transcript
+    if include_chapters is not None:
+        params["includeChapters"] = include_chapters
+    if include_downloads is not None:
+        params["includeDownloads"] = include_downloads
+    if include_people is not None:
+        params["includePeople"] = include_people
+    return params
+
 
 class PodhomeClient:
     """Async HTTP client for the PodHome Integration API."""
 
-    def __init__(self, api_key: str, base_url: str):
-        """Initialize the client with API key and base URL."""
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        *,
+        name: str | None = None,
+        timeout: float = 60.0,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        cache: ResponseCache | None = None,
+        hooks_cache: ResponseCache | None = None,
+        limiter: TokenBucket | None = None,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+        metrics: Metrics | None = None,
+        max_inflight: int | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+        store: EpisodeStore | None = None,
+        compress_min_bytes: int | None = None,
+    ):
+        """Initialize the client with API key and base URL.
+
+        Args:
+            api_key: Show API key sent as ``X-API-KEY``
+            base_url: Podhome API base URL
+            name: Show slug this client was created for (used in logs)
+            timeout: Request timeout in seconds
+            limits: Connection pool limits; httpx defaults when omitted
+            http2: Negotiate HTTP/2 if the ``h2`` package is installed
+            cache: Optional cache for ``list_episodes`` responses
+            hooks_cache: Optional cache for the ``list_webhooks`` response
+            limiter: Optional rate limiter applied to every request
+            retry: Optional retry policy for idempotent GET requests
+            breaker: Optional circuit breaker that fails fast while the API is down
+            metrics: Optional metrics registry for request timings and counters
+            max_inflight: Maximum concurrent requests to the API (unbounded if None)
+            transport: Custom httpx transport, e.g. an ASGI app for testing
+            store: Optional on-disk store backing the episode cache across restarts
+            compress_min_bytes: Gzip JSON request bodies at least this large (never if None)
+        """
+        self.name = name
+        self.cache = cache
+        self.hooks_cache = hooks_cache
+        self.limiter = limiter
+        self.retry = retry
+        self.breaker = breaker
+        self.metrics = metrics
+        self.store = store
+        self.compress_min_bytes = compress_min_bytes
+        # Stored rows are keyed by a digest so the API key never hits the disk
+        self._store_id = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        self._slots = asyncio.Semaphore(max_inflight) if max_inflight else None
+        self.inflight = SingleFlight()
+        self._generation = 0
+        self._hooks_generation = 0
+        # Requests made by tool calls that are queued or on the wire; the
+        # warm-up scheduler holds back while this is non-zero
+        self.foreground = 0
         self._client = httpx.AsyncClient(
             base_url=base_url,
-            headers={"X-API-KEY": api_key},
-            timeout=60.0,
+            headers={"X-API-KEY": api_key, "Accept-Encoding": ACCEPT_ENCODING},
+            timeout=timeout,
             follow_redirects=True,
+            limits=limits or httpx.Limits(),
+            http2=http2 and http2_available(),
+            transport=transport,
         )
 
+    # ========== Transport ==========
+
+    async def _send(
+        self, method: str, url: str, *, idempotent: bool = False, **kwargs
+    ) -> httpx.Response:
+        """Send a request through the rate limiter, circuit breaker and retries.
+
+        Only idempotent requests are retried, on transport errors and on
+        429/5xx responses, using exponential backoff with jitter and
+        honouring ``Retry-After``. The final response is returned unchecked.
+        """
+        foreground = current_tool.get() is not None
+        if foreground:
+            self.foreground += 1
+        try:
+            return await self._send_attempts(method, url, idempotent, **kwargs)
+        finally:
+            if foreground:
+                self.foreground -= 1
+
+    async def _send_attempts(
+        self, method: str, url: str, idempotent: bool, **kwargs
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            await self._admit()
+            start = time.perf_counter()
+            try:
+                r = await self._dispatch(method, url, **kwargs)
+            except httpx.TransportError as e:
+                self._observe(method, url, start, None)
+                self._record(None)
+                delay = self.retry.delay(attempt) if idempotent and self.retry else None
+                if delay is None:
+                    raise
+                logger.info("%s %s failed (%s); retrying in %.2fs", method, url, e, delay)
+            else:
+                self._observe(method, url, start, r)
+                retry_after = self._record(r)
+                if not (idempotent and self.retry and r.status_code in RETRYABLE_STATUS):
+                    return r
+                delay = self.retry.delay(attempt, retry_after)
+                if delay is None:
+                    return r
+                logger.info(
+                    "%s %s returned %s; retrying in %.2fs", method, url, r.status_code, delay
+                )
+            attempt += 1
+            if self.metrics is not None:
+                self.metrics.inc(
+                    "podhome_http_retries_total",
+                    show=self.name,
+                    endpoint=f"{method} {url}",
+                    tool=current_tool.get(),
+                )
+            await asyncio.sleep(delay)
+
+    def _body(self, payload: dict) -> dict:
+        """Return request arguments for a JSON body, gzipped if it is large."""
+        return encode_body(payload, self.compress_min_bytes)
+
+    def _slot(self):
+        """Return a context manager holding one of the client's in-flight slots."""
+        return self._slots if self._slots is not None else nullcontext()
+
+    async def _dispatch(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Issue a single request on the pooled httpx client."""
+        with phase("http"):
+            return await self._dispatch_once(method, url, **kwargs)
+
+    async def _dispatch_once(self, method: str, url: str, **kwargs) -> httpx.Response:
+        async with self._slot():
+            if method == "GET":
+                return await self._client.get(url, **kwargs)
+            if method == "POST":
+                return await self._client.post(url, **kwargs)
+            return await self._client.request(method, url, **kwargs)
+
+    def _observe(
+        self, method: str, url: str, start: float, r: httpx.Response | None
+    ) -> None:
+        """Record latency, status and transferred bytes for one HTTP attempt."""
+        if self.metrics is None:
+            return
+        labels: dict[str, Any] = {
+            "show": self.name,
+            "endpoint": f"{method} {url}",
+            "tool": current_tool.get(),
+        }
+        self.metrics.observe(
+            "podhome_http_request_duration_seconds", time.perf_counter() - start, **labels
+        )
+        self.metrics.inc(
+            "podhome_http_requests_total",
+            status="error" if r is None else r.status_code,
+            **labels,
+        )
+        if r is not None:
+            self.metrics.inc(
+                "podhome_http_response_bytes_total", r.num_bytes_downloaded, **labels
+            )
+            sent = r.request.headers.get("Content-Length")
+            if sent:
+                self.metrics.inc("podhome_http_request_bytes_total", int(sent), **labels)
+
+    def _count_cache(self, result: str) -> None:
+        """Count an episode cache lookup outcome (hit, miss or not_modified)."""
+        if self.metrics is not None:
+            self.metrics.inc(
+                "podhome_cache_requests_total",
+                show=self.name,
+                tool=current_tool.get(),
+                result=result,
+            )
+
+    async def _admit(self):
+        """Wait for the rate limiter; raise CircuitOpenError if the API is down."""
+        if self.breaker is not None:
+            self.breaker.check()
+        if self.limiter is not None:
+            await self.limiter.acquire()
+
+    def _record(self, r: httpx.Response | None) -> float | None:
+        """Feed a response (None for a transport error) to the breaker and limiter.
+
+        Returns:
+            The ``Retry-After`` delay in seconds, if the response carried one.
+        """
+        failed = r is None or r.status_code in SERVER_ERROR_STATUS
+        if self.breaker is not None:
+            if failed:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+        if r is None:
+            return None
+        retry_after = None
+        if r.status_code in RETRYABLE_STATUS:
+            retry_after = parse_retry_after(r.headers.get("Retry-After"))
+        if self.limiter is not None:
+            if r.status_code == 429:
+                self.limiter.on_throttle(retry_after)
+            elif not failed:
+                self.limiter.on_success()
+        return retry_after
+
     # ========== Episodes ==========
 
     async def create_episode(self, payload: dict) -> dict:
         """Create a new episode."""
-        r = await self._client.post("/api/createepisode", json=payload)
+        r = await self._send("POST", "/api/createepisode", **self._body(payload))
+        self.invalidate_episodes()
         r.raise_for_status()
-        return r.json()
+        return loads(r.content)
 
     async def list_episodes(
         self,
@@ -30,72 +304,488 @@ class PodhomeClient:
         include_chapters: bool | None = None,
         include_downloads: bool | None = None,
         include_people: bool | None = None,
+        max_age: float | None = None,
+    ) -> list:
+        """List episodes with optional filters.
+
+        Responses are served from the episode cache while fresh and
+        revalidated with ``If-None-Match``/``If-Modified-Since`` once stale.
+        ``max_age`` treats cached responses older than that many seconds as
+        stale; ``0`` always asks the API, which answers 304 if nothing changed.
+        """
+        key = (
+            status,
+            include_transcript,
+            include_chapters,
+            include_downloads,
+            include_people,
+        )
+        entry, fresh = (
+            self.cache.lookup(key, max_age) if self.cache is not None else (None, False)
+        )
+        if entry is not None and fresh:
+            self._count_cache("hit")
+            return entry.value
+        if self.cache is not None:
+            self._count_cache("miss")
+        # Reads started after a write must not join a read started before it
+        return await self.inflight.do(
+            ("episodes", self._generation, key),
+            lambda: self._fetch_episodes(key, entry, max_age),
+        )
+
+    async def _fetch_episodes(
+        self, key: tuple, entry: CacheEntry | None, max_age: float | None = None
     ) -> list:
-        """List episodes with optional filters."""
-        params = {}
-        if status is not None:
-            params["status"] = status
-        if include_transcript is not None:
-            params["includeTranscript"] = include_transcript
-        if include_chapters is not None:
-            params["includeChapters"] = include_chapters
-        if include_downloads is not None:
-            params["includeDownloads"] = include_downloads
-        if include_people is not None:
-            params["includePeople"] = include_people
-
-        r = await self._client.get("/api/episodes", params=params if params else None)
+        """Fetch ``/api/episodes`` for a filter key, revalidating ``entry`` if given.
+
+        The on-disk store is consulted first, since another process may have
+        fetched the list more recently; a fresh stored response is returned
+        without contacting the API.
+        """
+        generation = self._generation
+        if self.store is not None:
+            stored, fresh = await self.store.get(self._store_id, key)
+            if stored is not None:
+                if max_age is not None and stored.age() > max_age:
+                    fresh = False
+                if fresh and generation == self._generation:
+                    self._count_cache("store_hit")
+                    if self.cache is not None:
+                        self.cache.put(
+                            key,
+                            stored.value,
+                            etag=stored.etag,
+                            last_modified=stored.last_modified,
+                            age=stored.age(),
+                        )
+                    return stored.value
+                if entry is None:
+                    entry = CacheEntry(
+                        stored.value, stored.fetched_at, stored.etag, stored.last_modified
+                    )
+        params = _episode_params(*key)
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        r = await self._send(
+            "GET",
+            "/api/episodes",
+            idempotent=True,
+            params=params if params else None,
+            headers=headers if headers else None,
+        )
+        if entry is not None and r.status_code == 304:
+            self._count_cache("not_modified")
+            if self.cache is not None and key in self.cache:
+                result = self.cache.revalidated(key)
+            else:
+                result = entry.value
+                if self.cache is not None and generation == self._generation:
+                    self.cache.put(key, result, entry.etag, entry.last_modified)
+            if self.store is not None and generation == self._generation:
+                self.store.touch(self._store_id, key)
+            return result
         r.raise_for_status()
-        return r.json()
+        result = loads(r.content)
+        # Don't cache a response that may predate a write made meanwhile
+        if generation == self._generation:
+            etag = r.headers.get("ETag")
+            last_modified = r.headers.get("Last-Modified")
+            if self.cache is not None:
+                self.cache.put(key, result, etag=etag, last_modified=last_modified)
+            if self.store is not None:
+                await self.store.put(self._store_id, key, r.content, etag, last_modified)
+        return result
+
+    async def iter_episodes(
+        self,
+        status: int | None = None,
+        include_transcript: bool | None = None,
+        include_chapters: bool | None = None,
+        include_downloads: bool | None = None,
+        include_people: bool | None = None,
+    ) -> AsyncGenerator[dict, None]:
+        """Stream episodes one at a time without buffering the whole response.
+
+        Intended for large responses (e.g. with transcripts); bypasses the
+        episode cache. Transient failures are retried as for ``list_episodes``
+        until the first episode arrives. Closing the iterator early aborts
+        the download.
+        """
+        params = _episode_params(
+            status,
+            include_transcript,
+            include_chapters,
+            include_downloads,
+            include_people,
+        )
+        foreground = current_tool.get() is not None
+        if foreground:
+            self.foreground += 1
+        try:
+            # Includes incremental parsing and the consumer's time between items
+            with phase("stream"):
+                async with self._open_stream("/api/episodes", params or None) as r:
+                    r.raise_for_status()
+                    async for episode in iter_json_array(r.aiter_bytes()):
+                        yield episode
+        finally:
+            if foreground:
+                self.foreground -= 1
+
+    @asynccontextmanager
+    async def _open_stream(
+        self, url: str, params: dict | None
+    ) -> AsyncIterator[httpx.Response]:
+        """Send a streamed GET, retrying like ``_send`` until the response headers settle it.
+
+        Retries happen before any of the body is read, on transport errors
+        and 429/5xx responses, honouring ``Retry-After``. An in-flight slot
+        is held for each attempt but not during back-off, and for the final
+        response until the block exits. That attempt is recorded once, on
+        exit, as a transport error if reading the body failed.
+
+        Yields:
+            The open response, successful or the final error.
+        """
+        attempt = 0
+        while True:
+            await self._admit()
+            async with self._slot():
+                start = time.perf_counter()
+                request = self._client.build_request("GET", url, params=params)
+                try:
+                    r = await self._client.send(request, stream=True)
+                except httpx.TransportError as e:
+                    self._observe("GET", url, start, None)
+                    self._record(None)
+                    delay = self.retry.delay(attempt) if self.retry else None
+                    if delay is None:
+                        raise
+                    logger.info("GET %s failed (%s); retrying in %.2fs", url, e, delay)
+                else:
+                    delay = None
+                    if self.retry and r.status_code in RETRYABLE_STATUS:
+                        retry_after = parse_retry_after(r.headers.get("Retry-After"))
+                        delay = self.retry.delay(attempt, retry_after)
+                    if delay is None:
+                        failed = False
+                        try:
+                            yield r
+                        except httpx.TransportError:
+                            failed = True
+                            raise
+                        finally:
+                            await r.aclose()
+                            self._observe("GET", url, start, None if failed else r)
+                            self._record(None if failed else r)
+                        return
+                    self._observe("GET", url, start, r)
+                    self._record(r)
+                    await r.aclose()
+                    logger.info(
+                        "GET %s returned %s; retrying in %.2fs", url, r.status_code, delay
+                    )
+            attempt += 1
+            if self.metrics is not None:
+                self.metrics.inc(
+                    "podhome_http_retries_total",
+                    show=self.name,
+                    endpoint=f"GET {url}",
+                    tool=current_tool.get(),
+                )
+            await asyncio.sleep(delay)
 
     async def schedule_episode(self, payload: dict) -> dict:
         """Schedule or publish an episode."""
-        r = await self._client.post("/api/schedule_episode", json=payload)
+        r = await self._send("POST", "/api/schedule_episode", **self._body(payload))
+        self.invalidate_episodes()
         r.raise_for_status()
-        return r.json()
+        return loads(r.content)
+
+    async def modify_episode(self, payload: dict, image: CoverImage | None = None) -> dict:
+        """Modify an episode's metadata.
 
-    async def modify_episode(self, payload: dict) -> dict:
-        """Modify an episode's metadata."""
-        r = await self._client.post("/api/modify_episode", json=payload)
+        ``image`` is streamed into the body as ``image_data`` without
+        building the base64 text in memory.
+        """
+        body = image_body(payload, image) if image is not None else self._body(payload)
+        r = await self._send("POST", "/api/modify_episode", **body)
+        self.invalidate_episodes()
         r.raise_for_status()
-        return r.json()
+        return loads(r.content)
+
+    def invalidate_episodes(self):
+        """Drop cached episode lists after a write that may have changed them."""
+        self._generation += 1
+        if self.cache is not None:
+            self.cache.clear()
+        if self.store is not None:
+            self.store.clear(self._store_id)
+
+    @property
+    def generation(self) -> int:
+        """Count of episode list invalidations, to tell whether derived data is current."""
+        return self._generation
 
     # ========== Clips ==========
 
     async def create_clip(self, payload: dict) -> dict:
         """Create a clip (soundbite) from an episode."""
-        r = await self._client.post("/api/createclip", json=payload)
+        r = await self._send("POST", "/api/createclip", **self._body(payload))
         r.raise_for_status()
-        return r.json()
+        return loads(r.content)
 
     # ========== Webhooks ==========
 
-    async def list_webhooks(self) -> list:
-        """List all registered webhooks."""
-        r = await self._client.get("/api/hook")
+    async def list_webhooks(self, max_age: float | None = None) -> list:
+        """List all registered webhooks.
+
+        Served from the cache while fresh, like ``list_episodes`` (including
+        ``max_age``); registering or deleting a webhook drops the cached
+        list. Concurrent calls share a single in-flight request.
+        """
+        if self.hooks_cache is not None:
+            entry, fresh = self.hooks_cache.lookup(_HOOKS_KEY, max_age)
+            if entry is not None and fresh:
+                return entry.value
+        return await self.inflight.do(("hooks", self._hooks_generation), self._fetch_webhooks)
+
+    async def _fetch_webhooks(self) -> list:
+        generation = self._hooks_generation
+        r = await self._send("GET", "/api/hook", idempotent=True)
         r.raise_for_status()
-        return r.json()
+        result = loads(r.content)
+        if self.hooks_cache is not None and generation == self._hooks_generation:
+            self.hooks_cache.put(_HOOKS_KEY, result)
+        return result
 
     async def register_webhook(self, payload: dict) -> dict:
         """Register a new webhook."""
-        r = await self._client.post("/api/hook", json=payload)
+        r = await self._send("POST", "/api/hook", **self._body(payload))
+        self.invalidate_webhooks()
         r.raise_for_status()
-        return r.json()
+        return loads(r.content)
 
     async def delete_webhook(self, payload: dict) -> dict:
         """Delete a webhook."""
-        r = await self._client.request("DELETE", "/api/hook", json=payload)
+        r = await self._send("DELETE", "/api/hook", **self._body(payload))
+        self.invalidate_webhooks()
         r.raise_for_status()
-        return r.json()
+        return loads(r.content)
+
+    def invalidate_webhooks(self):
+        """Drop the cached webhook list after registering or deleting one."""
+        self._hooks_generation += 1
+        if self.hooks_cache is not None:
+            self.hooks_cache.discard(_HOOKS_KEY)
 
     async def test_webhook(self, payload: dict | None = None) -> dict:
         """Test webhooks."""
-        r = await self._client.post(
-            "/api/hooktest", json=payload if payload else {}
-        )
+        r = await self._send("POST", "/api/hooktest", **self._body(payload if payload else {}))
         r.raise_for_status()
-        return r.json()
+        return loads(r.content)
 
     async def aclose(self):
         """Close the HTTP client."""
         await self._client.aclose()
+
+
+class ClientRegistry:
+    """Long-lived PodhomeClient instances shared across tool calls.
+
+    Clients are created on first use and kept warm so that consecutive tool
+    calls reuse pooled keep-alive connections instead of paying a fresh
+    connect and TLS handshake each time. Shows that share an API key share
+    a single client.
+    """
+
+    def __init__(
+        self, config: Config, transport: httpx.AsyncBaseTransport | None = None
+    ):
+        """Initialize an empty registry for the given configuration.
+
+        ``transport`` is passed to every client; it is meant for tests and
+        benchmarks that run against a local stand-in for the API.
+        """
+        self._config = config
+        self._transport = transport
+        self._clients: dict[str, PodhomeClient] = {}
+        self._indexes: dict[str, EpisodeIndex] = {}
+        self._transcripts: dict[str, TranscriptIndex] = {}
+        self._trackers: dict[str, EpisodeTracker] = {}
+        self._syncs: dict[str, EpisodeSync] = {}
+        # Key-less client for transcript files, which are not served by the API
+        self._files: httpx.AsyncClient | None = None
+        self.metrics = Metrics()
+        self.profiler = Profiler(
+            os.path.expanduser(config.profile_dir) if config.profile_dir else None,
+            threshold=config.profile_threshold,
+            interval=config.profile_interval,
+        )
+        self.events = EventLog(config.webhook_max_events)
+        # Set by the server while the embedded webhook receiver is running
+        self.receiver: WebhookReceiver | None = None
+        # Set by the server while the background warm-up scheduler is running
+        self.warmup: "WarmupScheduler | None" = None
+        self._storage: MediaStorage | None = None
+        self.store = (
+            EpisodeStore(
+                os.path.join(os.path.expanduser(config.cache_dir), "episodes.sqlite3"),
+                ttl=config.cache_ttl,
+                max_age=config.store_max_age,
+                flush_interval=config.store_flush_interval,
+            )
+            if config.cache_dir
+            else None
+        )
+
+    def get(self, show: str) -> PodhomeClient:
+        """Return the client for a show, creating it on first use."""
+        api_key = self._config.get_api_key(show)
+        client = self._clients.get(api_key)
+        if client is None:
+            cfg = self._config
+            client = PodhomeClient(
+                api_key,
+                cfg.base_url,
+                name=show,
+                timeout=cfg.timeout,
+                limits=httpx.Limits(
+                    max_connections=cfg.max_connections,
+                    max_keepalive_connections=cfg.max_keepalive_connections,
+                    keepalive_expiry=cfg.keepalive_expiry,
+                ),
+                http2=cfg.http2,
+                cache=(
+                    ResponseCache(cfg.cache_ttl, cfg.cache_max_entries)
+                    if cfg.cache_ttl > 0
+                    else None
+                ),
+                hooks_cache=ResponseCache(cfg.cache_ttl, 1) if cfg.cache_ttl > 0 else None,
+                limiter=(
+                    TokenBucket(cfg.rate_limit, cfg.rate_burst)
+                    if cfg.rate_limit > 0
+                    else None
+                ),
+                retry=RetryPolicy(
+                    cfg.max_retries + 1, cfg.retry_base_delay, cfg.retry_max_delay
+                ),
+                breaker=CircuitBreaker(
+                    cfg.circuit_failure_threshold, cfg.circuit_reset_timeout
+                ),
+                metrics=self.metrics,
+                max_inflight=cfg.max_inflight_per_show or None,
+                transport=self._transport,
+                store=self.store,
+                compress_min_bytes=cfg.compress_min_bytes if cfg.compress_requests else None,
+            )
+            self._clients[api_key] = client
+            logger.debug("Created Podhome client for %s", show)
+        return client
+
+    def index(self, show: str) -> EpisodeIndex:
+        """Return the episode index for a show, creating it on first use.
+
+        Call ``await index.refresh()`` before reading to pick up new data.
+        """
+        api_key = self._config.get_api_key(show)
+        index = self._indexes.get(api_key)
+        if index is None:
+            index = self._indexes[api_key] = EpisodeIndex(self.get(show))
+        return index
+
+    def sync(self, show: str) -> EpisodeSync:
+        """Return the delta-sync state for a show, creating it on first use."""
+        api_key = self._config.get_api_key(show)
+        sync = self._syncs.get(api_key)
+        if sync is None:
+            sync = self._syncs[api_key] = EpisodeSync(
+                self.get(show), self._config.sync_max_snapshots
+            )
+        return sync
+
+    def tracker(self, show: str) -> EpisodeTracker:
+        """Return the episode job tracker for a show, creating it on first use."""
+        api_key = self._config.get_api_key(show)
+        tracker = self._trackers.get(api_key)
+        if tracker is None:
+            tracker = self._trackers[api_key] = EpisodeTracker(
+                self.get(show),
+                base_delay=self._config.poll_base_delay,
+                max_delay=self._config.poll_max_delay,
+            )
+        return tracker
+
+    def transcripts(self, show: str) -> TranscriptIndex:
+        """Return the transcript search index for a show, creating it on first use.
+
+        Call ``await index.refresh()`` before searching to pick up new episodes.
+        """
+        api_key = self._config.get_api_key(show)
+        index = self._transcripts.get(api_key)
+        if index is None:
+            if self._files is None:
+                self._files = httpx.AsyncClient(
+                    timeout=self._config.timeout,
+                    follow_redirects=True,
+                    transport=self._transport,
+                )
+            index = self._transcripts[api_key] = TranscriptIndex(
+                self.get(show),
+                self._files,
+                fetch_concurrency=self._config.transcript_fetch_concurrency,
+                ttl=self._config.cache_ttl,
+            )
+        return index
+
+    def storage(self) -> MediaStorage:
+        """Return the S3/R2 media storage, creating it on first use.
+
+        Raises:
+            ValueError: If storage is not configured.
+        """
+        if self._storage is None:
+            self._storage = MediaStorage.from_config(self._config, self.metrics)
+        return self._storage
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Return episode cache and request coalescing counters keyed by show slug."""
+        return {
+            client.name or "?": {
+                **(client.cache.stats() if client.cache is not None else {}),
+                "coalesced": client.inflight.coalesced,
+            }
+            for client in self._clients.values()
+        }
+
+    async def aclose(self):
+        """Close every client held by the registry."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        self._indexes.clear()
+        self._transcripts.clear()
+        self._syncs.clear()
+        trackers = list(self._trackers.values())
+        self._trackers.clear()
+        for tracker in trackers:
+            await tracker.aclose()
+        if self._files is not None:
+            await self._files.aclose()
+            self._files = None
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("Failed to close client for %s: %s", client.name, e)
+        if self.store is not None:
+            try:
+                await self.store.aclose()
+            except Exception as e:
+                logger.warning("Failed to close episode store: %s", e)
+            self.store = None
@@ -0,0 +1,82 @@
+"""PodHome MCP Server - JSON Codec and Compression Module."""
+
+import gzip
+import importlib.util
+import json
+from typing import Any
+
+from .profiling import phase
+
+try:
+    import orjson
+except ImportError:  # optional: podhome-mcp[speedups]
+    orjson = None  # type: ignore[assignment]
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def orjson_available() -> bool:
+    """Return True if the optional ``orjson`` package is installed."""
+    return orjson is not None
+
+
+def accepted_encodings() -> list[str]:
+    """Return the response encodings httpx can decode here, best first.
+
+    ``zstd`` needs the ``zstandard`` package and ``br`` needs ``brotli`` (or
+    ``brotlicffi``); ``gzip`` and ``deflate`` are always available.
+    """
+    encodings = []
+    if importlib.util.find_spec("zstandard") is not None:
+        encodings.append("zstd")
+    if any(importlib.util.find_spec(m) is not None for m in ("brotli", "brotlicffi")):
+        encodings.append("br")
+    return [*encodings, "gzip", "deflate"]
+
+
+ACCEPT_ENCODING = ", ".join(accepted_encodings())
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON, using orjson when it is installed.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON.
+    """
+    with phase("decode"):
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+
+
+def dumps(value: Any, sort_keys: bool = False) -> bytes:
+    """Encode a value as compact UTF-8 JSON; unknown types are encoded with ``str``."""
+    if orjson is not None:
+        options = _ORJSON_OPTIONS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(value, default=str, option=options)
+        except TypeError:
+            # e.g. integers wider than 64 bits, which only the stdlib handles
+            pass
+    return json.dumps(
+        value, separators=(",", ":"), ensure_ascii=False, default=str, sort_keys=sort_keys
+    ).encode()
+
+
+def dumps_str(value: Any) -> str:
+    """Encode a value as compact JSON text."""
+    return dumps(value).decode()
+
+
+def encode_body(payload: Any, compress_min_bytes: int | None = None) -> dict[str, Any]:
+    """Return httpx request arguments sending ``payload`` as a JSON body.
+
+    Bodies of at least ``compress_min_bytes`` (never, if None) are gzipped
+    and sent with ``Content-Encoding: gzip``.
+    """
+    body = dumps(payload)
+    headers = {"Content-Type": "application/json"}
+    if compress_min_bytes is not None and len(body) >= compress_min_bytes:
+        body = gzip.compress(body, compresslevel=6, mtime=0)
+        headers["Content-Encoding"] = "gzip"
+    return {"content": body, "headers": headers}
@@ -2,7 +2,8 @@
 
 import json
 import logging
-from typing import Dict
+import os
+from typing import Dict, Literal
 
 from pydantic import Field, SecretStr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -18,6 +19,121 @@ class Config(BaseSettings):
         ..., description="show_slug -> API key mapping", alias="PODHOME_SHOWS"
     )
 
+    # Server transport; "http" and "sse" serve many MCP clients from one process
+    transport: Literal["stdio", "http", "sse"] = Field("stdio", alias="PODHOME_TRANSPORT")
+    host: str = Field("127.0.0.1", alias="PODHOME_HOST")
+    port: int = Field(8000, alias="PODHOME_PORT")
+    shutdown_timeout: float = Field(30.0, alias="PODHOME_SHUTDOWN_TIMEOUT")
+
+    # HTTP connection pool settings shared by every show's client
+    timeout: float = Field(60.0, alias="PODHOME_TIMEOUT")
+    max_connections: int = Field(20, alias="PODHOME_MAX_CONNECTIONS")
+    max_keepalive_connections: int = Field(10, alias="PODHOME_MAX_KEEPALIVE_CONNECTIONS")
+    keepalive_expiry: float = Field(60.0, alias="PODHOME_KEEPALIVE_EXPIRY")
+    http2: bool = Field(True, alias="PODHOME_HTTP2")
+    # Upper bound on concurrent upstream requests per show (0 = unbounded)
+    max_inflight_per_show: int = Field(16, alias="PODHOME_MAX_INFLIGHT_PER_SHOW")
+
+    # Client-side rate limit per API key (requests/second; 0 disables)
+    rate_limit: float = Field(10.0, alias="PODHOME_RATE_LIMIT")
+    rate_burst: int = Field(20, alias="PODHOME_RATE_BURST")
+
+    # Retries for idempotent GET requests and the circuit breaker
+    max_retries: int = Field(3, alias="PODHOME_MAX_RETRIES")
+    retry_base_delay: float = Field(0.5, alias="PODHOME_RETRY_BASE_DELAY")
+    retry_max_delay: float = Field(30.0, alias="PODHOME_RETRY_MAX_DELAY")
+    circuit_failure_threshold: int = Field(5, alias="PODHOME_CIRCUIT_FAILURE_THRESHOLD")
+    circuit_reset_timeout: float = Field(30.0, alias="PODHOME_CIRCUIT_RESET_TIMEOUT")
+
+    # list_episodes response cache (a TTL of 0 disables caching)
+    cache_ttl: float = Field(60.0, alias="PODHOME_CACHE_TTL")
+    cache_max_entries: int = Field(32, alias="PODHOME_CACHE_MAX_ENTRIES")
+
+    # Background warm-up: prefetch every show's episode and webhook lists at
+    # startup and keep them fresh; the refresh interval adapts between the
+    # bounds (the maximum defaults to 90% of cache_ttl so calls hit the cache).
+    # Unset means on for http/sse only: a stdio session is usually too short
+    # for the prefetch to pay for its requests
+    warmup: bool | None = Field(None, alias="PODHOME_WARMUP")
+    warmup_min_interval: float = Field(10.0, alias="PODHOME_WARMUP_MIN_INTERVAL")
+    warmup_max_interval: float | None = Field(None, alias="PODHOME_WARMUP_MAX_INTERVAL")
+    warmup_concurrency: int = Field(2, alias="PODHOME_WARMUP_CONCURRENCY")
+
+    # Cover images passed by local path are downscaled and recompressed to
+    # JPEG when larger than this (JPEG/PNG within limits are sent as is)
+    image_max_dimension: int = Field(3000, alias="PODHOME_IMAGE_MAX_DIMENSION")
+    image_max_bytes: int = Field(1024 * 1024, alias="PODHOME_IMAGE_MAX_BYTES")
+    image_quality: int = Field(85, alias="PODHOME_IMAGE_QUALITY")
+
+    # Gzip JSON request bodies (e.g. modify_episode with image_data) of at
+    # least compress_min_bytes; off by default as the API must accept it
+    compress_requests: bool = Field(False, alias="PODHOME_COMPRESS_REQUESTS")
+    compress_min_bytes: int = Field(64 * 1024, alias="PODHOME_COMPRESS_MIN_BYTES")
+
+    # Optional on-disk episode store shared across restarts and processes
+    cache_dir: str | None = Field(None, alias="PODHOME_CACHE_DIR")
+    store_max_age: float = Field(86400.0, alias="PODHOME_STORE_MAX_AGE")
+    store_flush_interval: float = Field(0.5, alias="PODHOME_STORE_FLUSH_INTERVAL")
+
+    # sync_episodes snapshots (content hashes only) kept per show
+    sync_max_snapshots: int = Field(32, alias="PODHOME_SYNC_MAX_SNAPSHOTS")
+
+    # Default page size for streamed list_episodes output
+    list_page_size: int = Field(50, alias="PODHOME_LIST_PAGE_SIZE")
+
+    # Concurrent downloads of transcript files for search_transcripts
+    transcript_fetch_concurrency: int = Field(8, alias="PODHOME_TRANSCRIPT_FETCH_CONCURRENCY")
+
+    # Default number of concurrent requests per bulk tool call
+    bulk_concurrency: int = Field(8, alias="PODHOME_BULK_CONCURRENCY")
+
+    # Tool output budget: long strings are truncated and lists cut short
+    output_max_bytes: int = Field(100_000, alias="PODHOME_OUTPUT_MAX_BYTES")
+    output_max_field_chars: int = Field(2000, alias="PODHOME_OUTPUT_MAX_FIELD_CHARS")
+
+    # Optional Prometheus text dump, rewritten every metrics_interval seconds
+    metrics_file: str | None = Field(None, alias="PODHOME_METRICS_FILE")
+    metrics_interval: float = Field(15.0, alias="PODHOME_METRICS_INTERVAL")
+
+    # Per-show timeout in seconds for tools queried across several shows
+    fanout_timeout: float = Field(30.0, alias="PODHOME_FANOUT_TIMEOUT")
+
+    # wait_for_episode polling: exponential backoff with jitter between polls
+    poll_base_delay: float = Field(2.0, alias="PODHOME_POLL_BASE_DELAY")
+    poll_max_delay: float = Field(30.0, alias="PODHOME_POLL_MAX_DELAY")
+    episode_wait_timeout: float = Field(600.0, alias="PODHOME_EPISODE_WAIT_TIMEOUT")
+
+    # Opt-in profiling: with a threshold set, every tool call is sampled and
+    # calls taking at least that many seconds are written to profile_dir
+    profile_threshold: float | None = Field(None, alias="PODHOME_PROFILE_THRESHOLD")
+    profile_dir: str | None = Field(None, alias="PODHOME_PROFILE_DIR")
+    profile_interval: float = Field(0.005, alias="PODHOME_PROFILE_INTERVAL")
+
+    # Embedded webhook receiver for push invalidation (a port of 0 disables it)
+    webhook_port: int = Field(0, alias="PODHOME_WEBHOOK_PORT")
+    webhook_host: str = Field("127.0.0.1", alias="PODHOME_WEBHOOK_HOST")
+    webhook_public_url: str | None = Field(None, alias="PODHOME_WEBHOOK_PUBLIC_URL")
+    webhook_secret: SecretStr | None = Field(None, alias="PODHOME_WEBHOOK_SECRET")
+    webhook_max_events: int = Field(1000, alias="PODHOME_WEBHOOK_MAX_EVENTS")
+    webhook_wait_timeout: float = Field(60.0, alias="PODHOME_WEBHOOK_WAIT_TIMEOUT")
+
+    # S3-compatible media storage (Cloudflare R2 by default; needs boto3)
+    cloudflare_account_id: str | None = Field(None, alias="CLOUDFLARE_ACCOUNT_ID")
+    r2_access_key_id: str | None = Field(None, alias="CLOUDFLARE_R2_ACCESS_KEY_ID")
+    r2_secret_access_key: SecretStr | None = Field(None, alias="CLOUDFLARE_R2_SECRET_ACCESS_KEY")
+    r2_public_domain: str | None = Field(None, alias="R2_PUBLIC_DOMAIN")
+    s3_endpoint_url: str | None = Field(None, alias="PODHOME_S3_ENDPOINT_URL")
+    s3_region: str = Field("auto", alias="PODHOME_S3_REGION")
+    storage_bucket: str | None = Field(None, alias="PODHOME_STORAGE_BUCKET")
+    upload_part_size: int = Field(16 * 1024 * 1024, alias="PODHOME_UPLOAD_PART_SIZE")
+    upload_concurrency: int = Field(4, alias="PODHOME_UPLOAD_CONCURRENCY")
+    presign_expiry: int = Field(3600, alias="PODHOME_PRESIGN_EXPIRY")
+    head_cache_ttl: float = Field(300.0, alias="PODHOME_HEAD_CACHE_TTL")
+
+    # Directory local files passed to tools by path must be under; tools
+    # that read local files refuse to run until it is set
+    media_root: str | None = Field(None, alias="PODHOME_MEDIA_ROOT")
+
     model_config = SettingsConfigDict(
         populate_by_name=True,
         extra="ignore",
@@ -45,6 +161,29 @@ class Config(BaseSettings):
             )
         return self.shows[show].get_secret_value()
 
+    def warmup_enabled(self, transport: str) -> bool:
+        """Return whether to run background warm-up when serving over ``transport``."""
+        if self.cache_ttl <= 0 or not self.shows:
+            return False
+        return self.warmup if self.warmup is not None else transport != "stdio"
+
+    def media_path(self, path: str) -> str:
+        """Resolve a local file path, checking it lies under ``media_root``.
+
+        Raises:
+            ValueError: If ``media_root`` is not set or the resolved path is outside it.
+        """
+        if self.media_root is None:
+            raise ValueError(
+                "Reading local files is disabled: set PODHOME_MEDIA_ROOT to the "
+                "directory they may be read from"
+            )
+        resolved = os.path.realpath(os.path.expanduser(path))
+        root = os.path.realpath(os.path.expanduser(self.media_root))
+        if os.path.commonpath([root, resolved]) != root:
+            raise ValueError(f"{path} is outside PODHOME_MEDIA_ROOT ({root})")
+        return resolved
+
 
 def load_config() -> Config:
     """Load and return the configuration."""
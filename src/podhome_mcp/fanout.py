@@ -0,0 +1,72 @@
+"""PodHome MCP Server - Cross-Show Fan-Out Helpers."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+ALL_SHOWS = "*"
+
+
+def single_show(show: str | list[str]) -> str | None:
+    """Return ``show`` if it is a single show slug, or None if it selects several."""
+    if isinstance(show, list) or show == ALL_SHOWS or "," in show:
+        return None
+    return show
+
+
+def resolve_shows(config: Config, show: str | list[str]) -> list[str]:
+    """Expand ``"*"``, a comma-separated string or a list into show slugs.
+
+    Raises:
+        ValueError: If any slug is not configured.
+    """
+    if isinstance(show, list):
+        shows = [s.strip() for s in show]
+    elif show == ALL_SHOWS:
+        shows = list(config.shows)
+    else:
+        shows = [s.strip() for s in show.split(",")]
+    shows = list(dict.fromkeys(s for s in shows if s))
+    for slug in shows:
+        config.get_api_key(slug)
+    return shows
+
+
+async def fan_out(
+    shows: list[str],
+    func: Callable[[str], Awaitable[list]],
+    timeout: float,
+) -> tuple[list[dict], dict[str, str]]:
+    """Call ``func(show)`` for every show concurrently with a per-show timeout.
+
+    List results are merged in show order and each item is tagged with its
+    ``show``. A show that fails or times out is reported in the returned
+    error map instead of failing the whole call.
+
+    Returns:
+        ``(items, errors)`` where ``errors`` maps show slug to message.
+    """
+
+    async def run_one(show: str) -> tuple[str, Any, str | None]:
+        try:
+            return show, await asyncio.wait_for(func(show), timeout), None
+        except asyncio.TimeoutError:
+            logger.warning("Fan-out to %s timed out after %ss", show, timeout)
+            return show, None, f"timed out after {timeout}s"
+        except Exception as e:
+            logger.warning("Fan-out to %s failed: %s", show, e)
+            return show, None, str(e)
+
+    items: list[dict] = []
+    errors: dict[str, str] = {}
+    for show, result, error in await asyncio.gather(*(run_one(s) for s in shows)):
+        if error is not None:
+            errors[show] = error
+            continue
+        for item in result:
+            items.append({"show": show, **item} if isinstance(item, dict) else {"show": show, "value": item})
+    return items, errors
@@ -0,0 +1,188 @@
+"""PodHome MCP Server - Cover Image Module."""
+
+import base64
+import importlib.util
+import io
+import mmap
+import os
+from typing import IO, Any, AsyncIterator, Iterator, cast
+
+from .codec import dumps
+
+_MAGIC = {b"\xff\xd8\xff": "jpeg", b"\x89PNG\r\n\x1a\n": "png"}
+
+# Every 3 raw bytes encode to 4 base64 characters, so chunks of a multiple
+# of 3 bytes encode independently and concatenate to the full encoding
+_CHUNK = 3 * 64 * 1024
+
+
+def pillow_available() -> bool:
+    """Return True if the optional ``Pillow`` package needed for resizing is installed."""
+    return importlib.util.find_spec("PIL") is not None
+
+
+def sniff(data: bytes | mmap.mmap) -> str | None:
+    """Return ``"jpeg"`` or ``"png"`` from a file's leading bytes, or None."""
+    for magic, name in _MAGIC.items():
+        if data[: len(magic)] == magic:
+            return name
+    return None
+
+
+class CoverImage:
+    """Image bytes ready to be sent as ``image_data``.
+
+    Holds either a read-only memory map of the original file, when it was
+    already within limits, or a recompressed JPEG. Close it when done.
+    """
+
+    def __init__(
+        self,
+        data: bytes | mmap.mmap,
+        format: str,
+        width: int | None = None,
+        height: int | None = None,
+        resized: bool = False,
+    ):
+        self._data = data
+        self.format = format
+        self.width = width
+        self.height = height
+        self.resized = resized
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __enter__(self) -> "CoverImage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def encoded_size(self) -> int:
+        """Length of the image in base64."""
+        return 4 * ((len(self._data) + 2) // 3)
+
+    def chunks(self) -> Iterator[bytes]:
+        """Yield the base64 encoding of the image a chunk at a time."""
+        for offset in range(0, len(self._data), _CHUNK):
+            yield base64.b64encode(self._data[offset : offset + _CHUNK])
+
+    def summary(self) -> dict[str, Any]:
+        """Return the format, size in bytes, dimensions (if known) and whether it was resized."""
+        summary: dict[str, Any] = {"format": self.format, "bytes": len(self._data)}
+        if self.width is not None:
+            summary["width"], summary["height"] = self.width, self.height
+        summary["resized"] = self.resized
+        return summary
+
+    def close(self) -> None:
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+def prepare_image(
+    path: str, max_dimension: int = 3000, max_bytes: int = 1024 * 1024, quality: int = 85
+) -> CoverImage:
+    """Read a local image and bring it within the cover art limits.
+
+    The file is memory-mapped, not read into memory. A JPEG or PNG within
+    ``max_dimension`` pixels and ``max_bytes`` is sent as is. Anything else
+    is downscaled and recompressed to JPEG, lowering the quality and then
+    the size until it fits. Without Pillow, only JPEG and PNG files within
+    ``max_bytes`` are accepted and dimensions are not checked. This blocks,
+    so call it in a worker thread.
+
+    Raises:
+        ValueError: If the file is empty, not an image or can't be made to fit.
+    """
+    path = os.path.expanduser(path)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"{path} is empty")
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        format = sniff(data)
+        if not pillow_available():
+            if format is None:
+                raise ValueError(
+                    f"{path} is not a JPEG or PNG image; install podhome-mcp[images] to convert it"
+                )
+            if len(data) > max_bytes:
+                raise ValueError(
+                    f"{path} is {len(data)} bytes, over the {max_bytes}-byte limit; "
+                    "install podhome-mcp[images] to downscale it"
+                )
+            return CoverImage(data, format)
+
+        from PIL import Image, UnidentifiedImageError
+
+        try:
+            # mmap implements the binary file interface Pillow reads from
+            image = Image.open(cast(IO[bytes], data))
+        except UnidentifiedImageError:
+            raise ValueError(f"{path} is not an image") from None
+        with image:
+            width, height = image.size
+            fits = len(data) <= max_bytes and max(width, height) <= max_dimension
+            if format is not None and fits:
+                return CoverImage(data, format, width, height)
+            jpeg, width, height = _recompress(image, max_dimension, max_bytes, quality)
+        data.close()
+        return CoverImage(jpeg, "jpeg", width, height, resized=True)
+    except BaseException:
+        data.close()
+        raise
+
+
+def _recompress(image, max_dimension: int, max_bytes: int, quality: int) -> tuple[bytes, int, int]:
+    """Downscale an open Pillow image and encode it as JPEG of at most ``max_bytes``."""
+    from PIL import Image
+
+    # Lets the JPEG decoder skip straight to a smaller scale
+    image.draft("RGB", (max_dimension, max_dimension))
+    if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+        rgba = image.convert("RGBA")
+        image = Image.new("RGB", rgba.size, "white")
+        image.paste(rgba, mask=rgba.getchannel("A"))
+    else:
+        image = image.convert("RGB")
+    # Bicubic after a fast integer reduction: close to Lanczos at a fraction of the cost
+    image.thumbnail((max_dimension, max_dimension), Image.Resampling.BICUBIC, reducing_gap=2.0)
+    while True:
+        for q in range(quality, 49, -10):
+            buffer = io.BytesIO()
+            image.save(buffer, "JPEG", quality=q, optimize=True, progressive=True)
+            if buffer.tell() <= max_bytes:
+                return buffer.getvalue(), image.width, image.height
+        if max(image.size) <= 256:
+            raise ValueError(f"Image can't be compressed to {max_bytes} bytes")
+        image = image.resize(
+            (image.width * 3 // 4, image.height * 3 // 4), Image.Resampling.BICUBIC
+        )
+
+
+def image_body(payload: dict, image: CoverImage, field: str = "image_data") -> dict[str, Any]:
+    """Return httpx request arguments sending ``payload`` with ``image`` as ``field``.
+
+    The base64 text is generated chunk by chunk while the body is sent, so
+    it never exists as a whole. ``Content-Length`` is computed up front, so
+    the body is not sent with chunked encoding.
+    """
+    head = dumps(payload)[:-1] + (b"," if payload else b"") + dumps(field) + b':"'
+    tail = b'"}'
+
+    async def stream() -> AsyncIterator[bytes]:
+        yield head
+        for chunk in image.chunks():
+            yield chunk
+        yield tail
+
+    return {
+        "content": stream(),
+        "headers": {
+            "Content-Type": "application/json",
+            "Content-Length": str(len(head) + image.encoded_size + len(tail)),
+        },
+    }
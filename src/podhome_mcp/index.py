@@ -0,0 +1,172 @@
+"""PodHome MCP Server - Episode Index Module."""
+
+import bisect
+from typing import TYPE_CHECKING, Any, Iterable
+
+if TYPE_CHECKING:
+    from .client import PodhomeClient
+
+STATUS_NAMES = {
+    0: "Draft",
+    1: "Scheduled",
+    2: "Published",
+    3: "LivePending",
+    4: "Live",
+    5: "LiveEnded",
+}
+
+DEFAULT_FIELDS = (
+    "episode_id",
+    "title",
+    "status",
+    "publish_date",
+    "season_nr",
+    "episode_nr",
+)
+
+
+def episode_id(episode: dict) -> str | None:
+    """Return the ID of an episode record, whichever key the API used."""
+    for key in ("episode_id", "episodeId", "id"):
+        value = episode.get(key)
+        if value is not None:
+            return str(value)
+    return None
+
+
+def normalize_status(status: int | str | None) -> str | None:
+    """Map a numeric or named status to its lower-case name."""
+    if status is None:
+        return None
+    if isinstance(status, int) or (isinstance(status, str) and status.isdigit()):
+        status = STATUS_NAMES.get(int(status), str(status))
+    return str(status).lower()
+
+
+class EpisodeIndex:
+    """In-memory lookup index over one show's episode list.
+
+    Episodes are keyed by ID with secondary indexes by status, by
+    (season, episode) number and by publish date. The index is refreshed from
+    ``PodhomeClient.list_episodes`` and only re-indexes episodes whose record
+    changed; a response served unchanged from the client cache is skipped.
+    """
+
+    def __init__(self, client: "PodhomeClient"):
+        """Initialize an empty index backed by the given client."""
+        self._client = client
+        self._source: list | None = None
+        self.by_id: dict[str, dict] = {}
+        self.by_status: dict[str | None, set[str]] = {}
+        self.by_number: dict[tuple[Any, Any], set[str]] = {}
+        self._by_date: list[tuple[str, str]] = []
+
+    def __len__(self) -> int:
+        return len(self.by_id)
+
+    async def refresh(self) -> "EpisodeIndex":
+        """Bring the index up to date with the (possibly cached) episode list."""
+        episodes = await self._client.list_episodes()
+        if episodes is not self._source:
+            self.update(episodes)
+            self._source = episodes
+        return self
+
+    def update(self, episodes: list[dict]) -> None:
+        """Apply a full episode list, touching only added, changed or removed records."""
+        seen = set()
+        for episode in episodes:
+            eid = episode_id(episode)
+            if eid is None:
+                continue
+            seen.add(eid)
+            old = self.by_id.get(eid)
+            if old == episode:
+                continue
+            if old is not None:
+                self._unindex(eid, old)
+            self._index(eid, episode)
+        for eid in [eid for eid in self.by_id if eid not in seen]:
+            self._unindex(eid, self.by_id[eid])
+
+    def upsert(self, episode: dict) -> None:
+        """Add or replace a single episode record."""
+        eid = episode_id(episode)
+        if eid is None:
+            return
+        old = self.by_id.get(eid)
+        if old is not None:
+            self._unindex(eid, old)
+        self._index(eid, episode)
+
+    def get(self, eid: str) -> dict | None:
+        """Return an episode by ID."""
+        return self.by_id.get(eid)
+
+    def find(
+        self,
+        status: int | str | None = None,
+        season_nr: int | None = None,
+        episode_nr: int | None = None,
+        published_after: str | None = None,
+        published_before: str | None = None,
+    ) -> list[dict]:
+        """Return episodes matching every given filter, newest first.
+
+        Publish-date bounds are compared as ISO-8601 strings, inclusive.
+        """
+        candidates: set[str] | None = None
+
+        def narrow(ids: Iterable[str]):
+            nonlocal candidates
+            ids = set(ids)
+            candidates = ids if candidates is None else candidates & ids
+
+        if status is not None:
+            narrow(self.by_status.get(normalize_status(status), ()))
+        if season_nr is not None or episode_nr is not None:
+            narrow(
+                eid
+                for (season, number), ids in self.by_number.items()
+                if (season_nr is None or season == season_nr)
+                and (episode_nr is None or number == episode_nr)
+                for eid in ids
+            )
+        if published_after is not None or published_before is not None:
+            lo = 0
+            hi = len(self._by_date)
+            if published_after is not None:
+                lo = bisect.bisect_left(self._by_date, (published_after, ""))
+            if published_before is not None:
+                hi = bisect.bisect_right(self._by_date, (published_before + "\uffff", ""))
+            narrow(eid for _, eid in self._by_date[lo:hi])
+
+        ids = self.by_id.keys() if candidates is None else candidates
+        episodes = [self.by_id[eid] for eid in ids]
+        episodes.sort(key=lambda e: e.get("publish_date") or "", reverse=True)
+        return episodes
+
+    def _index(self, eid: str, episode: dict) -> None:
+        self.by_id[eid] = episode
+        self.by_status.setdefault(normalize_status(episode.get("status")), set()).add(eid)
+        number = (episode.get("season_nr"), episode.get("episode_nr"))
+        self.by_number.setdefault(number, set()).add(eid)
+        date = episode.get("publish_date")
+        if date:
+            bisect.insort(self._by_date, (str(date), eid))
+
+    def _unindex(self, eid: str, episode: dict) -> None:
+        del self.by_id[eid]
+        status = normalize_status(episode.get("status"))
+        self.by_status[status].discard(eid)
+        if not self.by_status[status]:
+            del self.by_status[status]
+        number = (episode.get("season_nr"), episode.get("episode_nr"))
+        self.by_number[number].discard(eid)
+        if not self.by_number[number]:
+            del self.by_number[number]
+        date = episode.get("publish_date")
+        if date:
+            i = bisect.bisect_left(self._by_date, (str(date), eid))
+            if i < len(self._by_date) and self._by_date[i] == (str(date), eid):
+                del self._by_date[i]
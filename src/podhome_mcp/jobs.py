@@ -0,0 +1,168 @@
+"""PodHome MCP Server - Episode Job Tracker Module."""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Iterable
+
+from .index import episode_id, normalize_status
+
+if TYPE_CHECKING:
+    from .client import PodhomeClient
+
+logger = logging.getLogger(__name__)
+
+
+def ready_when(
+    statuses: Iterable[int | str] | None = None,
+    require_fields: Iterable[str] | None = None,
+) -> Callable[[dict], bool]:
+    """Build a predicate for an episode record reaching a target state.
+
+    The episode is ready when its status is one of ``statuses`` (numbers or
+    names, any if None) and every field in ``require_fields`` is non-empty.
+    """
+    targets = {normalize_status(s) for s in statuses} if statuses is not None else None
+    required = list(require_fields or ())
+
+    def ready(episode: dict) -> bool:
+        if targets is not None and normalize_status(episode.get("status")) not in targets:
+            return False
+        return all(episode.get(f) not in (None, "", [], {}) for f in required)
+
+    return ready
+
+
+@dataclass
+class _Waiter:
+    episode_id: str
+    ready: Callable[[dict], bool]
+    future: asyncio.Future
+    due: float
+    attempt: int = 0
+    polls: int = 0
+    latest: dict | None = None
+    error: str | None = field(default=None)
+
+
+class EpisodeTracker:
+    """Waits for episodes of one show to reach a target state.
+
+    All tracked episodes share one background loop: each poll is a single
+    ``list_episodes`` request that answers every waiter at once. Each waiter
+    is polled with exponential backoff and jitter, and the loop only polls
+    when the earliest waiter is due. ``poke`` forces an immediate poll, e.g.
+    when a webhook reports a change.
+    """
+
+    def __init__(
+        self,
+        client: "PodhomeClient",
+        base_delay: float = 2.0,
+        max_delay: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an idle tracker.
+
+        Args:
+            client: Client used to list the show's episodes
+            base_delay: Delay in seconds before a waiter's second poll
+            max_delay: Upper bound for the delay between polls
+            clock: Monotonic time source (overridable for tests)
+        """
+        self._client = client
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._waiters: list[_Waiter] = []
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.polls = 0
+
+    def __len__(self) -> int:
+        return len(self._waiters)
+
+    def delay(self, attempt: int) -> float:
+        """Return the jittered delay before a waiter's poll after ``attempt`` polls."""
+        ceiling = min(self.max_delay, self.base_delay * 2**attempt)
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    def poke(self) -> None:
+        """Make every waiter due now so the loop polls straight away."""
+        now = self._clock()
+        for waiter in self._waiters:
+            waiter.due = min(waiter.due, now)
+        self._wake.set()
+
+    async def wait(
+        self, eid: str, ready: Callable[[dict], bool], timeout: float
+    ) -> tuple[dict | None, bool, dict]:
+        """Wait until episode ``eid`` satisfies ``ready`` or ``timeout`` passes.
+
+        Returns:
+            ``(episode, reached, info)``: the latest record seen (None if the
+            episode was never listed), whether it became ready, and the
+            number of polls plus the last poll error, if any.
+        """
+        waiter = _Waiter(eid, ready, asyncio.get_running_loop().create_future(), self._clock())
+        self._waiters.append(waiter)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wake.set()
+        try:
+            await asyncio.wait([waiter.future], timeout=timeout)
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+        info = {"polls": waiter.polls, "error": waiter.error}
+        if waiter.future.done():
+            return waiter.future.result(), True, info
+        return waiter.latest, False, info
+
+    async def _run(self) -> None:
+        while self._waiters:
+            self._wake.clear()
+            started = self._clock()
+            due = min(w.due for w in self._waiters)
+            if due > started:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), due - started)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._poll(started)
+
+    async def _poll(self, started: float) -> None:
+        error = None
+        by_id: dict[str | None, dict] = {}
+        try:
+            by_id = {episode_id(e): e for e in await self._client.list_episodes(max_age=0)}
+        except Exception as e:
+            logger.warning("Polling episodes for %s failed: %s", self._client.name, e)
+            error = str(e)
+        self.polls += 1
+        now = self._clock()
+        for waiter in list(self._waiters):
+            waiter.polls += 1
+            waiter.error = error
+            if error is None:
+                waiter.latest = by_id.get(waiter.episode_id)
+                if waiter.latest is not None and waiter.ready(waiter.latest):
+                    if not waiter.future.done():
+                        waiter.future.set_result(waiter.latest)
+                    self._waiters.remove(waiter)
+                    continue
+            if waiter.due <= started:
+                waiter.due = now + self.delay(waiter.attempt)
+                waiter.attempt += 1
+
+    async def aclose(self) -> None:
+        """Stop the polling loop."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
@@ -0,0 +1,132 @@
+"""PodHome MCP Server - Incremental JSON Array Parsing."""
+
+import codecs
+import json
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, AsyncIterable, AsyncIterator
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Yield the elements of a top-level JSON array as its bytes arrive.
+
+    Only the element currently being received is buffered, so memory stays
+    proportional to the largest single element rather than the whole body.
+
+    Raises:
+        ValueError: If the body is not a JSON array or is malformed.
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    started = False
+    finished = False
+    expect_value = True
+    count = 0
+    # Length of the buffer when the last decode attempt found an incomplete
+    # element; we wait for it to double before retrying so that one huge
+    # element is not re-parsed from the start for every chunk.
+    retry_at = 0
+
+    async def feed() -> bool:
+        nonlocal buf, pos
+        async for chunk in iterator:
+            text = utf8.decode(chunk)
+            if text:
+                buf = buf[pos:] + text
+                pos = 0
+                return True
+        tail = utf8.decode(b"", final=True)
+        if tail:
+            buf = buf[pos:] + tail
+            pos = 0
+            return True
+        return False
+
+    iterator = aiter(chunks)
+    eof = False
+    while True:
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        if pos >= len(buf) or (len(buf) < retry_at and not eof):
+            if eof:
+                break
+            eof = not await feed()
+            continue
+
+        if not started:
+            if buf[pos] != "[":
+                raise ValueError("Expected a JSON array")
+            started = True
+            pos += 1
+            continue
+        if finished:
+            raise ValueError("Unexpected data after JSON array")
+
+        char = buf[pos]
+        if char == "]":
+            if expect_value and count:
+                raise ValueError("Trailing comma in JSON array")
+            finished = True
+            pos += 1
+            continue
+        if not expect_value:
+            if char != ",":
+                raise ValueError("Expected ',' or ']' between array elements")
+            pos += 1
+            expect_value = True
+            continue
+
+        try:
+            value, end = _decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError as e:
+            if eof:
+                raise ValueError(f"Malformed JSON array: {e}") from e
+            retry_at = 2 * (len(buf) - pos)
+            eof = not await feed()
+            continue
+        if not eof and (
+            end == len(buf)
+            or (
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and not buf[end:].lstrip(_NUMBER_CHARS)
+            )
+        ):
+            # A number at the end of the buffer may continue in the next chunk
+            retry_at = len(buf) - pos + 1
+            eof = not await feed()
+            continue
+        retry_at = 0
+        pos = end
+        expect_value = False
+        count += 1
+        yield value
+
+    if not finished:
+        raise ValueError("Truncated JSON array")
+
+
+async def take_page(
+    items: AsyncGenerator[Any, None], offset: int, limit: int | None
+) -> tuple[list, bool]:
+    """Collect ``limit`` items (all if None) after skipping ``offset``, then stop consuming.
+
+    Returns the page and whether more items followed it. The iterator is
+    closed as soon as the page is complete, ending any underlying download.
+    """
+    page: list = []
+    more = False
+    async with aclosing(items) as items:
+        index = 0
+        async for item in items:
+            if index >= offset:
+                if limit is not None and len(page) >= limit:
+                    more = True
+                    break
+                page.append(item)
+            index += 1
+    return page, more
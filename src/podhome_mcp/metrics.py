@@ -0,0 +1,238 @@
+"""PodHome MCP Server - Metrics Module."""
+
+import asyncio
+import bisect
+import contextvars
+import functools
+import inspect
+import logging
+import os
+import tempfile
+import time
+from typing import Any, Callable, Collection
+
+from .fanout import single_show
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Name of the tool currently executing, so client-level metrics can be
+# attributed to the tool call that caused them
+current_tool: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "current_tool", default=None
+)
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict[str, Any]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """Initialize an empty histogram."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Estimate the ``q`` quantile by interpolating within its bucket.
+
+        The estimate is clamped to the observed min/max.
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                estimate = lower + (upper - lower) * (rank - seen) / n
+                return min(max(estimate, self.min), self.max)
+            seen += n
+        return self.max
+
+
+class Metrics:
+    """In-process counters and latency histograms with a Prometheus dump."""
+
+    def __init__(self) -> None:
+        """Initialize an empty metrics registry."""
+        self.started = time.time()
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._histograms: dict[str, dict[Labels, Histogram]] = {}
+
+    def inc(self, name: str, amount: float = 1, **labels: Any) -> None:
+        """Increase a counter."""
+        series = self._counters.setdefault(name, {})
+        key = _labels(labels)
+        series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record a histogram observation."""
+        series = self._histograms.setdefault(name, {})
+        key = _labels(labels)
+        hist = series.get(key)
+        if hist is None:
+            hist = series[key] = Histogram()
+        hist.observe(value)
+
+    def counter(self, name: str, **labels: Any) -> float:
+        """Return the current value of a counter series."""
+        return self._counters.get(name, {}).get(_labels(labels), 0)
+
+    def summary(self) -> dict[str, Any]:
+        """Return latency percentiles and counters grouped for display."""
+        out: dict[str, Any] = {"uptime_s": round(time.time() - self.started)}
+        for name, series in sorted(self._histograms.items()):
+            out[name] = {
+                ",".join(f"{k}={v}" for k, v in key): {
+                    "count": hist.count,
+                    "mean_ms": round(1000 * hist.sum / hist.count, 1),
+                    "p50_ms": round(1000 * hist.quantile(0.5), 1),
+                    "p99_ms": round(1000 * hist.quantile(0.99), 1),
+                }
+                for key, hist in sorted(series.items())
+            }
+        for name, counters in sorted(self._counters.items()):
+            out[name] = {
+                ",".join(f"{k}={v}" for k, v in key): value
+                for key, value in sorted(counters.items())
+            }
+        return out
+
+    def prometheus(self) -> str:
+        """Render every series in the Prometheus text exposition format."""
+
+        def fmt(key: Labels, extra: tuple[tuple[str, str], ...] = ()) -> str:
+            pairs = key + extra
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+        lines: list[str] = []
+        for name, series in sorted(self._counters.items()):
+            lines.append(f"# TYPE {name} counter")
+            for key, value in sorted(series.items()):
+                lines.append(f"{name}{fmt(key)} {value:g}")
+        for name, hseries in sorted(self._histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+            for key, hist in sorted(hseries.items()):
+                cumulative = 0
+                for bound, n in zip((*hist.buckets, "+Inf"), hist.counts):
+                    cumulative += n
+                    lines.append(f"{name}_bucket{fmt(key, (('le', str(bound)),))} {cumulative}")
+                lines.append(f"{name}_sum{fmt(key)} {hist.sum:g}")
+                lines.append(f"{name}_count{fmt(key)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """Atomically write the Prometheus dump to ``path``."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self.prometheus())
+            os.replace(tmp, path)
+        except Exception:
+            os.unlink(tmp)
+            raise
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+async def write_prometheus_periodically(metrics: Metrics, path: str, interval: float):
+    """Rewrite the Prometheus dump at ``path`` every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            metrics.write_prometheus(path)
+        except OSError as e:
+            logger.warning("Failed to write metrics to %s: %s", path, e)
+
+
+def instrument(fn: Callable, metrics: Metrics, shows: Collection[str]) -> Callable:
+    """Wrap a tool function to record its latency and outcome.
+
+    Tools report failures as ``"Error: ..."`` strings, which are counted as
+    errors. The ``show`` argument, when present, is used as a label: one of
+    ``shows``, ``"multi"`` for a multi-show selector or ``"unknown"``, so
+    callers can't create new series.
+    """
+    name = fn.__name__
+
+    def record(start: float, failed: bool, kwargs: dict) -> None:
+        show = kwargs.get("show")
+        if show is not None:
+            slug = single_show(show) if isinstance(show, (str, list)) else show
+            if slug is None:
+                show = "multi"
+            elif slug not in shows:
+                show = "unknown"
+        metrics.observe(
+            "podhome_tool_duration_seconds",
+            time.perf_counter() - start,
+            tool=name,
+            show=show,
+        )
+        metrics.inc(
+            "podhome_tool_calls_total",
+            tool=name,
+            show=show,
+            outcome="error" if failed else "ok",
+        )
+
+    def is_error(result: Any) -> bool:
+        return isinstance(result, str) and result.startswith("Error:")
+
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            token = current_tool.set(name)
+            start = time.perf_counter()
+            failed = True
+            try:
+                result = await fn(*args, **kwargs)
+                failed = is_error(result)
+                return result
+            finally:
+                record(start, failed, kwargs)
+                current_tool.reset(token)
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = current_tool.set(name)
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = fn(*args, **kwargs)
+            failed = is_error(result)
+            return result
+        finally:
+            record(start, failed, kwargs)
+            current_tool.reset(token)
+
+    return wrapper
@@ -0,0 +1,91 @@
+"""PodHome MCP Server - Tool Output Formatting."""
+
+from typing import Any, Iterable
+
+from .codec import dumps_str
+
+_ELLIPSIS = "…"
+
+
+def to_json(value: Any) -> str:
+    """Encode a value as compact JSON."""
+    return dumps_str(value)
+
+
+def trim(value: Any, max_chars: int | None) -> Any:
+    """Recursively shorten strings longer than ``max_chars``.
+
+    Truncated strings end with a marker giving the number of characters cut.
+    Containers are copied only where something was shortened.
+    """
+    if not max_chars:
+        return value
+    if isinstance(value, str):
+        if len(value) <= max_chars:
+            return value
+        return f"{value[:max_chars]}{_ELLIPSIS}[+{len(value) - max_chars} chars]"
+    if isinstance(value, dict):
+        trimmed = {k: trim(v, max_chars) for k, v in value.items()}
+        return trimmed if any(trimmed[k] is not value[k] for k in value) else value
+    if isinstance(value, list):
+        trimmed_list = [trim(v, max_chars) for v in value]
+        return trimmed_list if any(a is not b for a, b in zip(trimmed_list, value)) else value
+    return value
+
+
+def select(record: Any, fields: Iterable[str] | None) -> Any:
+    """Keep only ``fields`` of a dict record; other values pass through."""
+    if fields is None or not isinstance(record, dict):
+        return record
+    return {f: record[f] for f in fields if f in record}
+
+
+def render(
+    data: Any,
+    *,
+    fields: Iterable[str] | None = None,
+    max_field_chars: int | None = None,
+    max_bytes: int | None = None,
+    key: str = "items",
+    offset: int = 0,
+    meta: dict[str, Any] | None = None,
+) -> str:
+    """Render a tool result as compact JSON within a size budget.
+
+    Lists are encoded item by item: each record is reduced to ``fields`` and
+    long strings are trimmed to ``max_field_chars``, and items stop being
+    added once ``max_bytes`` would be exceeded. A list is emitted as a bare
+    JSON array unless it was cut short or ``meta`` carries values, in which
+    case it is wrapped as ``{key: [...], "next_offset": ..., **meta}``.
+
+    Args:
+        data: Tool result (list, dict or scalar)
+        fields: Record fields to keep (default: all)
+        max_field_chars: Maximum length of any string value
+        max_bytes: Approximate UTF-8 size budget for the output
+        key: Envelope key for list items
+        offset: Position of ``data[0]`` in the full result, for ``next_offset``
+        meta: Extra envelope values; ``None`` values are omitted
+    """
+    fields = list(fields) if fields is not None else None
+    if not isinstance(data, list):
+        return to_json(trim(select(data, fields), max_field_chars))
+
+    parts: list[str] = []
+    size = 2
+    for record in data:
+        part = to_json(trim(select(record, fields), max_field_chars))
+        part_size = len(part.encode()) + 1
+        if max_bytes is not None and parts and size + part_size > max_bytes:
+            break
+        parts.append(part)
+        size += part_size
+
+    envelope = {k: v for k, v in (meta or {}).items() if v is not None}
+    if len(parts) < len(data):
+        envelope["next_offset"] = offset + len(parts)
+        envelope["truncated"] = True
+    items = "[" + ",".join(parts) + "]"
+    if not envelope:
+        return items
+    return f'{{"{key}":{items},{to_json(envelope)[1:]}'
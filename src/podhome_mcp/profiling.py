@@ -0,0 +1,262 @@
+"""PodHome MCP Server - Tool Call Profiling Module."""
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Collection
+
+logger = logging.getLogger(__name__)
+
+# Profile of the tool call currently executing, if it is being profiled
+_current: contextvars.ContextVar["ProfileSession | None"] = contextvars.ContextVar(
+    "current_profile", default=None
+)
+
+
+@contextmanager
+def phase(name: str):
+    """Add the time spent in the block to phase ``name`` of the current profile.
+
+    Costs a single context-variable lookup when no call is being profiled.
+    """
+    session = _current.get()
+    if session is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        session.phases[name] += time.perf_counter() - start
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", os.path.basename(code.co_filename))
+    return f"{module}:{code.co_name}"
+
+
+class Sampler:
+    """Background thread sampling one thread's Python stack at a fixed interval.
+
+    Each sample is added, in collapsed-stack form (root first, frames joined
+    by ``;``), to every profile session active at that moment. It runs only
+    while at least one session is active.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        """Initialize a stopped sampler taking one sample every ``interval`` seconds."""
+        self.interval = interval
+        self._sessions: set["ProfileSession"] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._target: int | None = None
+
+    def add(self, session: "ProfileSession") -> None:
+        """Start collecting samples of the calling thread for ``session``."""
+        with self._lock:
+            self._sessions.add(session)
+            self._target = threading.get_ident()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="podhome-profiler", daemon=True
+                )
+                self._thread.start()
+
+    def remove(self, session: "ProfileSession") -> None:
+        """Stop collecting samples for ``session``."""
+        with self._lock:
+            self._sessions.discard(session)
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self._sessions:
+                    self._thread = None
+                    return
+                sessions = list(self._sessions)
+                target = self._target
+            if target is None:
+                continue
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_name(frame))
+                frame = frame.f_back
+            if stack:
+                collapsed = ";".join(reversed(stack))
+                for session in sessions:
+                    session.samples[collapsed] += 1
+
+
+class ProfileSession:
+    """Samples and per-phase timings for one tool call."""
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.started = time.time()
+        self.phases: defaultdict[str, float] = defaultdict(float)
+        self.samples: Counter[str] = Counter()
+        self.duration = 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """Return the call's timings in milliseconds, split by phase.
+
+        ``fastmcp`` is argument validation and result conversion around the
+        tool function; ``tool_other`` is time in the tool function not
+        covered by a named phase.
+        """
+        tool = self.phases.get("tool", 0.0)
+        inner = sum(v for k, v in self.phases.items() if k != "tool")
+        phases = {k: v for k, v in self.phases.items() if k != "tool"}
+        phases["fastmcp"] = max(self.duration - tool, 0.0) if tool else 0.0
+        phases["tool_other"] = max(tool - inner, 0.0)
+        return {
+            "tool": self.tool,
+            "started": self.started,
+            "duration_ms": round(1000 * self.duration, 3),
+            "phases_ms": {k: round(1000 * v, 3) for k, v in sorted(phases.items())},
+            "samples": sum(self.samples.values()),
+        }
+
+
+class Profiler:
+    """Opt-in profiling of tool calls over a latency threshold.
+
+    Profiling is on permanently when ``threshold`` is set, or for the next
+    few calls after ``arm``. A profiled call that takes at least the
+    threshold is written to ``directory`` as a collapsed-stack file
+    (``.folded``, for flamegraph.pl or speedscope) and a ``.json`` summary
+    of per-phase timings. Samples cover the whole event loop thread, so
+    calls running concurrently show up in each other's profiles.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        threshold: float | None = None,
+        interval: float = 0.005,
+        keep: int = 20,
+    ):
+        """Initialize the profiler.
+
+        Args:
+            directory: Where profiles are written (default: a temp directory)
+            threshold: Always profile, keeping calls at least this many seconds
+            interval: Seconds between stack samples
+            keep: Number of recent capture summaries kept for reporting
+        """
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "podhome-profiles")
+        self.threshold = threshold
+        self.sampler = Sampler(interval)
+        self.keep = keep
+        self._armed = 0
+        self._armed_threshold = 0.0
+        self.captures: list[dict] = []
+
+    @property
+    def armed(self) -> int:
+        """Number of upcoming calls that will be profiled by ``arm``."""
+        return self._armed
+
+    def arm(self, calls: int, threshold: float = 0.0) -> None:
+        """Profile the next ``calls`` tool calls, keeping those of at least ``threshold`` seconds."""
+        self._armed = max(calls, 0)
+        self._armed_threshold = threshold
+
+    def _claim(self) -> float | None:
+        """Return the threshold to apply to a starting call, or None to skip it."""
+        if self._armed > 0:
+            self._armed -= 1
+            return self._armed_threshold
+        return self.threshold
+
+    @asynccontextmanager
+    async def session(self, tool: str):
+        """Profile the enclosed tool call if profiling is on; yields the session or None."""
+        threshold = self._claim()
+        if threshold is None:
+            yield None
+            return
+        session = ProfileSession(tool)
+        token = _current.set(session)
+        self.sampler.add(session)
+        start = time.perf_counter()
+        try:
+            yield session
+        finally:
+            session.duration = time.perf_counter() - start
+            self.sampler.remove(session)
+            _current.reset(token)
+            if session.duration >= threshold:
+                try:
+                    self.write(session)
+                except OSError as e:
+                    logger.warning("Failed to write profile for %s: %s", tool, e)
+
+    def write(self, session: ProfileSession) -> dict:
+        """Write a session's collapsed stacks and summary; returns the summary."""
+        os.makedirs(self.directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.localtime(session.started))
+        base = os.path.join(
+            self.directory,
+            f"{stamp}-{int(session.started * 1000) % 1000:03d}-{session.tool}"
+            f"-{round(1000 * session.duration)}ms",
+        )
+        summary = {**session.summary(), "folded": f"{base}.folded"}
+        with open(f"{base}.folded", "w") as f:
+            for stack, count in session.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        with open(f"{base}.json", "w") as f:
+            json.dump(summary, f, indent=2)
+        self.captures = [*self.captures, summary][-self.keep :]
+        logger.info("Profiled %s (%.1f ms) to %s.folded", session.tool, summary["duration_ms"], base)
+        return summary
+
+
+def profiled(fn: Callable) -> Callable:
+    """Wrap a tool function so its own run time is recorded as the ``tool`` phase."""
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def async_wrapper(*args, **kwargs):
+            with phase("tool"):
+                return await fn(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with phase("tool"):
+            return fn(*args, **kwargs)
+
+    return wrapper
+
+
+def profile_middleware(profiler: Profiler, exclude: Collection[str] = frozenset()):
+    """Return FastMCP middleware that profiles tool calls with ``profiler``.
+
+    Running as middleware lets the profile include fastmcp's argument
+    validation and result conversion around the tool function.
+    """
+    from fastmcp.server.middleware import Middleware
+
+    class ProfileMiddleware(Middleware):
+        async def on_call_tool(self, context, call_next):
+            name = context.message.name
+            if name in exclude:
+                return await call_next(context)
+            async with profiler.session(name):
+                return await call_next(context)
+
+    return ProfileMiddleware()
@@ -0,0 +1,202 @@
+"""PodHome MCP Server - Rate Limiting, Retry and Circuit Breaker Module."""
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying on idempotent requests
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+# Responses that count against the circuit breaker
+SERVER_ERROR_STATUS = frozenset({500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit breaker is open."""
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+class TokenBucket:
+    """Adaptive token-bucket rate limiter.
+
+    The refill rate is halved whenever the API answers 429 and creeps back up
+    towards ``rate`` on each success (AIMD), so sustained throughput settles
+    just under the server's real limit. ``Retry-After`` pauses the bucket.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Maximum sustained requests per second
+            burst: Bucket capacity (requests allowed back-to-back)
+            min_rate: Floor for the adaptive rate (default: 5% of ``rate``)
+            clock: Monotonic time source (overridable for tests)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min_rate if min_rate is not None else rate * 0.05
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0 on success, otherwise the number of seconds to wait before retrying.
+        """
+        now = self._clock()
+        self._refill(now)
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while (delay := self.try_acquire()) > 0:
+            await asyncio.sleep(delay)
+
+    def on_success(self) -> None:
+        """Additively recover the rate after a successful response."""
+        if self.rate < self.max_rate:
+            self._refill(self._clock())
+            self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def on_throttle(self, retry_after: float | None = None) -> None:
+        """Halve the rate after a 429 and pause for ``Retry-After`` if given."""
+        self._refill(self._clock())
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, 0.0)
+        if retry_after:
+            self._paused_until = max(self._paused_until, self._clock() + retry_after)
+        logger.info("Rate limited; reducing to %.2f req/s", self.rate)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, honouring ``Retry-After``."""
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float):
+        """Initialize the policy.
+
+        Args:
+            max_attempts: Total attempts including the first request
+            base_delay: Backoff base in seconds
+            max_delay: Upper bound for a single wait; a longer
+                ``Retry-After`` is not waited out
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """Return seconds to wait before retry number ``attempt`` (0-based).
+
+        Returns None when no further retry should be made.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if retry_after is not None:
+            if retry_after > self.max_delay:
+                return None
+            return retry_after + random.uniform(0, self.base_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """Fail fast while the API is down.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests raise CircuitOpenError for ``reset_timeout`` seconds. A single
+    probe request is then let through; its outcome closes or re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a closed breaker."""
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> str:
+        """Return "closed", "open" or "half-open"."""
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at < self.reset_timeout:
+            return "open"
+        return "half-open"
+
+    def check(self) -> None:
+        """Raise CircuitOpenError unless a request may be sent now.
+
+        In the half-open state only one probe is let through per
+        ``reset_timeout``, so a probe that never reports back cannot wedge
+        the breaker.
+        """
+        if self._opened_at is None:
+            return
+        now = self._clock()
+        probing = (
+            self._probe_started is not None
+            and now - self._probe_started < self.reset_timeout
+        )
+        if now - self._opened_at < self.reset_timeout or probing:
+            raise CircuitOpenError("Podhome API unavailable (circuit open); try again later")
+        self._probe_started = now
+
+    def record_success(self) -> None:
+        """Close the circuit."""
+        self._failures = 0
+        self._opened_at = None
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the circuit at the threshold."""
+        self._failures += 1
+        if self._probe_started is not None or self._failures >= self.failure_threshold:
+            if self._opened_at is None:
+                logger.warning("Podhome circuit opened after %d failures", self._failures)
+            self._opened_at = self._clock()
+            self._probe_started = None
@@ -1,13 +1,16 @@
 """PodHome MCP Server - Main Entry Point."""
 
+import argparse
+import asyncio
 import logging
 import signal
 import sys
+import time
+from contextlib import asynccontextmanager, suppress
 
-from fastmcp import FastMCP
-
-from .config import load_config
-from .tools import register_tools
+# fastmcp, httpx and pydantic-settings account for nearly all of the startup
+# time, so they are imported in main() rather than here: option parsing and
+# ``--check-startup`` must not pay for them up front.
 
 logging.basicConfig(
     stream=sys.stderr,
@@ -17,25 +20,166 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """Main entry point for the PodHome MCP server."""
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line options; unset options fall back to the environment."""
+    parser = argparse.ArgumentParser(
+        prog="podhome-mcp", description="MCP server for the Podhome Integration API"
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http", "sse"],
+        help="Transport to serve (default: PODHOME_TRANSPORT or stdio)",
+    )
+    parser.add_argument("--host", help="HTTP bind address (default: PODHOME_HOST)")
+    parser.add_argument("--port", type=int, help="HTTP port (default: PODHOME_PORT)")
+    parser.add_argument(
+        "--check-startup",
+        action="store_true",
+        help="Print how long each startup phase takes, up to the first tools/list, and exit",
+    )
+    return parser.parse_args(argv)
+
+
+def handle_shutdown(signum, frame):
+    """Turn SIGTERM into KeyboardInterrupt so the lifespan cleanup runs (stdio only)."""
+    logger.info("Shutdown signal received")
+    # A second SIGTERM must not interrupt the cleanup this one starts
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    raise KeyboardInterrupt
+
+
+def check_startup() -> dict[str, float]:
+    """Time each startup phase up to the first ``tools/list`` response.
+
+    Must run in a fresh interpreter for the import timings to be meaningful.
+
+    Returns:
+        Seconds spent per phase, in order, plus ``total``.
+    """
+    timings: dict[str, float] = {}
+    start = last = time.perf_counter()
+
+    def phase(name: str):
+        nonlocal last
+        now = time.perf_counter()
+        timings[name] = now - last
+        last = now
+
+    from fastmcp import Client, FastMCP
+
+    phase("import fastmcp")
+    from .config import load_config
+    from .tools import register_tools
+
+    phase("import podhome_mcp")
     config = load_config()
+    phase("load_config")
     mcp = FastMCP("podhome")
-    register_tools(mcp, config)
+    registry = register_tools(mcp, config)
+    phase("register_tools")
 
-    logger.info(
-        "Podhome MCP server started (stdio) — shows: %s", list(config.shows.keys())
-    )
+    async def first_list() -> int:
+        async with Client(mcp) as client:
+            phase("initialize")
+            return len(await client.list_tools())
+
+    tools = asyncio.run(first_list())
+    phase(f"tools/list ({tools} tools)")
+    asyncio.run(registry.aclose())
+    timings["total"] = time.perf_counter() - start
+    return timings
+
+
+def main(argv: list[str] | None = None):
+    """Main entry point for the PodHome MCP server."""
+    args = parse_args(argv)
+    if args.check_startup:
+        for name, seconds in check_startup().items():
+            print(f"{name:28} {seconds * 1000:8.1f} ms")
+        return
 
-    def handle_shutdown(signum, frame):
-        """Handle shutdown signals gracefully."""
-        logger.info("Shutdown signal received")
-        sys.exit(0)
+    from fastmcp import FastMCP
 
-    signal.signal(signal.SIGTERM, handle_shutdown)
-    signal.signal(signal.SIGINT, handle_shutdown)
+    from .client import ClientRegistry
+    from .config import load_config
+    from .metrics import write_prometheus_periodically
+    from .tools import register_tools
+    from .warmup import WarmupScheduler
+    from .webhooks import WebhookReceiver
+
+    config = load_config()
+    transport = args.transport or config.transport
+    registry = ClientRegistry(config)
+
+    @asynccontextmanager
+    async def lifespan(server):
+        """Run background tasks and close pooled HTTP clients when the server stops."""
+        writer = None
+        if config.metrics_file:
+            writer = asyncio.create_task(
+                write_prometheus_periodically(
+                    registry.metrics, config.metrics_file, config.metrics_interval
+                )
+            )
+        if config.webhook_port:
+            secret = config.webhook_secret
+            registry.receiver = await WebhookReceiver(
+                registry,
+                config.webhook_host,
+                config.webhook_port,
+                public_url=config.webhook_public_url,
+                secret=secret.get_secret_value() if secret else None,
+            ).start()
+        if config.warmup_enabled(transport):
+            registry.warmup = WarmupScheduler(
+                registry,
+                config.shows,
+                min_interval=config.warmup_min_interval,
+                max_interval=config.warmup_max_interval or 0.9 * config.cache_ttl,
+                concurrency=config.warmup_concurrency,
+            ).start()
+        try:
+            yield {}
+        finally:
+            if registry.warmup is not None:
+                await registry.warmup.aclose()
+                registry.warmup = None
+            if registry.receiver is not None:
+                await registry.receiver.aclose()
+                registry.receiver = None
+            if writer is not None:
+                writer.cancel()
+                with suppress(asyncio.CancelledError):
+                    await writer
+                registry.metrics.write_prometheus(config.metrics_file)
+            await registry.aclose()
+            logger.info("Podhome MCP server stopped")
+
+    mcp = FastMCP("podhome", lifespan=lifespan)
+    register_tools(mcp, config, registry)
+
+    logger.info(
+        "Podhome MCP server started (%s) — shows: %s",
+        transport,
+        list(config.shows.keys()),
+    )
 
-    mcp.run(transport="stdio")
+    if transport == "stdio":
+        signal.signal(signal.SIGTERM, handle_shutdown)
+        try:
+            # The banner goes unseen on stdio and checks PyPI for updates
+            mcp.run(transport="stdio", show_banner=False)
+        except KeyboardInterrupt:
+            pass
+    else:
+        # Uvicorn handles SIGINT/SIGTERM itself: it stops accepting
+        # connections and drains in-flight requests before the lifespan exits.
+        mcp.run(
+            transport=transport,
+            host=args.host or config.host,
+            port=args.port or config.port,
+            uvicorn_config={"timeout_graceful_shutdown": config.shutdown_timeout},
+        )
 
 
 if __name__ == "__main__":
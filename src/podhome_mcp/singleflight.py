@@ -0,0 +1,32 @@
+"""PodHome MCP Server - Request Coalescing Module."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Coalesce concurrent identical calls into one in-flight execution.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task and receive the same result (or
+    exception). Cancelling one waiter does not cancel the shared work.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn()`` unless a call for ``key`` is already in flight, then share it."""
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
@@ -0,0 +1,371 @@
+"""PodHome MCP Server - S3/R2 Media Storage Module."""
+
+import asyncio
+import importlib.util
+import io
+import logging
+import math
+import mimetypes
+import os
+import time
+from typing import Any
+from urllib.parse import quote
+
+from .cache import ResponseCache
+from .config import Config
+from .metrics import Metrics, current_tool
+from .profiling import phase
+
+logger = logging.getLogger(__name__)
+
+# S3 rejects multipart parts smaller than this (except the last) and
+# uploads with more than MAX_PARTS parts
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PARTS = 10_000
+
+
+def storage_available() -> bool:
+    """Return True if the optional ``boto3`` package needed for storage is installed."""
+    return importlib.util.find_spec("boto3") is not None
+
+
+class FileSlice(io.RawIOBase):
+    """Seekable read-only view of ``length`` bytes of a file starting at ``offset``.
+
+    Multipart uploads read each part through its own slice, so botocore
+    streams it from disk in small chunks instead of the whole part being
+    loaded into memory.
+    """
+
+    def __init__(self, path: str, offset: int, length: int):
+        """Open ``path`` and expose the byte range ``[offset, offset + length)``."""
+        self._fd = os.open(path, os.O_RDONLY)
+        self._offset = offset
+        self._length = length
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += self._length
+        self._pos = min(max(pos, 0), self._length)
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        remaining = self._length - self._pos
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        data = os.pread(self._fd, size, self._offset + self._pos)
+        self._pos += len(data)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            os.close(self._fd)
+        super().close()
+
+
+class MediaStorage:
+    """Upload and resolve media files in an S3-compatible bucket such as Cloudflare R2.
+
+    boto3 is blocking, so every request runs in a worker thread. Large files
+    are uploaded as concurrent multipart parts read straight from disk, and
+    ``HeadObject`` results are cached so repeated URL lookups for the same
+    object don't hit the storage API.
+    """
+
+    def __init__(
+        self,
+        s3: Any,
+        *,
+        endpoint_url: str | None = None,
+        account_id: str | None = None,
+        public_domain: str | None = None,
+        default_bucket: str | None = None,
+        part_size: int = 16 * 1024 * 1024,
+        concurrency: int = 4,
+        presign_expiry: int = 3600,
+        head_cache: ResponseCache | None = None,
+        metrics: Metrics | None = None,
+    ):
+        """Initialize storage around a boto3 S3 client.
+
+        Args:
+            s3: boto3 S3 client
+            endpoint_url: S3 endpoint, used for path-style public URLs
+            account_id: Cloudflare account ID, used for R2 public URLs
+            public_domain: Custom domain serving the bucket publicly
+            default_bucket: Bucket used when a call doesn't name one
+            part_size: Multipart part size in bytes (at least 5 MiB)
+            concurrency: Parts uploaded concurrently per file
+            presign_expiry: Lifetime of presigned URLs in seconds
+            head_cache: Optional cache for ``HeadObject`` metadata
+            metrics: Optional metrics registry for request timings
+        """
+        self.s3 = s3
+        self.endpoint_url = endpoint_url
+        self.account_id = account_id
+        self.public_domain = public_domain
+        self.default_bucket = default_bucket
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.concurrency = max(concurrency, 1)
+        self.presign_expiry = presign_expiry
+        self.head_cache = head_cache
+        self.metrics = metrics
+
+    @classmethod
+    def from_config(cls, config: Config, metrics: Metrics | None = None) -> "MediaStorage":
+        """Build storage from the Cloudflare R2 / S3 settings in ``config``.
+
+        Raises:
+            ValueError: If no endpoint or credentials are configured.
+            RuntimeError: If boto3 is not installed.
+        """
+        endpoint = config.s3_endpoint_url
+        if endpoint is None and config.cloudflare_account_id:
+            endpoint = f"https://{config.cloudflare_account_id}.r2.cloudflarestorage.com"
+        if endpoint is None or config.r2_access_key_id is None or config.r2_secret_access_key is None:
+            raise ValueError(
+                "Storage is not configured: set CLOUDFLARE_ACCOUNT_ID (or PODHOME_S3_ENDPOINT_URL), "
+                "CLOUDFLARE_R2_ACCESS_KEY_ID and CLOUDFLARE_R2_SECRET_ACCESS_KEY"
+            )
+        if not storage_available():
+            raise RuntimeError("Storage needs boto3: install podhome-mcp[storage]")
+
+        # No stubs; the client is held as Any
+        import boto3  # type: ignore[import-untyped]
+        from botocore.config import Config as BotoConfig  # type: ignore[import-untyped]
+
+        s3 = boto3.client(
+            "s3",
+            endpoint_url=endpoint,
+            region_name=config.s3_region,
+            aws_access_key_id=config.r2_access_key_id,
+            aws_secret_access_key=config.r2_secret_access_key.get_secret_value(),
+            config=BotoConfig(
+                signature_version="s3v4",
+                max_pool_connections=max(config.upload_concurrency, 10),
+                retries={"max_attempts": config.max_retries + 1, "mode": "adaptive"},
+            ),
+        )
+        return cls(
+            s3,
+            endpoint_url=endpoint,
+            account_id=config.cloudflare_account_id,
+            public_domain=config.r2_public_domain,
+            default_bucket=config.storage_bucket,
+            part_size=config.upload_part_size,
+            concurrency=config.upload_concurrency,
+            presign_expiry=config.presign_expiry,
+            head_cache=(
+                ResponseCache(config.head_cache_ttl, 1024)
+                if config.head_cache_ttl > 0
+                else None
+            ),
+            metrics=metrics,
+        )
+
+    # ========== Requests ==========
+
+    async def _call(self, operation: str, **kwargs) -> Any:
+        """Run one S3 API call in a worker thread, recording its latency."""
+        start = time.perf_counter()
+        outcome = "error"
+        try:
+            with phase("storage"):
+                result = await asyncio.to_thread(getattr(self.s3, operation), **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            if self.metrics is not None:
+                labels: dict[str, Any] = {"operation": operation, "tool": current_tool.get()}
+                self.metrics.observe(
+                    "podhome_storage_request_duration_seconds",
+                    time.perf_counter() - start,
+                    **labels,
+                )
+                self.metrics.inc("podhome_storage_requests_total", outcome=outcome, **labels)
+
+    def _bucket(self, bucket: str | None) -> str:
+        bucket = bucket or self.default_bucket
+        if not bucket:
+            raise ValueError("No bucket given and PODHOME_STORAGE_BUCKET is not set")
+        return bucket
+
+    async def head(self, object_key: str, bucket: str | None = None) -> dict:
+        """Return size, last-modified time, ETag and content type of an object.
+
+        Raises:
+            FileNotFoundError: If the object does not exist.
+        """
+        bucket = self._bucket(bucket)
+        key = (bucket, object_key)
+        if self.head_cache is not None:
+            entry, fresh = self.head_cache.lookup(key)
+            if entry is not None and fresh:
+                return entry.value
+        try:
+            r = await self._call("head_object", Bucket=bucket, Key=object_key)
+        except Exception as e:
+            code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if code in ("404", "NoSuchKey", "NotFound"):
+                raise FileNotFoundError(f"Object not found: {bucket}/{object_key}") from e
+            raise
+        meta = {
+            "bucket": bucket,
+            "object_key": object_key,
+            "size_bytes": r["ContentLength"],
+            "last_modified": r["LastModified"].isoformat(),
+            "etag": r.get("ETag"),
+            "content_type": r.get("ContentType"),
+        }
+        if self.head_cache is not None:
+            self.head_cache.put(key, meta)
+        return meta
+
+    async def upload(
+        self,
+        path: str,
+        object_key: str | None = None,
+        bucket: str | None = None,
+        content_type: str | None = None,
+    ) -> dict:
+        """Upload a local file and return its object metadata.
+
+        Files larger than one part are sent as a multipart upload with up to
+        ``concurrency`` parts in flight; a failed multipart upload is aborted.
+        """
+        bucket = self._bucket(bucket)
+        object_key = object_key or os.path.basename(path)
+        size = os.path.getsize(path)
+        content_type = content_type or mimetypes.guess_type(path)[0] or "application/octet-stream"
+        part_size = max(self.part_size, math.ceil(size / MAX_PARTS))
+
+        if size <= part_size:
+            with open(path, "rb") as body:
+                await self._call(
+                    "put_object",
+                    Bucket=bucket,
+                    Key=object_key,
+                    Body=body,
+                    ContentType=content_type,
+                )
+        else:
+            await self._upload_multipart(path, bucket, object_key, size, part_size, content_type)
+        logger.info("Uploaded %s to %s/%s (%d bytes)", path, bucket, object_key, size)
+
+        if self.head_cache is not None:
+            self.head_cache.discard((bucket, object_key))
+        return await self.head(object_key, bucket)
+
+    async def _upload_multipart(
+        self,
+        path: str,
+        bucket: str,
+        object_key: str,
+        size: int,
+        part_size: int,
+        content_type: str,
+    ) -> None:
+        upload = await self._call(
+            "create_multipart_upload", Bucket=bucket, Key=object_key, ContentType=content_type
+        )
+        upload_id = upload["UploadId"]
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def send_part(number: int) -> dict:
+            offset = (number - 1) * part_size
+            async with slots:
+                with FileSlice(path, offset, min(part_size, size - offset)) as body:
+                    r = await self._call(
+                        "upload_part",
+                        Bucket=bucket,
+                        Key=object_key,
+                        UploadId=upload_id,
+                        PartNumber=number,
+                        Body=body,
+                        ContentLength=len(body),
+                    )
+            return {"PartNumber": number, "ETag": r["ETag"]}
+
+        try:
+            parts = await asyncio.gather(
+                *(send_part(n) for n in range(1, math.ceil(size / part_size) + 1))
+            )
+            await self._call(
+                "complete_multipart_upload",
+                Bucket=bucket,
+                Key=object_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": list(parts)},
+            )
+        except BaseException:
+            logger.warning("Aborting multipart upload of %s/%s", bucket, object_key)
+            await self._call(
+                "abort_multipart_upload", Bucket=bucket, Key=object_key, UploadId=upload_id
+            )
+            raise
+
+    # ========== URLs ==========
+
+    def public_url(
+        self, object_key: str, bucket: str | None = None, custom_domain: str | None = None
+    ) -> str:
+        """Return the public URL of an object.
+
+        Uses the custom domain if one is set, otherwise the R2 bucket host
+        for the configured account, otherwise a path-style endpoint URL.
+        """
+        bucket = self._bucket(bucket)
+        path = quote(object_key)
+        domain = custom_domain or self.public_domain
+        if domain:
+            domain = domain.removeprefix("https://").removeprefix("http://").rstrip("/")
+            return f"https://{domain}/{path}"
+        if self.account_id:
+            return f"https://{bucket}.{self.account_id}.r2.cloudflarestorage.com/{path}"
+        return f"{(self.endpoint_url or '').rstrip('/')}/{bucket}/{path}"
+
+    async def presigned_url(
+        self, object_key: str, bucket: str | None = None, expires: int | None = None
+    ) -> str:
+        """Return a time-limited GET URL for an object in a private bucket."""
+        return await asyncio.to_thread(
+            self.s3.generate_presigned_url,
+            "get_object",
+            Params={"Bucket": self._bucket(bucket), "Key": object_key},
+            ExpiresIn=expires or self.presign_expiry,
+        )
+
+    async def resolve(
+        self,
+        object_key: str,
+        bucket: str | None = None,
+        custom_domain: str | None = None,
+        presign: bool = False,
+    ) -> dict:
+        """Check that an object exists and return its metadata with a ``public_url``."""
+        meta = await self.head(object_key, bucket)
+        if presign:
+            url = await self.presigned_url(object_key, meta["bucket"])
+        else:
+            url = self.public_url(object_key, meta["bucket"], custom_domain)
+        return {"public_url": url, **meta}
@@ -0,0 +1,271 @@
+"""PodHome MCP Server - Persistent Episode Store Module."""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from .codec import loads
+from .profiling import phase
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS episode_lists (
+    client TEXT NOT NULL,
+    params TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (client, params)
+)
+"""
+
+
+@dataclass
+class StoredList:
+    """An episode list read back from the store."""
+
+    value: Any
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def age(self, now: float | None = None) -> float:
+        """Seconds since the response was fetched or last revalidated."""
+        return (time.time() if now is None else now) - self.fetched_at
+
+
+class EpisodeStore:
+    """SQLite-backed second-level cache for ``/api/episodes`` responses.
+
+    Each response is stored per client (an opaque per-API-key ID) and filter
+    combination together with its validators and fetch time, so a restarted
+    process, or a parallel stdio process, starts from warm data. Rows older
+    than ``max_age`` are ignored. Bodies are stored as received, compressed
+    in a worker thread. Writes are queued and committed together in one
+    transaction every ``flush_interval`` seconds; reads see queued writes.
+    The database uses WAL mode so several processes can share it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float = 60.0,
+        max_age: float = 86400.0,
+        flush_interval: float = 0.5,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Open (creating if needed) the store at ``path``.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds a stored response is served without contacting the API
+            max_age: Seconds after which a stored response is no longer used
+            flush_interval: Seconds queued writes wait before being committed
+            clock: Wall-clock time source shared across processes (overridable for tests)
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.ttl = ttl
+        self.max_age = max_age
+        self.flush_interval = flush_interval
+        self._clock = clock
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("PRAGMA busy_timeout=5000")
+        self._db.execute(SCHEMA)
+        self._lock = threading.Lock()
+        # Queued writes, (client, params) -> row, revalidation times,
+        # (client, params) -> fetched_at, and clients to clear; the batch
+        # being committed is kept visible to reads until it lands
+        self._pending: dict[tuple[str, str], tuple] = {}
+        self._touched: dict[tuple[str, str], float] = {}
+        self._cleared: set[str] = set()
+        self._flushing: tuple[set[str], dict, dict] = (set(), {}, {})
+        # Clears per client, so a put compressed across a clear is dropped
+        self._clears: Counter[str] = Counter()
+        self._flush_task: asyncio.Task | None = None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.flushes = 0
+
+    @staticmethod
+    def params(key: Hashable) -> str:
+        """Serialize a filter key to the column value used for lookups."""
+        return json.dumps(key, separators=(",", ":"))
+
+    async def get(self, client: str, key: Hashable) -> tuple[StoredList | None, bool]:
+        """Return ``(stored, fresh)`` for a filter key.
+
+        A response older than ``ttl`` is returned as not fresh so its
+        validators can be reused; one older than ``max_age`` is not returned.
+        """
+        params = self.params(key)
+        row: tuple | None = None
+        touched = 0.0
+        batches = ((self._cleared, self._pending, self._touched), self._flushing)
+        for cleared, pending, touches in batches:
+            touched = max(touched, touches.get((client, params), 0.0))
+            if (client, params) in pending:
+                row = pending[(client, params)]
+                break
+            if client in cleared:
+                break
+        else:
+            with phase("store"):
+                row = await asyncio.to_thread(self._select, client, params)
+        if row is None:
+            self.misses += 1
+            return None, False
+        etag, last_modified, fetched_at, body = row
+        fetched_at = max(fetched_at, touched)
+        age = self._clock() - fetched_at
+        if age > self.max_age:
+            self.misses += 1
+            return None, False
+        self.hits += 1
+        value = await asyncio.to_thread(lambda: loads(zlib.decompress(body)))
+        return StoredList(value, fetched_at, etag, last_modified), age < self.ttl
+
+    def _select(self, client: str, params: str) -> tuple | None:
+        with self._lock:
+            return self._db.execute(
+                "SELECT etag, last_modified, fetched_at, body FROM episode_lists"
+                " WHERE client = ? AND params = ?",
+                (client, params),
+            ).fetchone()
+
+    async def put(
+        self,
+        client: str,
+        key: Hashable,
+        content: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Compress a raw JSON response body and queue it for the next flush.
+
+        The write is dropped if the client is cleared while compressing, as
+        the body may then predate a change.
+        """
+        clears = self._clears[client]
+        with phase("store"):
+            body = await asyncio.to_thread(zlib.compress, content, 1)
+        if self._clears[client] != clears:
+            return
+        row = (client, self.params(key))
+        self._pending[row] = (etag, last_modified, self._clock(), body)
+        self._touched.pop(row, None)
+        self._schedule_flush()
+
+    def touch(self, client: str, key: Hashable) -> None:
+        """Record that a stored response was revalidated (HTTP 304) just now.
+
+        Only the fetch time is updated; does nothing if no response is stored.
+        """
+        row = (client, self.params(key))
+        now = self._clock()
+        if row in self._pending:
+            self._pending[row] = (*self._pending[row][:2], now, self._pending[row][3])
+        else:
+            self._touched[row] = now
+        self._schedule_flush()
+
+    def clear(self, client: str) -> None:
+        """Drop every stored response for a client, e.g. after a write."""
+        for queued in (self._pending, self._touched):
+            for row in [k for k in queued if k[0] == client]:
+                del queued[row]
+        self._cleared.add(client)
+        self._clears[client] += 1
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write(*self._take_pending())
+            return
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    def _take_pending(self) -> tuple[set[str], dict, dict]:
+        batch = self._cleared, self._pending, self._touched
+        self._cleared, self._pending, self._touched = set(), {}, {}
+        return batch
+
+    async def flush(self) -> None:
+        """Commit every queued write in a single transaction."""
+        batch = self._take_pending()
+        if any(batch):
+            self._flushing = batch
+            try:
+                await asyncio.to_thread(self._write, *batch)
+            finally:
+                self._flushing = (set(), {}, {})
+
+    def _write(self, cleared: set[str], pending: dict, touched: dict) -> None:
+        if not (cleared or pending or touched):
+            return
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.executemany(
+                    "DELETE FROM episode_lists WHERE client = ?", [(c,) for c in cleared]
+                )
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO episode_lists"
+                    " (client, params, etag, last_modified, fetched_at, body)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    [(client, params, *row) for (client, params), row in pending.items()],
+                )
+                self._db.executemany(
+                    "UPDATE episode_lists SET fetched_at = MAX(fetched_at, ?)"
+                    " WHERE client = ? AND params = ?",
+                    [(at, client, params) for (client, params), at in touched.items()],
+                )
+                self._db.execute(
+                    "DELETE FROM episode_lists WHERE fetched_at < ?",
+                    (self._clock() - self.max_age,),
+                )
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        self.writes += len(pending)
+        self.flushes += 1
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/write counters."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "flushes": self.flushes,
+            "pending": len(self._pending) + len(self._touched),
+        }
+
+    async def aclose(self) -> None:
+        """Flush queued writes and close the database."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        try:
+            await self.flush()
+        finally:
+            with self._lock:
+                self._db.close()
@@ -0,0 +1,134 @@
+"""PodHome MCP Server - Episode Delta Sync Module."""
+
+import base64
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .codec import dumps
+from .index import episode_id
+
+if TYPE_CHECKING:
+    from .client import PodhomeClient
+
+
+def _digest(value: Any) -> bytes:
+    return hashlib.blake2b(dumps(value, sort_keys=True), digest_size=8).digest()
+
+
+@dataclass
+class _Fingerprint:
+    """Content hashes of one episode record: the whole record and each field."""
+
+    record: bytes
+    fields: dict[str, bytes]
+
+
+class EpisodeSync:
+    """Diffs a show's episode list against earlier snapshots identified by tokens.
+
+    A snapshot keeps only content hashes (one per record and one per field),
+    not the records themselves. Its token is derived from those hashes, so an
+    unchanged catalogue always yields the same token. The newest
+    ``max_snapshots`` snapshots are kept; an unknown token means the caller
+    has to start over from a fresh baseline.
+    """
+
+    def __init__(self, client: "PodhomeClient", max_snapshots: int = 32):
+        """Initialize with no snapshots.
+
+        Args:
+            client: Client used to list the show's episodes
+            max_snapshots: Snapshots kept before the oldest is forgotten
+        """
+        self._client = client
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[str, dict[str, _Fingerprint]] = OrderedDict()
+        self._source: list | None = None
+        self._source_token: str | None = None
+
+    def _fingerprint(self, episode: dict, previous: _Fingerprint | None) -> _Fingerprint:
+        record = _digest(episode)
+        if previous is not None and previous.record == record:
+            return previous
+        return _Fingerprint(record, {k: _digest(v) for k, v in episode.items()})
+
+    def snapshot(self, episodes: list[dict]) -> tuple[str, dict[str, dict], dict[str, _Fingerprint]]:
+        """Hash an episode list and remember it; returns ``(token, by_id, fingerprints)``."""
+        latest = next(reversed(self._snapshots.values()), {})
+        by_id = {}
+        prints = {}
+        for episode in episodes:
+            eid = episode_id(episode)
+            if eid is None:
+                continue
+            by_id[eid] = episode
+            prints[eid] = self._fingerprint(episode, latest.get(eid))
+        state = hashlib.blake2b(digest_size=12)
+        for eid in sorted(prints):
+            state.update(eid.encode())
+            state.update(prints[eid].record)
+        token = base64.urlsafe_b64encode(state.digest()).decode()
+        self._snapshots[token] = prints
+        self._snapshots.move_to_end(token)
+        while len(self._snapshots) > self.max_snapshots:
+            self._snapshots.popitem(last=False)
+        return token, by_id, prints
+
+    async def changes(self, since_token: str | None = None) -> dict[str, Any]:
+        """Return what changed since ``since_token`` and a token for the current state.
+
+        The episode list is revalidated with the API on every call; when
+        nothing changed this is a 304 and the previous token is reused.
+
+        Returns:
+            ``{"token", "episodes"}`` for a baseline (no or unknown token,
+            the latter flagged ``reset``), otherwise also ``added`` records,
+            ``removed`` IDs and ``changed`` entries holding the changed
+            field names and their new values.
+        """
+        episodes = await self._client.list_episodes(max_age=0)
+        token = self._source_token
+        if episodes is self._source and token is not None and token in self._snapshots:
+            self._snapshots.move_to_end(token)
+            if since_token == token:
+                return {"token": token, "added": [], "removed": [], "changed": []}
+            current = self._snapshots[token]
+            by_id = {eid: e for e in episodes if (eid := episode_id(e)) is not None}
+        else:
+            token, by_id, current = self.snapshot(episodes)
+            self._source, self._source_token = episodes, token
+
+        previous = self._snapshots.get(since_token) if since_token else None
+        if previous is None:
+            result: dict[str, Any] = {"token": token, "episodes": len(current)}
+            if since_token:
+                result["reset"] = True
+            return result
+
+        changed = []
+        for eid, fp in current.items():
+            old = previous.get(eid)
+            if old is None or old.record == fp.record:
+                continue
+            names = sorted(
+                {k for k, h in fp.fields.items() if old.fields.get(k) != h}
+                | (old.fields.keys() - fp.fields.keys())
+            )
+            if not names:
+                continue
+            episode = by_id[eid]
+            changed.append(
+                {
+                    "episode_id": eid,
+                    "fields": names,
+                    "values": {k: episode.get(k) for k in names},
+                }
+            )
+        return {
+            "token": token,
+            "added": [by_id[eid] for eid in current if eid not in previous],
+            "removed": [eid for eid in previous if eid not in current],
+            "changed": changed,
+        }
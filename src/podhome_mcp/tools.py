@@ -1,29 +1,123 @@
 """PodHome MCP Server - Tool Definitions."""
 
+import asyncio
 import logging
-from typing import Annotated, Any
+import os
+import time
+from typing import TYPE_CHECKING, Annotated, Any, Iterable
 
-from fastmcp import FastMCP
-
-from .client import PodhomeClient
+from .analytics import DEFAULT_PERCENTILES, download_stats as summarize_downloads
+from .bulk import run_bulk
+from .client import ClientRegistry
 from .config import Config
+from .fanout import fan_out, resolve_shows, single_show
+from .images import CoverImage, prepare_image
+from .index import DEFAULT_FIELDS
+from .jobs import ready_when
+from .jsonstream import take_page
+from .metrics import instrument
+from .output import render, select
+from .profiling import phase, profile_middleware, profiled
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
 
 
-def register_tools(mcp: FastMCP, config: Config):
-    """Register all MCP tools with the server."""
+def register_tools(
+    mcp: "FastMCP", config: Config, registry: ClientRegistry | None = None
+) -> ClientRegistry:
+    """Register all MCP tools with the server.
+
+    Tools share the long-lived per-show clients held by ``registry``; the
+    caller owns the registry and is responsible for closing it on shutdown.
+    """
+    if registry is None:
+        registry = ClientRegistry(config)
+
+    def tool(fn):
+        """Register ``fn`` as an MCP tool, recording its latency and outcome."""
+        return mcp.tool()(instrument(profiled(fn), registry.metrics, config.shows))
+
+    mcp.add_middleware(profile_middleware(registry.profiler, {"profile_next_calls"}))
+
+    def _render(
+        data: Any,
+        fields: Iterable[str] | None = None,
+        max_field_chars: int | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Render a result as compact JSON using the configured output budget."""
+        if max_field_chars is None:
+            max_field_chars = config.output_max_field_chars
+        with phase("render"):
+            return render(
+                data,
+                fields=fields,
+                max_field_chars=max_field_chars,
+                max_bytes=config.output_max_bytes,
+                **kwargs,
+            )
 
     # ========== Utility Tools ==========
 
-    @mcp.tool()
+    @tool
     def list_shows() -> str:
         """List all configured Podhome show slugs."""
-        return "\n".join(config.shows.keys())
+        return _render(list(config.shows))
+
+    @tool
+    def cache_stats() -> str:
+        """Show episode cache hit/miss and request coalescing counters for each show with a warm client."""
+        return _render(registry.cache_stats())
+
+    @tool
+    def server_stats() -> str:
+        """Show per-tool and per-endpoint latency percentiles, status codes, bytes transferred, retries, cache/store counters and warm-up refresh state."""
+        if config.metrics_file:
+            registry.metrics.write_prometheus(config.metrics_file)
+        stats = {**registry.metrics.summary(), "cache": registry.cache_stats()}
+        if registry.store is not None:
+            stats["store"] = registry.store.stats()
+        if registry.warmup is not None:
+            stats["warmup"] = registry.warmup.stats()
+        return _render(stats)
+
+    @tool
+    def profile_next_calls(
+        n: Annotated[int, "Number of upcoming tool calls to profile (0 to stop)"] = 10,
+        threshold_ms: Annotated[float, "Only keep profiles of calls at least this slow"] = 0,
+    ) -> str:
+        """
+        Profile the next ``n`` tool calls and report where their time went.
+
+        Each profiled call at least ``threshold_ms`` long is written to
+        PODHOME_PROFILE_DIR as a collapsed-stack ``.folded`` file (for
+        flamegraph.pl or speedscope) plus a ``.json`` summary with per-phase
+        timings: http, stream (streamed listings), decode, render, store,
+        storage, fastmcp (argument validation and result conversion) and
+        tool_other. Phases of concurrent requests are summed. Returns the
+        summaries of the most recent captures.
+
+        Args:
+            n: Number of upcoming tool calls to profile (0 to stop)
+            threshold_ms: Only keep profiles of calls at least this slow
+        """
+        profiler = registry.profiler
+        profiler.arm(n, threshold_ms / 1000)
+        return _render(
+            {
+                "armed": profiler.armed,
+                "directory": profiler.directory,
+                "recent": profiler.captures,
+            },
+            max_field_chars=0,
+        )
 
     # ========== Episode Tools ==========
 
-    @mcp.tool()
+    @tool
     async def create_episode(
         show: str,
         file_url: str,
@@ -54,7 +148,7 @@ def register_tools(mcp: FastMCP, config: Config):
             enhance_audio: Run audio enhancement (paid feature)
         """
         try:
-            client = PodhomeClient(config.get_api_key(show), config.base_url)
+            client = registry.get(show)
             payload: dict[str, Any] = {"file_url": file_url, "title": title}
             if description is not None:
                 payload["description"] = description
@@ -74,48 +168,261 @@ def register_tools(mcp: FastMCP, config: Config):
                 payload["enhance_audio"] = enhance_audio
 
             result = await client.create_episode(payload)
-            await client.aclose()
-            return str(result)
+            return _render(result)
         except Exception as e:
             logger.error("create_episode failed for %s: %s", show, e, exc_info=True)
             return f"Error: {e}"
 
-    @mcp.tool()
+    @tool
     async def list_episodes(
-        show: str,
+        show: Annotated[str | list[str], "Show slug, list of slugs, or \"*\" for all shows"],
         status: Annotated[int | None, "Status filter: 0=Draft, 1=Scheduled, 2=Published, 3=LivePending, 4=Live, 5=LiveEnded"] = None,
         include_transcript: Annotated[bool | None, "Include transcript in response"] = None,
         include_chapters: Annotated[bool | None, "Include chapters in response"] = None,
         include_downloads: Annotated[bool | None, "Include download counts"] = None,
         include_people: Annotated[bool | None, "Include people in response"] = None,
+        offset: Annotated[int, "Number of episodes to skip"] = 0,
+        max_items: Annotated[int | None, "Maximum number of episodes to return"] = None,
+        fields: Annotated[list[str] | None, "Episode fields to return (default: all)"] = None,
+        max_field_chars: Annotated[int | None, "Truncate longer text fields (0 = no limit)"] = None,
     ) -> str:
         """
-        List episodes for a specific show.
+        List episodes for one show, several shows, or all shows ("*").
+
+        When several shows are selected they are queried concurrently and
+        every episode is tagged with its ``show``; shows that fail or time out
+        are listed under ``errors`` instead of failing the call.
+
+        When transcripts are requested the response is streamed and paged: at
+        most ``max_items`` episodes (default PODHOME_LIST_PAGE_SIZE) are
+        returned along with the offset of the next page.
 
         Args:
-            show: One of the slugs configured in PODHOME_SHOWS
+            show: A slug configured in PODHOME_SHOWS, a list of slugs, or "*"
             status: Optional status filter (0-5)
             include_transcript: Include transcript in response
             include_chapters: Include chapters in response
             include_downloads: Include download counts
             include_people: Include people in response
+            offset: Number of episodes to skip
+            max_items: Maximum number of episodes to return
+            fields: Episode fields to return, e.g. ["episode_id", "title"] (default: all)
+            max_field_chars: Truncate longer text fields such as descriptions (0 = no limit)
         """
         try:
-            client = PodhomeClient(config.get_api_key(show), config.base_url)
-            result = await client.list_episodes(
+            filters: dict[str, Any] = dict(
                 status=status,
                 include_transcript=include_transcript,
                 include_chapters=include_chapters,
                 include_downloads=include_downloads,
                 include_people=include_people,
             )
-            await client.aclose()
-            return str(result)
+            limit = max_items
+            if include_transcript and limit is None:
+                limit = config.list_page_size
+
+            slug = single_show(show)
+            if slug is not None:
+                client = registry.get(slug)
+                if include_transcript:
+                    page, more = await take_page(
+                        client.iter_episodes(**filters), offset, limit
+                    )
+                    registry.transcripts(slug).add_episodes(page)
+                    return _render(
+                        page,
+                        fields,
+                        max_field_chars,
+                        key="episodes",
+                        offset=offset,
+                        meta={"next_offset": offset + len(page) if more else None},
+                    )
+                result = await client.list_episodes(**filters)
+                errors: dict[str, str] = {}
+            else:
+                # Each show only needs to supply enough episodes to fill the page
+                want = None if limit is None else offset + limit + 1
+
+                async def fetch(slug: str) -> list:
+                    client = registry.get(slug)
+                    if include_transcript:
+                        page, _ = await take_page(
+                            client.iter_episodes(**filters), 0, want
+                        )
+                        return page
+                    return await client.list_episodes(**filters)
+
+                result, errors = await fan_out(
+                    resolve_shows(config, show), fetch, config.fanout_timeout
+                )
+                if fields is not None:
+                    fields = ["show", *fields]
+
+            end = len(result) if limit is None else offset + limit
+            return _render(
+                result[offset:end],
+                fields,
+                max_field_chars,
+                key="episodes",
+                offset=offset,
+                meta={
+                    "next_offset": end if end < len(result) else None,
+                    "errors": errors or None,
+                },
+            )
         except Exception as e:
             logger.error("list_episodes failed for %s: %s", show, e, exc_info=True)
             return f"Error: {e}"
 
-    @mcp.tool()
+    @tool
+    async def get_episode(
+        show: str,
+        episode_id: str,
+        fields: Annotated[list[str] | None, "Episode fields to return (default: all)"] = None,
+        max_field_chars: Annotated[int | None, "Truncate longer text fields (0 = no limit)"] = None,
+    ) -> str:
+        """
+        Get a single episode by ID from the local episode index.
+
+        Args:
+            show: One of the slugs configured in PODHOME_SHOWS
+            episode_id: ID of the episode
+            fields: Episode fields to return, e.g. ["title", "status"] (default: all)
+            max_field_chars: Truncate longer text fields such as descriptions (0 = no limit)
+        """
+        try:
+            index = await registry.index(show).refresh()
+            episode = index.get(episode_id)
+            if episode is None:
+                return f"Error: Episode not found: {episode_id}"
+            return _render(episode, fields, max_field_chars)
+        except Exception as e:
+            logger.error("get_episode failed for %s: %s", show, e, exc_info=True)
+            return f"Error: {e}"
+
+    @tool
+    async def find_episodes(
+        show: str,
+        status: Annotated[int | None, "Status filter: 0=Draft, 1=Scheduled, 2=Published, 3=LivePending, 4=Live, 5=LiveEnded"] = None,
+        season_nr: Annotated[int | None, "Season number"] = None,
+        episode_nr: Annotated[int | None, "Episode number"] = None,
+        published_after: Annotated[str | None, "Inclusive lower bound on publish date (ISO-8601)"] = None,
+        published_before: Annotated[str | None, "Inclusive upper bound on publish date (ISO-8601)"] = None,
+        fields: Annotated[list[str] | None, "Episode fields to return"] = None,
+        offset: Annotated[int, "Number of episodes to skip"] = 0,
+        max_items: Annotated[int | None, "Maximum number of episodes to return"] = None,
+        max_field_chars: Annotated[int | None, "Truncate longer text fields (0 = no limit)"] = None,
+    ) -> str:
+        """
+        Find episodes by status, number or publish date using the local episode index.
+
+        Results are newest first and contain only a few summary fields unless
+        ``fields`` is given.
+
+        Args:
+            show: One of the slugs configured in PODHOME_SHOWS
+            status: Optional status filter (0-5)
+            season_nr: Season number
+            episode_nr: Episode number
+            published_after: Inclusive lower bound on publish date (ISO-8601)
+            published_before: Inclusive upper bound on publish date (ISO-8601)
+            fields: Episode fields to return (default: id, title, status, date, numbers)
+            offset: Number of episodes to skip
+            max_items: Maximum number of episodes to return
+            max_field_chars: Truncate longer text fields such as descriptions (0 = no limit)
+        """
+        try:
+            index = await registry.index(show).refresh()
+            episodes = index.find(
+                status=status,
+                season_nr=season_nr,
+                episode_nr=episode_nr,
+                published_after=published_after,
+                published_before=published_before,
+            )
+            end = len(episodes) if max_items is None else offset + max_items
+            return _render(
+                episodes[offset:end],
+                fields or DEFAULT_FIELDS,
+                max_field_chars,
+                key="episodes",
+                offset=offset,
+                meta={"next_offset": end if end < len(episodes) else None},
+            )
+        except Exception as e:
+            logger.error("find_episodes failed for %s: %s", show, e, exc_info=True)
+            return f"Error: {e}"
+
+    @tool
+    async def sync_episodes(
+        show: str,
+        since_token: Annotated[str | None, "Token from the previous call (omit to start)"] = None,
+        fields: Annotated[list[str] | None, "Fields of added episodes to return"] = None,
+        max_field_chars: Annotated[int | None, "Truncate longer text fields (0 = no limit)"] = None,
+    ) -> str:
+        """
+        Report which episodes were added, removed or changed since a previous call.
+
+        Call once without ``since_token`` to get a starting token, then pass
+        the latest token on each call. Changed episodes list the names and
+        new values of the fields that changed; unchanged episodes are not
+        returned. If the token has expired the response has ``reset: true``
+        and a new starting token.
+
+        Args:
+            show: One of the slugs configured in PODHOME_SHOWS
+            since_token: Token from the previous call (omit to start)
+            fields: Fields of added episodes to return (default: id, title, status, date, numbers)
+            max_field_chars: Truncate longer text fields such as descriptions (0 = no limit)
+        """
+        try:
+            result = await registry.sync(show).changes(since_token)
+            if "added" in result:
+                result["added"] = [select(e, fields or DEFAULT_FIELDS) for e in result["added"]]
+            return _render(result, max_field_chars=max_field_chars)
+        except Exception as e:
+            logger.error("sync_episodes failed for %s: %s", show, e, exc_info=True)
+            return f"Error: {e}"
+
+    @tool
+    async def search_transcripts(
+        show: str,
+        query: str,
+        limit: Annotated[int, "Maximum number of episodes to return"] = 10,
+        max_field_chars: Annotated[int | None, "Truncate longer text fields (0 = no limit)"] = None,
+    ) -> str:
+        """
+        Search episode transcripts and return the best-matching episodes.
+
+        Each hit has the episode ID, title, a relevance score and up to three
+        matching transcript segments with ``start``/``end`` times in seconds,
+        which can be passed straight to ``create_clip``. Times are null when
+        the transcript has no timing information. The search index is kept
+        locally and only re-indexes episodes whose transcript changed.
+
+        Args:
+            show: One of the slugs configured in PODHOME_SHOWS
+            query: Words to search for
+            limit: Maximum number of episodes to return
+            max_field_chars: Truncate longer text fields such as segment text (0 = no limit)
+        """
+        try:
+            index = await registry.transcripts(show).refresh()
+            hits = index.search(query, limit)
+            return _render(
+                hits,
+                max_field_chars=max_field_chars,
+                key="hits",
+                meta={
+                    "indexed_episodes": len(index),
+                    "unavailable": sorted(index.failed) or None,
+                },
+            )
+        except Exception as e:
+            logger.error("search_transcripts failed for %s: %s", show, e, exc_info=True)
+            return f"Error: {e}"
+
+    @tool
     async def schedule_episode(
         show: str,
         episode_id: str,
@@ -132,7 +439,7 @@ def register_tools(mcp: FastMCP, config: Config):
             publish_date: Future UTC ISO-8601 publish date
         """
         try:
-            client = PodhomeClient(config.get_api_key(show), config.base_url)
+            client = registry.get(show)
             payload: dict[str, Any] = {"episode_id": episode_id}
             if publish_now is not None:
                 payload["publish_now"] = publish_now
@@ -140,13 +447,12 @@ def register_tools(mcp: FastMCP, config: Config):
                 payload["publish_date"] = publish_date
 
             result = await client.schedule_episode(payload)
-            await client.aclose()
-            return str(result)
+            return _render(result)
         except Exception as e:
             logger.error("schedule_episode failed for %s: %s", show, e, exc_info=True)
             return f"Error: {e}"
 
-    @mcp.tool()
+    @tool
     async def modify_episode(
         show: str,
         episode_id: str,
@@ -156,10 +462,17 @@ def register_tools(mcp: FastMCP, config: Config):
         season_nr: Annotated[int | None, "Season number (must be > 0)"] = None,
         image_url: Annotated[str | None, "Image URL (public HTTP/HTTPS)"] = None,
         image_data: Annotated[str | None, "Base64 encoded image data"] = None,
+        image_path: Annotated[str | None, "Local image file to upload (preferred over image_data)"] = None,
     ) -> str:
         """
         Modify an episode's metadata.
 
+        Prefer image_path over image_data for cover art: the file is read
+        on the server, downscaled and recompressed if it exceeds
+        PODHOME_IMAGE_MAX_DIMENSION or PODHOME_IMAGE_MAX_BYTES, and streamed
+        to Podhome instead of passing base64 through the tool arguments.
+        The file must be under PODHOME_MEDIA_ROOT, which must be set.
+
         Args:
             show: One of the slugs configured in PODHOME_SHOWS
             episode_id: ID of the episode to modify
@@ -169,9 +482,13 @@ def register_tools(mcp: FastMCP, config: Config):
             season_nr: Season number
             image_url: Image URL
             image_data: Base64 encoded image data
+            image_path: Local JPEG, PNG or (with Pillow) other image file
         """
+        image = None
         try:
-            client = PodhomeClient(config.get_api_key(show), config.base_url)
+            if image_data is not None and image_path is not None:
+                raise ValueError("Pass either image_data or image_path, not both")
+            client = registry.get(show)
             payload: dict[str, Any] = {"episode_id": episode_id}
             if title is not None:
                 payload["title"] = title
@@ -185,17 +502,136 @@ def register_tools(mcp: FastMCP, config: Config):
                 payload["image_url"] = image_url
             if image_data is not None:
                 payload["image_data"] = image_data
+            if image_path is not None:
+                image = await _load_image(image_path)
 
-            result = await client.modify_episode(payload)
-            await client.aclose()
-            return str(result)
+            result = await client.modify_episode(payload, image=image)
+            if image is not None and isinstance(result, dict):
+                result = {**result, "image": image.summary()}
+            return _render(result)
         except Exception as e:
             logger.error("modify_episode failed for %s: %s", show, e, exc_info=True)
             return f"Error: {e}"
+        finally:
+            if image is not None:
+                image.close()
+
+    @tool
+    async def wait_for_episode(
+        show: str,
+        episode_id: str,
+        status: Annotated[list[int | str] | None, "Target statuses, e.g. [2] or [\"Published\"] (default: any)"] = None,
+        require_fields: Annotated[list[str] | None, "Fields that must be non-empty, e.g. [\"enclosure_url\", \"duration\"]"] = None,
+        timeout: Annotated[float | None, "Seconds to wait (default PODHOME_EPISODE_WAIT_TIMEOUT)"] = None,
+        fields: Annotated[list[str] | None, "Episode fields to return"] = None,
+    ) -> str:
+        """
+        Wait until an episode reaches a target status or has the given fields set.
+
+        Use after create_episode with use_podhome_ai or enhance_audio instead
+        of calling list_episodes repeatedly. The server polls in the
+        background with exponential backoff and jitter, answering every
+        episode being waited on for a show with one request per poll, and
+        polls at once when a webhook arrives. With neither ``status`` nor
+        ``require_fields`` it returns as soon as the episode is listed.
+
+        Returns ``{"reached": ..., "episode": ..., "polls": ..., "elapsed": ...}``;
+        on timeout ``reached`` is false and ``episode`` is the latest record seen.
+
+        Args:
+            show: One of the slugs configured in PODHOME_SHOWS
+            episode_id: ID of the episode to wait for
+            status: Target statuses as numbers (0-5) or names (default: any)
+            require_fields: Fields that must be non-empty, e.g. ["enclosure_url", "duration"]
+            timeout: Seconds to wait (default PODHOME_EPISODE_WAIT_TIMEOUT)
+            fields: Episode fields to return (default: id, title, status, date, numbers)
+        """
+        try:
+            start = time.perf_counter()
+            episode, reached, info = await registry.tracker(show).wait(
+                episode_id,
+                ready_when(status, require_fields),
+                config.episode_wait_timeout if timeout is None else timeout,
+            )
+            if fields is None:
+                fields = [*DEFAULT_FIELDS, *(require_fields or ())]
+            result = {
+                "reached": reached,
+                "episode": select(episode, fields),
+                "polls": info["polls"],
+                "elapsed": round(time.perf_counter() - start, 3),
+            }
+            if info["error"] is not None:
+                result["error"] = info["error"]
+            return _render(result)
+        except Exception as e:
+            logger.error("wait_for_episode failed for %s: %s", show, e, exc_info=True)
+            return f"Error: {e}"
+
+    # ========== Analytics Tools ==========
+
+    @tool
+    async def download_stats(
+        show: Annotated[str | list[str], "Show slug, list of slugs, or \"*\" for all shows"],
+        status: Annotated[int | None, "Status filter: 0=Draft, 1=Scheduled, 2=Published, 3=LivePending, 4=Live, 5=LiveEnded"] = 2,
+        top_n: Annotated[int, "Number of most-downloaded episodes to list"] = 10,
+        percentiles: Annotated[list[float] | None, "Percentiles of per-episode downloads (default: 50, 90, 99)"] = None,
+        window: Annotated[int, "Episodes per window for the recent growth rate"] = 10,
+    ) -> str:
+        """
+        Summarize episode download counts for one show, several shows, or all shows ("*").
+
+        Returns totals, mean and percentiles of per-episode downloads, the
+        ``top_n`` episodes, per-season totals with season-over-season growth
+        of the mean, and the growth of the mean of the latest ``window``
+        episodes over the ``window`` before them. For several shows there is a
+        summary per show plus one across all of them. Only the summary is
+        returned, never the raw episode list.
+
+        Args:
+            show: A slug configured in PODHOME_SHOWS, a list of slugs, or "*"
+            status: Status filter (default: 2 = Published; null for all episodes)
+            top_n: Number of most-downloaded episodes to list
+            percentiles: Percentiles to compute, e.g. [50, 90, 99]
+            window: Episodes per window for the recent growth rate
+        """
+        try:
+            def summarize(items: list[dict]) -> dict[str, Any]:
+                return summarize_downloads(
+                    items,
+                    top_n=top_n,
+                    percentiles=percentiles or DEFAULT_PERCENTILES,
+                    window=window,
+                )
+
+            async def fetch(slug: str) -> list:
+                return await registry.get(slug).list_episodes(
+                    status=status, include_downloads=True
+                )
+
+            slug = single_show(show)
+            if slug is not None:
+                return _render(summarize(await fetch(slug)))
+
+            shows = resolve_shows(config, show)
+            episodes, errors = await fan_out(shows, fetch, config.fanout_timeout)
+            per_show: dict[str, list] = {slug: [] for slug in shows if slug not in errors}
+            for episode in episodes:
+                per_show[episode["show"]].append(episode)
+            result = {
+                "shows": {slug: summarize(items) for slug, items in per_show.items()},
+                "all": summarize(episodes),
+            }
+            if errors:
+                result["errors"] = errors
+            return _render(result)
+        except Exception as e:
+            logger.error("download_stats failed for %s: %s", show, e, exc_info=True)
+            return f"Error: {e}"
 
     # ========== Clip Tools ==========
 
-    @mcp.tool()
+    @tool
     async def create_clip(
         show: str,
         episode_id: str,
@@ -214,7 +650,7 @@ def register_tools(mcp: FastMCP, config: Config):
             duration: Duration in seconds (can be fractional)
         """
         try:
-            client = PodhomeClient(config.get_api_key(show), config.base_url)
+            client = registry.get(show)
             payload = {
                 "episode_id": episode_id,
                 "title": title,
@@ -222,56 +658,280 @@ def register_tools(mcp: FastMCP, config: Config):
                 "duration": duration,
             }
             result = await client.create_clip(payload)
-            await client.aclose()
-            return str(result)
+            return _render(result)
         except Exception as e:
             logger.error("create_clip failed for %s: %s", show, e, exc_info=True)
             return f"Error: {e}"
 
-    # ========== Webhook Tools ==========
+    # ========== Storage Tools ==========
+
+    @tool
+    async def get_r2_public_url(
+        bucket: str,
+        object_key: str,
+        custom_domain: Annotated[str | None, "Override R2_PUBLIC_DOMAIN"] = None,
+        presign: Annotated[bool, "Return a presigned URL for a private bucket"] = False,
+    ) -> str:
+        """
+        Turn an R2/S3 object (e.g. an Auphonic output) into a URL Podhome can fetch.
+
+        Checks that the object exists and returns its size and last-modified
+        time with a ``public_url`` to pass to create_episode as ``file_url``.
+
+        Args:
+            bucket: R2 bucket name (from the Auphonic service preset)
+            object_key: Object path in the bucket, e.g. "podcasts/show/episode-42.mp3"
+            custom_domain: Override R2_PUBLIC_DOMAIN
+            presign: Return a time-limited presigned URL instead (for private buckets)
+        """
+        try:
+            result = await registry.storage().resolve(object_key, bucket, custom_domain, presign)
+            return _render(result)
+        except Exception as e:
+            logger.error("get_r2_public_url failed for %s/%s: %s", bucket, object_key, e, exc_info=True)
+            return f"Error: {e}"
+
+    @tool
+    async def upload_media(
+        path: Annotated[str, "Local path of the audio file"],
+        object_key: Annotated[str | None, "Destination key (default: the file name)"] = None,
+        bucket: Annotated[str | None, "Destination bucket (default: PODHOME_STORAGE_BUCKET)"] = None,
+        content_type: Annotated[str | None, "Content type (default: guessed from the file name)"] = None,
+        custom_domain: Annotated[str | None, "Override R2_PUBLIC_DOMAIN"] = None,
+        presign: Annotated[bool, "Return a presigned URL for a private bucket"] = False,
+    ) -> str:
+        """
+        Upload a local audio file to R2/S3 and return a URL for create_episode.
+
+        Large files are uploaded in parallel multipart chunks streamed from disk.
+        The file must be under PODHOME_MEDIA_ROOT, which must be set.
+
+        Args:
+            path: Local path of the audio file
+            object_key: Destination key (default: the file name)
+            bucket: Destination bucket (default: PODHOME_STORAGE_BUCKET)
+            content_type: Content type (default: guessed from the file name)
+            custom_domain: Override R2_PUBLIC_DOMAIN
+            presign: Return a time-limited presigned URL instead (for private buckets)
+        """
+        try:
+            storage = registry.storage()
+            object_key = object_key or os.path.basename(path)
+            meta = await storage.upload(config.media_path(path), object_key, bucket, content_type)
+            result = await storage.resolve(
+                meta["object_key"], meta["bucket"], custom_domain, presign
+            )
+            return _render(result)
+        except Exception as e:
+            logger.error("upload_media failed for %s: %s", path, e, exc_info=True)
+            return f"Error: {e}"
+
+    # ========== Bulk Tools ==========
+
+    async def _load_image(path: str) -> CoverImage:
+        """Prepare a local cover image under PODHOME_MEDIA_ROOT in a worker thread."""
+        return await asyncio.to_thread(
+            prepare_image,
+            config.media_path(path),
+            config.image_max_dimension,
+            config.image_max_bytes,
+            config.image_quality,
+        )
+
+    async def _bulk(name: str, show: str, method: str, payloads, concurrency, required):
+        """Fan a list of payloads out over one PodhomeClient method."""
+        try:
+            client = registry.get(show)
+            summary = await run_bulk(
+                getattr(client, method),
+                payloads,
+                concurrency or config.bulk_concurrency,
+                required,
+            )
+            return _render(summary)
+        except Exception as e:
+            logger.error("%s failed for %s: %s", name, show, e, exc_info=True)
+            return f"Error: {e}"
+
+    @tool
+    async def create_episodes_bulk(
+        show: str,
+        episodes: Annotated[list[dict[str, Any]], "create_episode payloads (file_url, title, ...)"],
+        concurrency: Annotated[int | None, "Maximum concurrent requests"] = None,
+    ) -> str:
+        """
+        Create many episodes in one call.
+
+        Args:
+            show: One of the slugs configured in PODHOME_SHOWS
+            episodes: List of payloads with the same fields as create_episode
+            concurrency: Maximum concurrent requests (default PODHOME_BULK_CONCURRENCY)
+        """
+        return await _bulk(
+            "create_episodes_bulk", show, "create_episode", episodes, concurrency,
+            ("file_url", "title"),
+        )
+
+    @tool
+    async def modify_episodes_bulk(
+        show: str,
+        episodes: Annotated[list[dict[str, Any]], "modify_episode payloads (episode_id, title, ...)"],
+        concurrency: Annotated[int | None, "Maximum concurrent requests"] = None,
+    ) -> str:
+        """
+        Modify many episodes in one call, e.g. to renumber a season.
+
+        Args:
+            show: One of the slugs configured in PODHOME_SHOWS
+            episodes: List of payloads with the same fields as modify_episode
+            concurrency: Maximum concurrent requests (default PODHOME_BULK_CONCURRENCY)
+        """
+        return await _bulk(
+            "modify_episodes_bulk", show, "modify_episode", episodes, concurrency,
+            ("episode_id",),
+        )
 
-    @mcp.tool()
-    async def list_webhooks(show: str) -> str:
+    @tool
+    async def schedule_episodes_bulk(
+        show: str,
+        episodes: Annotated[list[dict[str, Any]], "schedule_episode payloads (episode_id, publish_now, publish_date)"],
+        concurrency: Annotated[int | None, "Maximum concurrent requests"] = None,
+    ) -> str:
         """
-        List all registered webhooks for a specific show.
+        Schedule or publish many episodes in one call.
 
         Args:
             show: One of the slugs configured in PODHOME_SHOWS
+            episodes: List of payloads with the same fields as schedule_episode
+            concurrency: Maximum concurrent requests (default PODHOME_BULK_CONCURRENCY)
+        """
+        return await _bulk(
+            "schedule_episodes_bulk", show, "schedule_episode", episodes, concurrency,
+            ("episode_id",),
+        )
+
+    @tool
+    async def create_clips_bulk(
+        show: str,
+        clips: Annotated[list[dict[str, Any]], "create_clip payloads (episode_id, title, start_time, duration)"],
+        concurrency: Annotated[int | None, "Maximum concurrent requests"] = None,
+    ) -> str:
+        """
+        Create many clips in one call.
+
+        Args:
+            show: One of the slugs configured in PODHOME_SHOWS
+            clips: List of payloads with the same fields as create_clip
+            concurrency: Maximum concurrent requests (default PODHOME_BULK_CONCURRENCY)
+        """
+        return await _bulk(
+            "create_clips_bulk", show, "create_clip", clips, concurrency,
+            ("episode_id", "title", "start_time", "duration"),
+        )
+
+    @tool
+    async def set_episode_images_bulk(
+        show: str,
+        images: Annotated[list[dict[str, Any]], "Items of {episode_id, image_path}"],
+        concurrency: Annotated[int | None, "Maximum images processed at once"] = None,
+    ) -> str:
+        """
+        Set the cover art of many episodes from local image files, e.g. for a whole season.
+
+        Each file is memory-mapped, downscaled and recompressed in a worker
+        thread if it exceeds PODHOME_IMAGE_MAX_DIMENSION or
+        PODHOME_IMAGE_MAX_BYTES, and streamed to Podhome as image_data.
+        Memory use stays proportional to concurrency, not to the batch.
+        Files must be under PODHOME_MEDIA_ROOT, which must be set.
+
+        Args:
+            show: One of the slugs configured in PODHOME_SHOWS
+            images: Items with episode_id and image_path (a local JPEG, PNG or, with Pillow, other image)
+            concurrency: Maximum images processed at once (default PODHOME_BULK_CONCURRENCY)
         """
         try:
-            client = PodhomeClient(config.get_api_key(show), config.base_url)
-            result = await client.list_webhooks()
-            await client.aclose()
-            return str(result)
+            client = registry.get(show)
+
+            async def apply(item: dict) -> dict:
+                with await _load_image(item["image_path"]) as image:
+                    return await client.modify_episode(
+                        {"episode_id": item["episode_id"]}, image=image
+                    )
+
+            summary = await run_bulk(
+                apply,
+                images,
+                concurrency or config.bulk_concurrency,
+                ("episode_id", "image_path"),
+            )
+            return _render(summary)
+        except Exception as e:
+            logger.error("set_episode_images_bulk failed for %s: %s", show, e, exc_info=True)
+            return f"Error: {e}"
+
+    # ========== Webhook Tools ==========
+
+    @tool
+    async def list_webhooks(
+        show: Annotated[str | list[str], "Show slug, list of slugs, or \"*\" for all shows"],
+    ) -> str:
+        """
+        List all registered webhooks for one show, several shows, or all shows ("*").
+
+        Across several shows every webhook is tagged with its ``show``, and
+        shows that fail or time out are listed under ``errors``.
+
+        Args:
+            show: A slug configured in PODHOME_SHOWS, a list of slugs, or "*"
+        """
+        try:
+            slug = single_show(show)
+            if slug is not None:
+                client = registry.get(slug)
+                result = await client.list_webhooks()
+                return _render(result)
+            webhooks, errors = await fan_out(
+                resolve_shows(config, show),
+                lambda slug: registry.get(slug).list_webhooks(),
+                config.fanout_timeout,
+            )
+            return _render(webhooks, key="webhooks", meta={"errors": errors or None})
         except Exception as e:
             logger.error("list_webhooks failed for %s: %s", show, e, exc_info=True)
             return f"Error: {e}"
 
-    @mcp.tool()
+    @tool
     async def register_webhook(
         show: str,
-        url: str,
-        action_type: str,
+        action_type: Annotated[str, "\"episode_published\" or \"episode_live\""],
+        url: Annotated[str | None, "Webhook endpoint URL (default: the embedded receiver)"] = None,
     ) -> str:
         """
         Register a new webhook.
 
+        Without ``url`` the webhook points at this server's embedded receiver
+        (PODHOME_WEBHOOK_PORT) at PODHOME_WEBHOOK_PUBLIC_URL, so
+        ``wait_for_event`` can see its events.
+
         Args:
             show: One of the slugs configured in PODHOME_SHOWS
-            url: Webhook endpoint URL
             action_type: Action type - "episode_published" or "episode_live"
+            url: Webhook endpoint URL (default: the embedded receiver)
         """
         try:
-            client = PodhomeClient(config.get_api_key(show), config.base_url)
+            client = registry.get(show)
+            if url is None:
+                if registry.receiver is None:
+                    return "Error: url is required when the webhook receiver is not enabled"
+                url = registry.receiver.url_for(show, action_type)
             payload = {"url": url, "action_type": action_type}
             result = await client.register_webhook(payload)
-            await client.aclose()
-            return str(result)
+            return _render(result)
         except Exception as e:
             logger.error("register_webhook failed for %s: %s", show, e, exc_info=True)
             return f"Error: {e}"
 
-    @mcp.tool()
+    @tool
     async def delete_webhook(
         show: str,
         integration_id: str,
@@ -284,16 +944,15 @@ def register_tools(mcp: FastMCP, config: Config):
             integration_id: The ID of the webhook to delete
         """
         try:
-            client = PodhomeClient(config.get_api_key(show), config.base_url)
+            client = registry.get(show)
             payload = {"integration_id": integration_id}
             result = await client.delete_webhook(payload)
-            await client.aclose()
-            return str(result)
+            return _render(result)
         except Exception as e:
             logger.error("delete_webhook failed for %s: %s", show, e, exc_info=True)
             return f"Error: {e}"
 
-    @mcp.tool()
+    @tool
     async def test_webhook(
         show: str,
         integration_id: str | None = None,
@@ -306,11 +965,55 @@ def register_tools(mcp: FastMCP, config: Config):
             integration_id: Optional specific webhook ID to test
         """
         try:
-            client = PodhomeClient(config.get_api_key(show), config.base_url)
+            client = registry.get(show)
             payload = {"integration_id": integration_id} if integration_id else None
             result = await client.test_webhook(payload)
-            await client.aclose()
-            return str(result)
+            return _render(result)
         except Exception as e:
             logger.error("test_webhook failed for %s: %s", show, e, exc_info=True)
             return f"Error: {e}"
+
+    @tool
+    async def wait_for_event(
+        show: str,
+        event_type: Annotated[str | None, "\"episode_published\" or \"episode_live\" (default: any)"] = None,
+        episode_id: Annotated[str | None, "Only wait for events about this episode"] = None,
+        after: Annotated[int | None, "Cursor from a previous call; events after it count (default: now)"] = None,
+        timeout: Annotated[float | None, "Seconds to wait (default PODHOME_WEBHOOK_WAIT_TIMEOUT)"] = None,
+    ) -> str:
+        """
+        Wait until a webhook event arrives for a show, instead of polling list_episodes.
+
+        Requires the embedded webhook receiver and a webhook registered with
+        register_webhook (without a url). Returns the event with its ``seq``;
+        pass that as ``after`` to wait for the next one. On timeout returns
+        ``{"timeout": true, "cursor": ...}``.
+
+        Args:
+            show: One of the slugs configured in PODHOME_SHOWS
+            event_type: "episode_published" or "episode_live" (default: any)
+            episode_id: Only wait for events about this episode
+            after: Cursor from a previous call (default: only new events)
+            timeout: Seconds to wait (default PODHOME_WEBHOOK_WAIT_TIMEOUT)
+        """
+        try:
+            config.get_api_key(show)
+            if registry.receiver is None:
+                return "Error: webhook receiver is not enabled (set PODHOME_WEBHOOK_PORT)"
+            if after is None:
+                after = registry.events.last_seq
+            event = await registry.events.wait(
+                show,
+                after,
+                event_type,
+                episode_id,
+                config.webhook_wait_timeout if timeout is None else timeout,
+            )
+            if event is None:
+                return _render({"timeout": True, "cursor": after})
+            return _render(event.to_dict())
+        except Exception as e:
+            logger.error("wait_for_event failed for %s: %s", show, e, exc_info=True)
+            return f"Error: {e}"
+
+    return registry
@@ -0,0 +1,296 @@
+"""PodHome MCP Server - Transcript Search Module."""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .index import episode_id
+
+if TYPE_CHECKING:
+    from .client import PodhomeClient
+
+logger = logging.getLogger(__name__)
+
+_TOKEN = re.compile(r"\w+")
+_TAG = re.compile(r"<[^>]+>")
+_CUE = re.compile(
+    r"(?:(\d+):)?(\d{1,2}):(\d{2})[.,](\d{1,3})\s*-->\s*(?:(\d+):)?(\d{1,2}):(\d{2})[.,](\d{1,3})"
+)
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+@dataclass
+class Segment:
+    """One timed piece of a transcript; times are None for untimed text."""
+
+    start: float | None
+    end: float | None
+    text: str
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lower-case word tokens."""
+    return _TOKEN.findall(text.lower())
+
+
+def _seconds(h: str | None, m: str, s: str, frac: str) -> float:
+    return int(h or 0) * 3600 + int(m) * 60 + int(s) + int(frac.ljust(3, "0")) / 1000
+
+
+def parse_transcript(text: str) -> list[Segment]:
+    """Parse a WebVTT, SRT or JSON transcript into segments.
+
+    JSON may be a list of ``{start, end, text}`` objects or an object with
+    a ``segments`` list. Anything else is treated as one untimed segment.
+    """
+    stripped = text.lstrip()
+    if stripped[:1] in ("[", "{"):
+        try:
+            data = json.loads(stripped)
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            data = data.get("segments")
+        if isinstance(data, list):
+            return [
+                Segment(
+                    item.get("start", item.get("start_time")),
+                    item.get("end", item.get("end_time")),
+                    str(item.get("text", "")),
+                )
+                for item in data
+                if isinstance(item, dict)
+            ]
+
+    segments: list[Segment] = []
+    current: Segment | None = None
+    for line in text.splitlines():
+        match = _CUE.search(line)
+        if match:
+            g = match.groups()
+            current = Segment(_seconds(*g[:4]), _seconds(*g[4:]), "")
+            segments.append(current)
+        elif not line.strip():
+            current = None
+        elif current is not None:
+            line = _TAG.sub("", line).strip()
+            current.text = f"{current.text} {line}" if current.text else line
+    if segments:
+        return segments
+    return [Segment(None, None, text.strip())] if text.strip() else []
+
+
+class TranscriptIndex:
+    """Inverted index over one show's episode transcripts, ranked with BM25.
+
+    Postings map each token to the episodes and transcript segments that
+    contain it, so a query touches only the episodes that match. Episodes
+    are (re)indexed only when their transcript changes; transcripts given as
+    a ``transcript_url`` are downloaded once with a key-less HTTP client.
+    Refreshes stream the episode list and keep only a hash of each
+    transcript, not the listing itself. A download rejected with a 4xx is
+    not retried until its URL changes; other failures are retried after
+    ``ttl`` seconds.
+    """
+
+    def __init__(
+        self,
+        client: "PodhomeClient",
+        http: httpx.AsyncClient | None = None,
+        fetch_concurrency: int = 8,
+        ttl: float = 60.0,
+    ):
+        """Initialize an empty index.
+
+        Args:
+            client: Client used to list the show's episodes
+            http: Client for downloading transcript files (no API key is sent)
+            fetch_concurrency: Maximum concurrent transcript downloads
+            ttl: Seconds a refresh stays current unless the client's episodes change
+        """
+        self._client = client
+        self._http = http
+        self._fetch_slots = asyncio.Semaphore(fetch_concurrency)
+        self._lock = asyncio.Lock()
+        self.ttl = ttl
+        # Client generation and monotonic time of the last refresh
+        self._refreshed: tuple[int, float] | None = None
+        self.postings: dict[str, dict[str, list[int]]] = {}
+        self.segments: dict[str, list[Segment]] = {}
+        self.titles: dict[str, str | None] = {}
+        self._versions: dict[str, Any] = {}
+        self._lengths: dict[str, int] = {}
+        self._total_length = 0
+        self.failed: dict[str, str] = {}
+        # Monotonic time after which a transient failure is retried; 4xx
+        # failures have no entry and stay failed until the URL changes
+        self._retry_at: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.segments)
+
+    # ========== Indexing ==========
+
+    def add(self, eid: str, segments: list[Segment], title: str | None = None, version: Any = None) -> None:
+        """Index (or re-index) an episode's transcript segments."""
+        self.remove(eid)
+        length = 0
+        for i, segment in enumerate(segments):
+            counts = Counter(tokenize(segment.text))
+            length += counts.total()
+            for token, count in counts.items():
+                self.postings.setdefault(token, {}).setdefault(eid, []).extend([i] * count)
+        self.segments[eid] = segments
+        self.titles[eid] = title
+        self._versions[eid] = version
+        self._lengths[eid] = length
+        self._total_length += length
+        self.failed.pop(eid, None)
+        self._retry_at.pop(eid, None)
+
+    def remove(self, eid: str) -> None:
+        """Drop an episode from the index."""
+        segments = self.segments.pop(eid, None)
+        if segments is None:
+            return
+        for token in {t for s in segments for t in tokenize(s.text)}:
+            docs = self.postings.get(token)
+            if docs is not None:
+                docs.pop(eid, None)
+                if not docs:
+                    del self.postings[token]
+        self._total_length -= self._lengths.pop(eid)
+        self.titles.pop(eid, None)
+        self._versions.pop(eid, None)
+
+    def add_episodes(self, episodes: list[dict]) -> list[dict]:
+        """Index every episode whose transcript text is inline and changed.
+
+        Returns:
+            Episodes whose transcript is only available as a URL and not yet indexed.
+        """
+        to_fetch = []
+        for episode in episodes:
+            eid = episode_id(episode)
+            transcript = episode.get("transcript")
+            if eid is None or not isinstance(transcript, dict):
+                continue
+            text = transcript.get("text")
+            url = transcript.get("transcript_url")
+            digest = hashlib.blake2b(text.encode()).digest() if text is not None else None
+            version = (url, digest)
+            if self._versions.get(eid) == version and eid in self.segments:
+                continue
+            if text is not None:
+                self.add(eid, parse_transcript(text), episode.get("title"), version)
+            elif url and not self._failed(eid, url):
+                to_fetch.append(episode)
+        return to_fetch
+
+    async def refresh(self) -> "TranscriptIndex":
+        """Bring the index up to date with the show's episode list.
+
+        The list is streamed one episode at a time. A refresh less than
+        ``ttl`` seconds old is reused unless the client's episodes changed.
+        """
+        async with self._lock:
+            generation = self._client.generation
+            if self._refreshed is not None:
+                last_generation, at = self._refreshed
+                if last_generation == generation and time.monotonic() - at < self.ttl:
+                    return self
+            present = set()
+            to_fetch = []
+            async for episode in self._client.iter_episodes(include_transcript=True):
+                present.add(episode_id(episode))
+                to_fetch.extend(self.add_episodes([episode]))
+            if to_fetch and self._http is not None:
+                http = self._http
+                await asyncio.gather(*(self._fetch(http, e) for e in to_fetch))
+            for eid in [eid for eid in self.segments if eid not in present]:
+                self.remove(eid)
+            self._refreshed = (generation, time.monotonic())
+        return self
+
+    async def _fetch(self, http: httpx.AsyncClient, episode: dict) -> None:
+        eid = episode_id(episode)
+        url = episode["transcript"]["transcript_url"]
+        if eid is None:
+            return
+        try:
+            async with self._fetch_slots:
+                r = await http.get(url)
+                r.raise_for_status()
+            self.add(eid, parse_transcript(r.text), episode.get("title"), (url, None))
+        except Exception as e:
+            logger.warning("Failed to fetch transcript %s for episode %s: %s", url, eid, e)
+            self.failed[eid] = url
+            permanent = isinstance(e, httpx.HTTPStatusError) and e.response.is_client_error
+            if permanent:
+                self._retry_at.pop(eid, None)
+            else:
+                self._retry_at[eid] = time.monotonic() + self.ttl
+
+    def _failed(self, eid: str, url: str) -> bool:
+        """Return True if fetching ``url`` failed and shouldn't be retried yet."""
+        if self.failed.get(eid) != url:
+            return False
+        return time.monotonic() < self._retry_at.get(eid, math.inf)
+
+    # ========== Search ==========
+
+    def search(self, query: str, limit: int = 10, matches_per_episode: int = 3) -> list[dict]:
+        """Return the best-matching episodes with the segments that matched.
+
+        Episodes are ranked by BM25 over their whole transcript; within an
+        episode, segments containing more distinct query terms come first.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or not self.segments:
+            return []
+        n = len(self.segments)
+        avg_length = self._total_length / n or 1
+        scores: dict[str, float] = {}
+        for term in terms:
+            docs = self.postings.get(term, {})
+            idf = math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for eid, hits in docs.items():
+                tf = len(hits)
+                norm = K1 * (1 - B + B * self._lengths[eid] / avg_length)
+                scores[eid] = scores.get(eid, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+        results = []
+        for eid, score in sorted(scores.items(), key=lambda item: -item[1])[:limit]:
+            per_segment: dict[int, set[str]] = {}
+            for term in terms:
+                for i in self.postings.get(term, {}).get(eid, ()):
+                    per_segment.setdefault(i, set()).add(term)
+            best = sorted(per_segment, key=lambda i: (-len(per_segment[i]), i))
+            results.append(
+                {
+                    "episode_id": eid,
+                    "title": self.titles.get(eid),
+                    "score": round(score, 3),
+                    "matches": [
+                        {
+                            "start": self.segments[eid][i].start,
+                            "end": self.segments[eid][i].end,
+                            "text": self.segments[eid][i].text,
+                        }
+                        for i in best[:matches_per_episode]
+                    ],
+                }
+            )
+        return results
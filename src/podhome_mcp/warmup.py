@@ -0,0 +1,172 @@
+"""PodHome MCP Server - Background Warm-up Module."""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+if TYPE_CHECKING:
+    from .client import ClientRegistry, PodhomeClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Show:
+    """Refresh state of one client (shows sharing an API key share a client)."""
+
+    show: str
+    client: "PodhomeClient"
+    interval: float
+    due: float = 0.0
+    refreshes: int = 0
+    changes: int = 0
+    deferred: int = 0
+    errors: int = 0
+    last_error: str | None = None
+    episodes: list | None = None
+    hooks: list | None = None
+
+
+class WarmupScheduler:
+    """Keeps every show's episode and webhook lists warm in the background.
+
+    On start each show's default episode list, episode index and webhook
+    list are fetched, then refreshed (revalidated, so usually a 304) on a
+    jittered interval. A show whose lists changed since the last refresh
+    is refreshed twice as often, down to ``min_interval``; an unchanged
+    show backs off by half again, up to ``max_interval``. Keeping
+    ``max_interval`` under the cache TTL means tool calls are served from
+    the cache. At most ``concurrency`` refreshes run at once, and a refresh
+    waits (up to one interval) while tool calls have requests in flight on
+    the same client, so it never competes with them for connections or
+    rate-limit tokens.
+    """
+
+    def __init__(
+        self,
+        registry: "ClientRegistry",
+        shows: Iterable[str],
+        min_interval: float = 10.0,
+        max_interval: float = 54.0,
+        concurrency: int = 2,
+        jitter: float = 0.2,
+        idle_poll: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize a stopped scheduler.
+
+        Args:
+            registry: Registry providing each show's client and index
+            shows: Show slugs to keep warm
+            min_interval: Shortest time in seconds between refreshes of a show
+            max_interval: Longest time in seconds between refreshes of a show
+            concurrency: Maximum refreshes running at once
+            jitter: Fraction of the interval randomly taken off each delay
+            idle_poll: Seconds between checks while waiting for tool calls to finish
+            clock: Monotonic time source (overridable for tests)
+        """
+        self._registry = registry
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.idle_poll = idle_poll
+        self._clock = clock
+        self._slots = asyncio.Semaphore(max(concurrency, 1))
+        self._shows: list[_Show] = []
+        seen: set[int] = set()
+        for show in shows:
+            client = registry.get(show)
+            if id(client) not in seen:
+                seen.add(id(client))
+                self._shows.append(_Show(show, client, max_interval))
+        self._tasks: list[asyncio.Task] = []
+        self.warmed = asyncio.Event()
+
+    def delay(self, interval: float) -> float:
+        """Return a jittered delay of at most ``interval`` seconds."""
+        return interval * (1 - random.uniform(0, self.jitter))
+
+    def start(self) -> "WarmupScheduler":
+        """Start prefetching and refreshing in background tasks."""
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._run(state)) for state in self._shows]
+            if not self._tasks:
+                self.warmed.set()
+        return self
+
+    async def _run(self, state: _Show) -> None:
+        await self.refresh(state)
+        if all(s.refreshes or s.errors for s in self._shows):
+            self.warmed.set()
+        while True:
+            await asyncio.sleep(max(state.due - self._clock(), 0))
+            await self.refresh(state)
+
+    async def _idle(self, state: _Show) -> None:
+        """Wait until no tool call has a request in flight on the show's client."""
+        deadline = self._clock() + state.interval
+        if state.client.foreground:
+            state.deferred += 1
+        while state.client.foreground and self._clock() < deadline:
+            await asyncio.sleep(self.idle_poll)
+
+    async def refresh(self, state: _Show) -> None:
+        """Refresh one show's lists, then adapt and schedule its next refresh."""
+        async with self._slots:
+            await self._idle(state)
+            try:
+                # The first fetch may be answered by the on-disk store
+                episodes = await state.client.list_episodes(
+                    max_age=0 if state.refreshes else None
+                )
+                await self._registry.index(state.show).refresh()
+                hooks = await state.client.list_webhooks(max_age=0)
+            except Exception as e:
+                logger.warning("Warm-up refresh for %s failed: %s", state.show, e)
+                state.errors += 1
+                state.last_error = str(e)
+            else:
+                if state.refreshes and (
+                    _changed(state.episodes, episodes) or _changed(state.hooks, hooks)
+                ):
+                    state.changes += 1
+                    state.interval = max(self.min_interval, state.interval / 2)
+                elif state.refreshes:
+                    state.interval = min(self.max_interval, state.interval * 1.5)
+                state.episodes, state.hooks = episodes, hooks
+                state.refreshes += 1
+                state.last_error = None
+        state.due = self._clock() + self.delay(state.interval)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return refresh counters and the current interval keyed by show slug."""
+        return {
+            state.show: {
+                "interval": round(state.interval, 3),
+                "refreshes": state.refreshes,
+                "changes": state.changes,
+                "deferred": state.deferred,
+                "errors": state.errors,
+                **({"last_error": state.last_error} if state.last_error else {}),
+            }
+            for state in self._shows
+        }
+
+    async def aclose(self) -> None:
+        """Stop every refresh task."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+
+def _changed(previous: list | None, current: list) -> bool:
+    # A 304 returns the cached list object itself, so identity settles most checks
+    return previous is not current and previous != current
@@ -0,0 +1,316 @@
+"""PodHome MCP Server - Webhook Receiver Module."""
+
+import asyncio
+import hmac
+import ipaddress
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from .index import episode_id
+
+if TYPE_CHECKING:
+    from .client import ClientRegistry
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_EVENTS = ("episode_published", "episode_live")
+
+# Largest request body the receiver accepts
+MAX_BODY_BYTES = 1 << 20
+
+_REASONS = {
+    204: "No Content",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+@dataclass
+class Event:
+    """One webhook delivery received from Podhome."""
+
+    seq: int
+    show: str
+    event: str
+    episode_id: str | None
+    received_at: float
+    data: Any = field(repr=False)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class EventLog:
+    """Bounded in-memory log of webhook events that tool calls can wait on.
+
+    Every event gets an increasing sequence number. Waiters pass the last
+    sequence number they have seen and are woken as soon as a newer event
+    matching their filters is published, so waiting costs no API requests.
+    """
+
+    def __init__(self, max_events: int = 1000):
+        """Initialize an empty log keeping at most ``max_events`` events."""
+        self._events: deque[Event] = deque(maxlen=max_events)
+        self._changed = asyncio.Condition()
+        self.last_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    async def publish(
+        self, show: str, event: str, episode: str | None, data: Any
+    ) -> Event:
+        """Append an event and wake every waiter."""
+        self.last_seq += 1
+        record = Event(self.last_seq, show, event, episode, time.time(), data)
+        self._events.append(record)
+        async with self._changed:
+            self._changed.notify_all()
+        return record
+
+    def find(
+        self,
+        show: str,
+        after: int = 0,
+        event: str | None = None,
+        episode: str | None = None,
+    ) -> Event | None:
+        """Return the oldest event newer than ``after`` matching the filters."""
+        for record in self._events:
+            if (
+                record.seq > after
+                and record.show == show
+                and (event is None or record.event == event)
+                and (episode is None or record.episode_id == episode)
+            ):
+                return record
+        return None
+
+    async def wait(
+        self,
+        show: str,
+        after: int | None = None,
+        event: str | None = None,
+        episode: str | None = None,
+        timeout: float = 60.0,
+    ) -> Event | None:
+        """Wait for an event newer than ``after`` (default: now) matching the filters.
+
+        Returns:
+            The event, or None if ``timeout`` seconds pass first.
+        """
+        if after is None:
+            after = self.last_seq
+        found = self.find(show, after, event, episode)
+        if found is not None:
+            return found
+
+        def ready():
+            nonlocal found
+            found = self.find(show, after, event, episode)
+            return found is not None
+
+        async with self._changed:
+            try:
+                await asyncio.wait_for(self._changed.wait_for(ready), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return found
+
+
+def parse_event(body: bytes) -> tuple[str | None, str | None, Any]:
+    """Extract ``(action_type, episode_id, data)`` from a webhook body.
+
+    The episode may be the body itself or nested under ``episode``/``data``.
+    """
+    data = json.loads(body) if body.strip() else {}
+    if not isinstance(data, dict):
+        return None, None, data
+    action = data.get("action_type") or data.get("event") or data.get("type")
+    episode = data
+    for key in ("episode", "data"):
+        if isinstance(data.get(key), dict):
+            episode = data[key]
+            break
+    return action, episode_id(episode), data
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class WebhookReceiver:
+    """Minimal HTTP listener for Podhome webhook deliveries.
+
+    Deliveries are accepted as ``POST /hooks/<show>[/<action_type>]``. Each
+    one invalidates the show's cached episode lists and is appended to the
+    registry's event log for ``wait_for_event``. When a secret is set the
+    request must carry it as the ``token`` query parameter; without one the
+    receiver only binds to a loopback address.
+    """
+
+    def __init__(
+        self,
+        registry: "ClientRegistry",
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        public_url: str | None = None,
+        secret: str | None = None,
+    ):
+        """Initialize the receiver.
+
+        Args:
+            registry: Registry whose clients and event log the events update
+            host: Bind address
+            port: Bind port (0 picks a free port on start)
+            public_url: Base URL Podhome should call; required to register webhooks
+            secret: Optional token required on every delivery
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.public_url = public_url
+        self.secret = secret
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> "WebhookReceiver":
+        """Start listening; ``port`` is updated if 0 was requested.
+
+        Raises:
+            ValueError: If no secret is set and ``host`` is not a loopback address.
+        """
+        if self.secret is None:
+            if not _is_loopback(self.host):
+                raise ValueError(
+                    f"Refusing to start the webhook receiver on {self.host} without "
+                    "PODHOME_WEBHOOK_SECRET: anyone reaching it could flush caches "
+                    "and trigger API polls"
+                )
+            if self.public_url:
+                logger.warning(
+                    "Webhook receiver is exposed at %s without PODHOME_WEBHOOK_SECRET; "
+                    "any caller can flush caches and trigger API polls",
+                    self.public_url,
+                )
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info("Webhook receiver listening on %s:%s", self.host, self.port)
+        return self
+
+    async def aclose(self) -> None:
+        """Stop accepting deliveries."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        status = 400
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 10)
+            request_line, *header_lines = head.decode("latin-1").split("\r\n")
+            method, target, _ = request_line.split(" ", 2)
+            headers = {}
+            for line in header_lines:
+                name, sep, value = line.partition(":")
+                if sep:
+                    headers[name.strip().lower()] = value.strip()
+            length = int(headers.get("content-length") or 0)
+            if length > MAX_BODY_BYTES:
+                status = 413
+            else:
+                body = await asyncio.wait_for(reader.readexactly(length), 10)
+                status = await self.deliver(method, target, body)
+        except (
+            asyncio.IncompleteReadError,
+            asyncio.LimitOverrunError,
+            asyncio.TimeoutError,
+            ValueError,
+        ):
+            pass
+        except Exception as e:
+            logger.error("Webhook delivery failed: %s", e, exc_info=True)
+            status = 500
+        try:
+            writer.write(
+                f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                "Content-Length: 0\r\nConnection: close\r\n\r\n".encode()
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def deliver(self, method: str, target: str, body: bytes) -> int:
+        """Process one delivery and return the HTTP status to answer with."""
+        url = urlsplit(target)
+        parts = [p for p in url.path.split("/") if p]
+        if len(parts) not in (2, 3) or parts[0] != "hooks":
+            return 404
+        if len(parts) == 3 and unquote(parts[2]) not in WEBHOOK_EVENTS:
+            return 404
+        if method != "POST":
+            return 405
+        if self.secret is not None:
+            token = parse_qs(url.query).get("token", [""])[0]
+            if not hmac.compare_digest(token, self.secret):
+                return 401
+        show = unquote(parts[1])
+        try:
+            client = self.registry.get(show)
+        except ValueError:
+            return 404
+        try:
+            action, episode, data = parse_event(body)
+        except ValueError:
+            return 400
+        if len(parts) == 3:
+            event = unquote(parts[2])
+        else:
+            event = action if action in WEBHOOK_EVENTS else "unknown"
+
+        client.invalidate_episodes()
+        self.registry.tracker(show).poke()
+        await self.registry.events.publish(show, event, episode, data)
+        self.registry.metrics.inc("podhome_webhook_events_total", show=show, event=event)
+        logger.info("Webhook %s for %s (episode %s)", event, show, episode)
+        return 204
+
+    def url_for(self, show: str, action_type: str, *, local: bool = False) -> str:
+        """Return the URL to register with Podhome for a show and action type.
+
+        With ``local`` the URL uses the bind address instead of ``public_url``,
+        for deliveries made from this host.
+
+        Raises:
+            ValueError: If ``public_url`` is not set and ``local`` is False.
+        """
+        if local:
+            base = f"http://{self.host}:{self.port}"
+        elif self.public_url:
+            base = self.public_url.rstrip("/")
+        else:
+            raise ValueError(
+                "Podhome can't reach the receiver's local address; "
+                "set PODHOME_WEBHOOK_PUBLIC_URL or pass url"
+            )
+        url = f"{base}/hooks/{quote(show, safe='')}/{quote(action_type, safe='')}"
+        if self.secret is not None:
+            url += f"?token={quote(self.secret, safe='')}"
+        return url
@@ -0,0 +1,55 @@
+"""Shared test doubles."""
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeClient:
+    """Stands in for PodhomeClient, serving episode lists from memory.
+
+    Each ``list_episodes`` call returns the next of ``pages``, repeating the
+    last one; assign ``episodes`` to serve a new list from then on.
+    """
+
+    name = "show1"
+
+    def __init__(self, *pages: list[dict]):
+        self.pages = list(pages)
+        self.calls = 0
+        self.max_ages: list[float | None] = []
+
+    @property
+    def episodes(self) -> list[dict]:
+        return self.pages[0]
+
+    @episodes.setter
+    def episodes(self, episodes: list[dict]):
+        self.pages = [episodes]
+
+    async def list_episodes(self, max_age=None):
+        self.calls += 1
+        self.max_ages.append(max_age)
+        if len(self.pages) > 1:
+            return self.pages.pop(0)
+        return self.pages[0]
+
+
+@pytest.fixture
+def clock():
+    """Return a FakeClock starting at 0."""
+    return FakeClock()
+
+
+@pytest.fixture
+def fake_client():
+    """Return the FakeClient class, to build clients with their episode pages."""
+    return FakeClient
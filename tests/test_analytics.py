@@ -0,0 +1,102 @@
+"""Tests for download analytics."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client, FastMCP
+
+from podhome_mcp.analytics import download_stats, numpy_available
+from podhome_mcp.config import Config
+from podhome_mcp.tools import register_tools
+
+BASE_URL = "https://serve.podhome.fm"
+
+EPISODES = [
+    {"episode_id": "a", "title": "A", "season_nr": 1, "publish_date": "2024-01-01", "downloads": 100},
+    {"episode_id": "b", "title": "B", "season_nr": 1, "publish_date": "2024-02-01", "downloads": 300},
+    {"episode_id": "c", "title": "C", "season_nr": 2, "publish_date": "2024-03-01", "downloads": 400},
+    {"episode_id": "d", "title": "D", "season_nr": 2, "publish_date": "2024-04-01", "downloads": 800},
+    {"episode_id": "e", "title": "Draft", "season_nr": 2},
+]
+
+BACKENDS = [False] + ([True] if numpy_available() else [])
+
+
+class TestDownloadStats:
+    """Tests for download_stats."""
+
+    @pytest.mark.parametrize("use_numpy", BACKENDS)
+    def test_summary(self, use_numpy):
+        """Test totals, percentiles, top-N, seasons and growth."""
+        stats = download_stats(EPISODES, top_n=2, percentiles=[50, 90], window=2, use_numpy=use_numpy)
+        assert (stats["episodes"], stats["counted"], stats["total"]) == (5, 4, 1600)
+        assert stats["mean"] == 400
+        assert stats["percentiles"] == {"p50": 350, "p90": 680}
+        assert [t["episode_id"] for t in stats["top"]] == ["d", "c"]
+        assert stats["seasons"] == [
+            {"season_nr": 1, "episodes": 2, "total": 400, "mean": 200, "growth": None},
+            {"season_nr": 2, "episodes": 2, "total": 1200, "mean": 600, "growth": 2.0},
+        ]
+        assert stats["recent"] == {"window": 2, "mean": 600, "previous_mean": 200, "growth": 2.0}
+
+    @pytest.mark.skipif(not numpy_available(), reason="numpy not installed")
+    def test_backends_agree(self):
+        """Test the NumPy and pure-Python paths give identical summaries."""
+        episodes = [
+            {"id": str(i), "season_nr": i % 3 or None, "publish_date": f"2024-{i % 12 + 1:02d}", "downloads": i * 37 % 101}
+            for i in range(200)
+        ]
+        assert download_stats(episodes, use_numpy=True) == download_stats(episodes, use_numpy=False)
+
+    def test_no_counts(self):
+        """Test episodes without download counts yield only the counts."""
+        assert download_stats([{"id": "x"}]) == {"episodes": 1, "counted": 0}
+
+    @pytest.mark.parametrize("option", ["top_n", "window"])
+    def test_rejects_non_positive_sizes(self, option):
+        """Test a zero top_n or window is an error rather than the whole series."""
+        with pytest.raises(ValueError, match=f"{option} must be at least 1"):
+            download_stats(EPISODES, **{option: 0})
+
+    @pytest.mark.parametrize("use_numpy", BACKENDS)
+    @pytest.mark.parametrize("q", [150, -5])
+    def test_rejects_out_of_range_percentiles(self, q, use_numpy):
+        """Test percentiles outside 0-100 fail the same way on both backends."""
+        with pytest.raises(ValueError, match="between 0 and 100"):
+            download_stats(EPISODES, percentiles=[50, q], use_numpy=use_numpy)
+
+    def test_mixed_season_types(self):
+        """Test string and integer season numbers are grouped and ordered together."""
+        episodes = [
+            {"id": "a", "season_nr": "2", "downloads": 10},
+            {"id": "b", "season_nr": 1, "downloads": 20},
+            {"id": "c", "season_nr": 2, "downloads": 30},
+            {"id": "d", "season_nr": "special", "downloads": 40},
+        ]
+        seasons = download_stats(episodes)["seasons"]
+        assert [(s["season_nr"], s["total"]) for s in seasons] == [(1, 20), (2, 40), (None, 40)]
+
+
+class TestDownloadStatsTool:
+    """Tests for the download_stats tool."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_all_shows(self):
+        """Test a summary per show plus one across all shows."""
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=EPISODES[:2])
+        )
+        config = Config(shows={"a": "k1", "b": "k2"}, base_url=BASE_URL, rate_limit=0)
+        mcp = FastMCP("test")
+        register_tools(mcp, config)
+        async with Client(mcp) as client:
+            result = await client.call_tool("download_stats", {"show": "*", "top_n": 1})
+        data = json.loads(result.content[0].text)
+        assert data["shows"]["a"]["total"] == 400
+        assert data["all"]["total"] == 800
+        assert data["all"]["top"][0]["show"] in ("a", "b")
+        params = route.calls[0].request.url.params
+        assert (params["status"], params["includeDownloads"]) == ("2", "true")
@@ -0,0 +1,70 @@
+"""Smoke tests for the fake Podhome API and the benchmark harness."""
+
+import json
+
+import httpx
+import pytest
+
+from benchmarks import bench_codec, bench_tools
+from benchmarks.fake_podhome import FakePodhome, FakeSettings
+
+
+class TestFakePodhome:
+    """Tests for the fake API."""
+
+    @pytest.mark.asyncio
+    async def test_episodes_etag_and_writes(self):
+        """Test listing, ETag revalidation and invalidation on write."""
+        app = FakePodhome(FakeSettings(episodes=3, transcript_bytes=10))
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://podhome.test",
+            headers={"X-API-KEY": "k"},
+        ) as client:
+            r = await client.get("/api/episodes", params={"includeTranscript": "true"})
+            episodes = r.json()
+            assert len(episodes) == 3
+            assert "transcript" in episodes[0]
+            etag = r.headers["ETag"]
+            r = await client.get("/api/episodes", headers={"If-None-Match": etag})
+            assert r.status_code == 304
+            await client.post(
+                "/api/modify_episode",
+                json={"episode_id": episodes[0]["episode_id"], "title": "New"},
+            )
+            r = await client.get("/api/episodes", headers={"If-None-Match": etag})
+            assert r.status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_error_injection(self):
+        """Test injected errors are 429 or 503."""
+        app = FakePodhome(FakeSettings(episodes=1, error_rate=1.0))
+        status, _, _ = await app.handle("GET", "/api/hook", {}, {"x-api-key": "k"}, b"")
+        assert status in (429, 503)
+        assert app.errors_injected == 1
+
+
+def test_bench_runs_every_scenario(tmp_path, capsys):
+    """Test the harness drives every registered tool without errors."""
+    out = tmp_path / "bench.json"
+    code = bench_tools.main(
+        ["--episodes", "5", "--concurrency", "2", "--calls", "2", "--shows", "2",
+         "--transcript-bytes", "100", "--json", str(out)]
+    )
+    assert code == 0
+    assert "warning: no scenario" not in capsys.readouterr().err
+    results = json.loads(out.read_text())["results"]
+    assert results and all(r["errors"] == 0 for r in results)
+
+
+def test_codec_bench_runs(tmp_path):
+    """Test the codec benchmark reports compressed sizes below the identity size."""
+    out = tmp_path / "codec.json"
+    code = bench_codec.main(
+        ["--episodes", "5", "--calls", "1", "--transcript-bytes", "2000",
+         "--image-kb", "4", "--json", str(out)]
+    )
+    assert code == 0
+    sizes = {r["scenario"]: r["bytes"] for r in json.loads(out.read_text())["results"]}
+    assert sizes["list_episodes[gzip]"] < sizes["list_episodes[identity]"]
+    assert sizes["modify_episode[image_data,gzip]"] < sizes["modify_episode[image_data,plain]"]
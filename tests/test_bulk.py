@@ -0,0 +1,53 @@
+"""Tests for bulk operations."""
+
+import asyncio
+
+import pytest
+
+from podhome_mcp.bulk import run_bulk
+
+
+class TestRunBulk:
+    """Tests for run_bulk."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test no more than `concurrency` calls run at once."""
+        active = 0
+        peak = 0
+
+        async def call(payload):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"episodeId": payload["episode_id"]}
+
+        payloads = [{"episode_id": str(i)} for i in range(20)]
+        summary = await run_bulk(call, payloads, concurrency=4)
+        assert peak == 4
+        assert summary["succeeded"] == 20
+        assert [item["id"] for item in summary["items"]] == [str(i) for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_per_item_errors(self):
+        """Test failures and missing fields are reported per item."""
+
+        async def call(payload):
+            if payload["episode_id"] == "bad":
+                raise RuntimeError("boom")
+            assert "title" not in payload
+            return {}
+
+        summary = await run_bulk(
+            call,
+            [{"episode_id": "ok", "title": None}, {"episode_id": "bad"}, {}],
+            concurrency=2,
+            required=("episode_id",),
+        )
+        assert summary["total"] == 3
+        assert summary["failed"] == 2
+        assert summary["items"][0] == {"i": 0, "ok": True, "id": "ok"}
+        assert summary["items"][1] == {"i": 1, "ok": False, "error": "boom"}
+        assert summary["items"][2]["error"] == "missing episode_id"
@@ -0,0 +1,97 @@
+"""Tests for the list_episodes response cache."""
+
+import httpx
+import pytest
+import respx
+
+from podhome_mcp.cache import ResponseCache
+from podhome_mcp.client import PodhomeClient
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_ttl_expiry(self, clock):
+        """Test entries are fresh until the TTL elapses."""
+        cache = ResponseCache(ttl=10, max_entries=4, clock=clock)
+        cache.put("k", [1])
+        assert cache.lookup("k") == (cache._entries["k"], True)
+        clock.now = 11
+        entry, fresh = cache.lookup("k")
+        assert entry.value == [1]
+        assert fresh is False
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = ResponseCache(ttl=10, max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.lookup("a")
+        cache.put("c", 3)
+        assert cache.lookup("b") == (None, False)
+        assert cache.lookup("a")[0].value == 1
+        assert cache.stats()["evictions"] == 1
+
+
+class TestClientCaching:
+    """Tests for caching in PodhomeClient.list_episodes."""
+
+    @pytest.fixture
+    def client(self, clock):
+        return PodhomeClient(
+            "test-api-key",
+            BASE_URL,
+            cache=ResponseCache(ttl=30, max_entries=8, clock=clock),
+        )
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_fresh_hit_skips_request(self, client):
+        """Test a second identical call is served from the cache."""
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=[{"episode_id": "1"}])
+        )
+        first = await client.list_episodes(status=2)
+        second = await client.list_episodes(status=2)
+        assert first == second == [{"episode_id": "1"}]
+        assert route.call_count == 1
+        await client.list_episodes(status=1)
+        assert route.call_count == 2
+        assert client.cache.stats()["hits"] == 1
+        assert client.cache.stats()["misses"] == 2
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_etag_revalidation(self, client, clock):
+        """Test a stale entry is revalidated with If-None-Match."""
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            side_effect=[
+                httpx.Response(200, json=[{"episode_id": "1"}], headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+        await client.list_episodes()
+        clock.now = 60
+        result = await client.list_episodes()
+        assert result == [{"episode_id": "1"}]
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert client.cache.stats()["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_write_invalidates(self, client):
+        """Test modify_episode drops cached episode lists."""
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        respx.post(f"{BASE_URL}/api/modify_episode").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        await client.list_episodes()
+        await client.modify_episode({"episode_id": "1", "title": "New"})
+        await client.list_episodes()
+        assert route.call_count == 2
@@ -0,0 +1,79 @@
+"""Tests for the JSON codec and request/response compression."""
+
+import datetime
+import gzip
+import json
+
+import httpx
+import pytest
+import respx
+
+from podhome_mcp import codec
+from podhome_mcp.client import PodhomeClient
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+class TestCodec:
+    """Tests for loads/dumps."""
+
+    def test_matches_stdlib(self):
+        """Test output is compact, keeps non-ASCII and matches the stdlib."""
+        value = {"title": "Café ☕", "n": [1, 2.5, None, True], "nested": {"a": "b"}}
+        encoded = codec.dumps(value)
+        assert encoded == json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+        assert codec.loads(encoded) == codec.loads(encoded.decode()) == value
+
+    def test_fallbacks(self):
+        """Test values orjson cannot encode natively still encode."""
+        assert codec.loads(codec.dumps({"big": 1 << 70})) == {"big": 1 << 70}
+        assert codec.loads(codec.dumps({1: "a"})) == {"1": "a"}
+        when = datetime.date(2024, 1, 2)
+        assert codec.loads(codec.dumps({"d": when})) == {"d": "2024-01-02"}
+
+    def test_invalid_json(self):
+        """Test decode errors are ValueErrors whichever backend is used."""
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_encode_body_threshold(self):
+        """Test only bodies at or above the threshold are gzipped."""
+        small = codec.encode_body({"a": 1}, 100)
+        assert "Content-Encoding" not in small["headers"]
+        big = codec.encode_body({"image_data": "A" * 1000}, 100)
+        assert big["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(big["content"])) == {"image_data": "A" * 1000}
+        assert "gzip" in codec.accepted_encodings()
+
+
+class TestClientCompression:
+    """Tests for compression in PodhomeClient."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_negotiates_and_compresses(self):
+        """Test Accept-Encoding is sent, gzip responses decode and big bodies are gzipped."""
+        episodes = [{"episode_id": "e1", "title": "T" * 500}]
+        listed = respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(
+                200,
+                content=gzip.compress(json.dumps(episodes).encode()),
+                headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+            )
+        )
+        modified = respx.post(f"{BASE_URL}/api/modify_episode").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        client = PodhomeClient("key", BASE_URL, compress_min_bytes=1024)
+        assert await client.list_episodes() == episodes
+        assert listed.calls[0].request.headers["Accept-Encoding"] == codec.ACCEPT_ENCODING
+
+        payload = {"episode_id": "e1", "image_data": "QUJD" * 1000}
+        await client.modify_episode(payload)
+        request = modified.calls[0].request
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(request.content)) == payload
+
+        await client.modify_episode({"episode_id": "e1", "title": "Short"})
+        assert "Content-Encoding" not in modified.calls[1].request.headers
+        await client.aclose()
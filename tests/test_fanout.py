@@ -0,0 +1,56 @@
+"""Tests for cross-show fan-out."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from podhome_mcp.config import Config
+from podhome_mcp.fanout import fan_out, resolve_shows, single_show
+
+
+@pytest.fixture
+def config():
+    """Create a config with three shows."""
+    with patch.dict(
+        "os.environ",
+        {"PODHOME_SHOWS": '{"a": "key-a", "b": "key-b", "c": "key-c"}'},
+    ):
+        return Config()
+
+
+class TestResolveShows:
+    """Tests for show selection."""
+
+    def test_selectors(self, config):
+        """Test "*", comma-separated and list selectors."""
+        assert resolve_shows(config, "*") == ["a", "b", "c"]
+        assert resolve_shows(config, "c, a") == ["c", "a"]
+        assert resolve_shows(config, ["b", "b"]) == ["b"]
+        assert single_show("a") == "a" and single_show("a,b") is None and single_show(["a"]) is None
+        assert single_show("*") is None
+
+    def test_unknown_show(self, config):
+        """Test an unknown slug is rejected."""
+        with pytest.raises(ValueError):
+            resolve_shows(config, ["a", "nope"])
+
+
+class TestFanOut:
+    """Tests for fan_out."""
+
+    @pytest.mark.asyncio
+    async def test_partial_results(self):
+        """Test failing and slow shows are reported without losing the rest."""
+
+        async def fetch(show):
+            if show == "b":
+                raise RuntimeError("boom")
+            if show == "c":
+                await asyncio.sleep(1)
+            return [{"episode_id": f"{show}1"}]
+
+        items, errors = await fan_out(["a", "b", "c"], fetch, timeout=0.05)
+        assert items == [{"show": "a", "episode_id": "a1"}]
+        assert errors["b"] == "boom"
+        assert "timed out" in errors["c"]
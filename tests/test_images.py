@@ -0,0 +1,209 @@
+"""Tests for cover image preparation and streamed image uploads."""
+
+import base64
+import io
+import json
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client, FastMCP
+
+from podhome_mcp import images
+from podhome_mcp.config import Config
+from podhome_mcp.images import CoverImage, image_body, pillow_available, prepare_image
+from podhome_mcp.tools import register_tools
+
+BASE_URL = "https://serve.podhome.fm"
+
+needs_pillow = pytest.mark.skipif(not pillow_available(), reason="Pillow not installed")
+
+
+def write_image(path, size: tuple[int, int], format: str = "JPEG", mode: str = "RGB") -> bytes:
+    from PIL import Image
+
+    Image.linear_gradient("L").resize(size).convert(mode).save(path, format)
+    return path.read_bytes()
+
+
+async def collect(body: dict) -> bytes:
+    return b"".join([chunk async for chunk in body["content"]])
+
+
+class TestPrepareImage:
+    """Tests for prepare_image."""
+
+    @needs_pillow
+    def test_within_limits_is_sent_as_is(self, tmp_path):
+        """Test a small JPEG is memory-mapped and not recompressed."""
+        path = tmp_path / "cover.jpg"
+        original = write_image(path, (600, 600))
+        with prepare_image(str(path)) as image:
+            assert image.summary() == {
+                "format": "jpeg", "bytes": len(original), "width": 600, "height": 600,
+                "resized": False,
+            }
+            assert b"".join(base64.b64decode(c) for c in image.chunks()) == original
+
+    @needs_pillow
+    def test_downscales_and_converts(self, tmp_path):
+        """Test an oversized PNG with transparency becomes a JPEG within the limits."""
+        from PIL import Image
+
+        path = tmp_path / "cover.png"
+        write_image(path, (1200, 800), "PNG", "RGBA")
+        with prepare_image(str(path), max_dimension=500, max_bytes=20_000) as image:
+            summary = image.summary()
+            data = b"".join(base64.b64decode(c) for c in image.chunks())
+        assert summary["resized"] and summary["format"] == "jpeg"
+        assert (summary["width"], summary["height"]) == (500, 333)
+        assert len(data) <= 20_000
+        assert Image.open(io.BytesIO(data)).size == (500, 333)
+
+    def test_without_pillow(self, tmp_path, monkeypatch):
+        """Test only JPEG/PNG files within max_bytes are accepted without Pillow."""
+        monkeypatch.setattr(images, "pillow_available", lambda: False)
+        jpeg = tmp_path / "a.jpg"
+        jpeg.write_bytes(b"\xff\xd8\xff\xe0" + bytes(100))
+        with prepare_image(str(jpeg)) as image:
+            assert image.summary() == {"format": "jpeg", "bytes": 104, "resized": False}
+        with pytest.raises(ValueError, match="over the 50-byte limit"):
+            prepare_image(str(jpeg), max_bytes=50)
+        gif = tmp_path / "a.gif"
+        gif.write_bytes(b"GIF89a" + bytes(10))
+        with pytest.raises(ValueError, match="not a JPEG or PNG"):
+            prepare_image(str(gif))
+
+
+class TestImageBody:
+    """Tests for image_body."""
+
+    @pytest.mark.asyncio
+    async def test_streams_valid_json(self):
+        """Test the streamed body is the payload plus base64 image_data with an exact length."""
+        data = bytes(range(256)) * 2000
+        image = CoverImage(data, "jpeg")
+        body = image_body({"episode_id": "e1", "title": "T"}, image)
+        content = await collect(body)
+        assert int(body["headers"]["Content-Length"]) == len(content)
+        assert json.loads(content) == {
+            "episode_id": "e1", "title": "T", "image_data": base64.b64encode(data).decode(),
+        }
+
+
+class TestImageTools:
+    """Tests for image_path on modify_episode and set_episode_images_bulk."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_modify_and_bulk(self, tmp_path):
+        """Test local files reach the API as image_data, one request per episode."""
+        sent = []
+
+        def record(request):
+            sent.append(json.loads(request.content))
+            return httpx.Response(200, json={"episode_id": sent[-1]["episode_id"]})
+
+        respx.post(f"{BASE_URL}/api/modify_episode").mock(side_effect=record)
+        path = tmp_path / "cover.jpg"
+        path.write_bytes(b"\xff\xd8\xff\xe0" + bytes(100))
+        config = Config(
+            shows={"show1": "key1"}, base_url=BASE_URL, rate_limit=0, media_root=str(tmp_path)
+        )
+        mcp = FastMCP("test")
+        registry = register_tools(mcp, config)
+        async with Client(mcp) as client:
+            if not pillow_available():
+                single = await client.call_tool(
+                    "modify_episode", {"show": "show1", "episode_id": "e1", "image_path": str(path)}
+                )
+                assert json.loads(single.content[0].text)["image"]["bytes"] == 104
+            conflict = await client.call_tool(
+                "modify_episode",
+                {"show": "show1", "episode_id": "e1", "image_path": str(path), "image_data": "x"},
+            )
+            assert conflict.content[0].text.startswith("Error: Pass either")
+            bulk = await client.call_tool(
+                "set_episode_images_bulk",
+                {
+                    "show": "show1",
+                    "images": [
+                        {"episode_id": "e2", "image_path": str(path)},
+                        {"episode_id": "e3", "image_path": str(tmp_path / "missing.jpg")},
+                        {"episode_id": "e4"},
+                    ],
+                },
+            )
+        summary = json.loads(bulk.content[0].text)
+        assert [item["ok"] for item in summary["items"]] == [
+            pillow_available() is False, False, False
+        ]
+        assert summary["items"][2]["error"] == "missing image_path"
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    @needs_pillow
+    @respx.mock
+    async def test_modify_with_resize(self, tmp_path):
+        """Test modify_episode resizes an oversized file and reports the result."""
+        route = respx.post(f"{BASE_URL}/api/modify_episode").mock(
+            return_value=httpx.Response(200, json={"episode_id": "e1"})
+        )
+        path = tmp_path / "cover.jpg"
+        write_image(path, (1000, 1000))
+        config = Config(
+            shows={"show1": "key1"},
+            base_url=BASE_URL,
+            rate_limit=0,
+            image_max_dimension=400,
+            media_root=str(tmp_path),
+        )
+        mcp = FastMCP("test")
+        registry = register_tools(mcp, config)
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "modify_episode", {"show": "show1", "episode_id": "e1", "image_path": str(path)}
+            )
+        report = json.loads(result.content[0].text)
+        assert report["image"]["resized"] and report["image"]["width"] == 400
+        sent = json.loads(route.calls[0].request.content)
+        assert len(base64.b64decode(sent["image_data"])) == report["image"]["bytes"]
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_confined_to_media_root(self, tmp_path):
+        """Test image_path needs PODHOME_MEDIA_ROOT and must resolve inside it."""
+        route = respx.post(f"{BASE_URL}/api/modify_episode").mock(
+            return_value=httpx.Response(200, json={"episode_id": "e1"})
+        )
+        root = tmp_path / "media"
+        root.mkdir()
+        outside = tmp_path / "cover.jpg"
+        outside.write_bytes(b"\xff\xd8\xff\xe0" + bytes(100))
+        config = Config(
+            shows={"show1": "key1"}, base_url=BASE_URL, rate_limit=0, media_root=str(root)
+        )
+        mcp = FastMCP("test")
+        registry = register_tools(mcp, config)
+        async with Client(mcp) as client:
+            single = await client.call_tool(
+                "modify_episode",
+                {"show": "show1", "episode_id": "e1", "image_path": str(root / ".." / "cover.jpg")},
+            )
+            bulk = await client.call_tool(
+                "set_episode_images_bulk",
+                {"show": "show1", "images": [{"episode_id": "e2", "image_path": str(outside)}]},
+            )
+        assert "outside PODHOME_MEDIA_ROOT" in single.content[0].text
+        assert "outside PODHOME_MEDIA_ROOT" in json.loads(bulk.content[0].text)["items"][0]["error"]
+
+        config.media_root = None
+        async with Client(mcp) as client:
+            unset = await client.call_tool(
+                "modify_episode",
+                {"show": "show1", "episode_id": "e1", "image_path": str(outside)},
+            )
+        assert unset.content[0].text.startswith("Error: Reading local files is disabled")
+        assert not route.called
+        await registry.aclose()
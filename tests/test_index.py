@@ -0,0 +1,64 @@
+"""Tests for the per-show episode index."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from podhome_mcp.index import EpisodeIndex
+
+EPISODES = [
+    {"episode_id": "a", "title": "One", "status": "Published", "season_nr": 1, "episode_nr": 1, "publish_date": "2026-01-05T10:00:00Z"},
+    {"episode_id": "b", "title": "Two", "status": "Published", "season_nr": 1, "episode_nr": 2, "publish_date": "2026-02-05T10:00:00Z"},
+    {"episode_id": "c", "title": "Three", "status": "Scheduled", "season_nr": 2, "episode_nr": 1, "publish_date": "2026-03-05T10:00:00Z"},
+    {"episode_id": "d", "title": "Draft", "status": "Draft"},
+]
+
+
+@pytest.fixture
+def index():
+    """Create an index populated with sample episodes."""
+    idx = EpisodeIndex(MagicMock())
+    idx.update([dict(e) for e in EPISODES])
+    return idx
+
+
+class TestEpisodeIndex:
+    """Tests for EpisodeIndex lookups."""
+
+    def test_get_by_id(self, index):
+        """Test direct lookup by episode ID."""
+        assert index.get("b")["title"] == "Two"
+        assert index.get("missing") is None
+
+    def test_find_by_status(self, index):
+        """Test numeric and named status filters are equivalent."""
+        assert [e["episode_id"] for e in index.find(status=2)] == ["b", "a"]
+        assert [e["episode_id"] for e in index.find(status="scheduled")] == ["c"]
+
+    def test_find_by_number_and_date(self, index):
+        """Test season/episode and inclusive date range filters."""
+        assert [e["episode_id"] for e in index.find(episode_nr=1)] == ["c", "a"]
+        found = index.find(published_after="2026-02-01", published_before="2026-03-05")
+        assert [e["episode_id"] for e in found] == ["c", "b"]
+
+    def test_update_removes_and_reindexes(self, index):
+        """Test a later list drops missing episodes and moves changed ones."""
+        changed = dict(EPISODES[2], status="Published")
+        index.update([EPISODES[0], changed])
+        assert len(index) == 2
+        assert index.get("b") is None
+        assert [e["episode_id"] for e in index.find(status=2)] == ["c", "a"]
+        assert index.find(status=1) == []
+        assert index.find(published_after="2026-02-01") == [changed]
+
+    @pytest.mark.asyncio
+    async def test_refresh_skips_unchanged_source(self):
+        """Test a cached (identical) list object is not re-indexed."""
+        client = MagicMock()
+        client.list_episodes = AsyncMock(return_value=EPISODES)
+        idx = EpisodeIndex(client)
+        await idx.refresh()
+        idx.update = MagicMock()
+        await idx.refresh()
+        idx.update.assert_not_called()
+        assert len(idx) == 4
+
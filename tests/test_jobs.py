@@ -0,0 +1,101 @@
+"""Tests for the episode job tracker."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client, FastMCP
+
+from podhome_mcp.config import Config
+from podhome_mcp.jobs import EpisodeTracker, ready_when
+from podhome_mcp.tools import register_tools
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+class TestReadyWhen:
+    """Tests for ready_when."""
+
+    def test_status_and_fields(self):
+        """Test statuses match by number or name and fields must be non-empty."""
+        ready = ready_when([2, "Scheduled"], ["enclosure_url"])
+        assert ready({"status": "Published", "enclosure_url": "u"})
+        assert ready({"status": 1, "enclosure_url": "u"})
+        assert not ready({"status": "Draft", "enclosure_url": "u"})
+        assert not ready({"status": "Published", "enclosure_url": ""})
+        assert ready_when()({})
+
+
+class TestEpisodeTracker:
+    """Tests for EpisodeTracker."""
+
+    @pytest.mark.asyncio
+    async def test_waiters_share_polls(self, fake_client):
+        """Test several waiters are answered by one list request per poll."""
+        client = fake_client(
+            [{"episode_id": "e1", "status": "Draft"}, {"episode_id": "e2", "status": "Draft"}],
+            [{"episode_id": "e1", "status": "Published"}, {"episode_id": "e2", "status": "Draft"}],
+            [{"episode_id": "e1", "status": "Published"}, {"episode_id": "e2", "status": "Published"}],
+        )
+        tracker = EpisodeTracker(client, base_delay=0.01, max_delay=0.02)
+        published = ready_when(["Published"])
+        (e1, ok1, _), (e2, ok2, info) = await asyncio.gather(
+            tracker.wait("e1", published, 5), tracker.wait("e2", published, 5)
+        )
+        assert ok1 and ok2 and e2["status"] == "Published"
+        assert client.calls == info["polls"] == 3
+        assert set(client.max_ages) == {0}
+        assert len(tracker) == 0
+        await tracker.aclose()
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_latest(self, fake_client):
+        """Test a timeout returns the last record seen and backs off between polls."""
+        client = fake_client([{"episode_id": "e1", "status": "Draft"}])
+        tracker = EpisodeTracker(client, base_delay=0.05, max_delay=1)
+        episode, reached, info = await tracker.wait("e1", ready_when([2]), 0.3)
+        assert not reached and episode["status"] == "Draft"
+        assert 2 <= info["polls"] <= 4
+        await tracker.aclose()
+
+    def test_delay_is_jittered_and_capped(self):
+        """Test delays grow exponentially within [ceiling/2, ceiling]."""
+        tracker = EpisodeTracker(None, base_delay=1, max_delay=8)
+        for attempt, ceiling in [(0, 1), (2, 4), (10, 8)]:
+            assert ceiling / 2 <= tracker.delay(attempt) <= ceiling
+
+
+class TestWaitForEpisodeTool:
+    """Tests for the wait_for_episode tool."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_revalidates_instead_of_using_cache(self):
+        """Test each poll revalidates the cached list rather than serving it."""
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            side_effect=[
+                httpx.Response(200, json=[{"episode_id": "e1", "status": "Draft"}], headers={"ETag": '"1"'}),
+                httpx.Response(304),
+                httpx.Response(200, json=[{"episode_id": "e1", "status": "Published", "title": "T"}]),
+            ]
+        )
+        config = Config(
+            shows={"show1": "key1"},
+            base_url=BASE_URL,
+            rate_limit=0,
+            poll_base_delay=0.01,
+            poll_max_delay=0.02,
+        )
+        mcp = FastMCP("test")
+        registry = register_tools(mcp, config)
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "wait_for_episode", {"show": "show1", "episode_id": "e1", "status": [2]}
+            )
+        data = json.loads(result.content[0].text)
+        assert data["reached"] and data["polls"] == 3
+        assert data["episode"] == {"episode_id": "e1", "title": "T", "status": "Published"}
+        assert route.calls[1].request.headers["If-None-Match"] == '"1"'
+        await registry.aclose()
@@ -0,0 +1,144 @@
+"""Tests for streamed list_episodes parsing."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+import respx
+
+from podhome_mcp.client import PodhomeClient
+from podhome_mcp.jsonstream import iter_json_array, take_page
+from podhome_mcp.resilience import RetryPolicy
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+async def chunked(data: bytes, size: int):
+    """Yield data in fixed-size chunks."""
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+async def parse(data: bytes, size: int) -> list:
+    return [item async for item in iter_json_array(chunked(data, size))]
+
+
+class TestIterJsonArray:
+    """Tests for the incremental array parser."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", [1, 3, 64, 1 << 20])
+    async def test_roundtrip_any_chunk_size(self, size):
+        """Test elements are identical regardless of chunk boundaries."""
+        items = [
+            {"episode_id": str(i), "title": "Épisode ✓", "n": 12345, "x": [1.5e3, None]}
+            for i in range(20)
+        ] + [-2.5e-3, True, "tail"]
+        data = json.dumps(items, ensure_ascii=False).encode()
+        assert await parse(data, size) == items
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("data", [b"{}", b"[1,]", b"[1 2]", b"[1", b"[1]x"])
+    async def test_malformed(self, data):
+        """Test malformed or non-array bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            await parse(data, 1)
+
+    @pytest.mark.asyncio
+    async def test_take_page_stops_early(self):
+        """Test take_page closes the source once the page is full."""
+        consumed = []
+
+        async def source():
+            for i in range(100):
+                consumed.append(i)
+                yield i
+
+        page, more = await take_page(source(), offset=5, limit=3)
+        assert page == [5, 6, 7]
+        assert more is True
+        assert len(consumed) == 9
+
+
+class TestIterEpisodes:
+    """Tests for PodhomeClient.iter_episodes."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_iter_episodes(self):
+        """Test episodes are streamed with the transcript flag set."""
+        episodes = [{"episode_id": str(i)} for i in range(3)]
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=episodes)
+        )
+        client = PodhomeClient("test-api-key", BASE_URL)
+        result = [e async for e in client.iter_episodes(include_transcript=True)]
+        assert result == episodes
+        assert route.calls[0].request.url.params["includeTranscript"] == "true"
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_retries_before_first_item(self):
+        """Test a 429 or 503 before the body is read is retried, honouring Retry-After."""
+        episodes = [{"episode_id": "1"}]
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(503),
+                httpx.Response(200, json=episodes),
+            ]
+        )
+        client = PodhomeClient("test-api-key", BASE_URL, retry=RetryPolicy(3, 0.01, 1.0))
+        assert [e async for e in client.iter_episodes()] == episodes
+        assert route.call_count == 3
+
+        route.side_effect = [httpx.Response(503)] * 3
+        with pytest.raises(httpx.HTTPStatusError):
+            [e async for e in client.iter_episodes()]
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_releases_slot_during_backoff(self):
+        """Test the in-flight slot is free for other callers while a retry waits."""
+        episodes = [{"episode_id": "1"}]
+        respx.get(f"{BASE_URL}/api/episodes").mock(
+            side_effect=[
+                httpx.Response(503, headers={"Retry-After": "1"}),
+                httpx.Response(200, json=episodes),
+            ]
+        )
+        client = PodhomeClient(
+            "test-api-key", BASE_URL, retry=RetryPolicy(3, 0.01, 1.0), max_inflight=1
+        )
+
+        async def consume():
+            return [e async for e in client.iter_episodes()]
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.1)
+        assert not client._slots.locked()
+        assert await task == episodes
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_midstream_error_recorded_once(self):
+        """Test a transport error while reading the body is recorded as one failed attempt."""
+
+        async def broken():
+            yield b'[{"episode_id": "1"},'
+            raise httpx.ReadError("connection reset")
+
+        respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, stream=broken())
+        )
+        client = PodhomeClient("test-api-key", BASE_URL)
+        recorded = []
+        record = client._record
+        client._record = lambda r: recorded.append(r) or record(r)
+        with pytest.raises(httpx.ReadError):
+            [e async for e in client.iter_episodes()]
+        assert recorded == [None]
+        await client.aclose()
@@ -0,0 +1,101 @@
+"""Tests for metrics collection."""
+
+import httpx
+import pytest
+import respx
+
+from podhome_mcp.cache import ResponseCache
+from podhome_mcp.client import PodhomeClient
+from podhome_mcp.metrics import Histogram, Metrics, instrument
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_quantiles(self):
+        """Test quantile estimates fall in the right bucket and within range."""
+        hist = Histogram(buckets=(0.1, 1.0, 10.0))
+        for value in [0.05] * 90 + [5.0] * 10:
+            hist.observe(value)
+        assert 0.05 <= hist.quantile(0.5) <= 0.1
+        assert 1.0 <= hist.quantile(0.99) <= 5.0
+        assert hist.count == 100
+
+
+class TestMetrics:
+    """Tests for Metrics and tool instrumentation."""
+
+    @pytest.mark.asyncio
+    async def test_instrument_counts_errors(self):
+        """Test tool calls are timed and "Error:" results counted as errors."""
+        metrics = Metrics()
+
+        async def my_tool(show: str) -> str:
+            return "Error: nope" if show == "bad" else "ok"
+
+        wrapped = instrument(my_tool, metrics, {"good", "bad"})
+        assert wrapped.__name__ == "my_tool"
+        await wrapped(show="good")
+        await wrapped(show="bad")
+        assert metrics.counter("podhome_tool_calls_total", tool="my_tool", show="good", outcome="ok") == 1
+        assert metrics.counter("podhome_tool_calls_total", tool="my_tool", show="bad", outcome="error") == 1
+
+    @pytest.mark.asyncio
+    async def test_instrument_bounds_show_labels(self):
+        """Test unconfigured shows share one label and multi-show selectors another."""
+        metrics = Metrics()
+
+        async def my_tool(show) -> str:
+            return "ok"
+
+        wrapped = instrument(my_tool, metrics, {"a"})
+        for show in ("a", 'bad"\nshow0', "other", "*", ["a", "b"], "a,b"):
+            await wrapped(show=show)
+        counts = metrics.summary()["podhome_tool_calls_total"]
+        assert counts == {
+            "outcome=ok,show=a,tool=my_tool": 1,
+            "outcome=ok,show=multi,tool=my_tool": 3,
+            "outcome=ok,show=unknown,tool=my_tool": 2,
+        }
+
+    def test_prometheus_format(self):
+        """Test the text exposition contains counters and histogram series."""
+        metrics = Metrics()
+        metrics.inc("podhome_http_requests_total", status=200, show="a")
+        metrics.observe("podhome_http_request_duration_seconds", 0.02, show="a")
+        text = metrics.prometheus()
+        assert 'podhome_http_requests_total{show="a",status="200"} 1' in text
+        assert 'podhome_http_request_duration_seconds_bucket{show="a",le="+Inf"} 1' in text
+        assert 'podhome_http_request_duration_seconds_count{show="a"} 1' in text
+
+    def test_prometheus_escapes_label_values(self):
+        """Test quotes, backslashes and newlines in label values can't break a line."""
+        metrics = Metrics()
+        metrics.inc("podhome_webhook_events_total", event='a"b\\c\nd')
+        assert metrics.prometheus().splitlines()[1] == (
+            'podhome_webhook_events_total{event="a\\"b\\\\c\\nd"} 1'
+        )
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_client_records_requests_and_cache(self):
+        """Test HTTP status, bytes and cache outcomes are recorded per show."""
+        respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=[{"episode_id": "1"}])
+        )
+        metrics = Metrics()
+        client = PodhomeClient(
+            "test-api-key",
+            BASE_URL,
+            name="a",
+            cache=ResponseCache(ttl=60, max_entries=4),
+            metrics=metrics,
+        )
+        await client.list_episodes()
+        await client.list_episodes()
+        labels = {"show": "a", "endpoint": "GET /api/episodes"}
+        assert metrics.counter("podhome_http_requests_total", status=200, **labels) == 1
+        assert metrics.counter("podhome_http_response_bytes_total", **labels) > 0
+        assert metrics.counter("podhome_cache_requests_total", show="a", result="hit") == 1
@@ -0,0 +1,56 @@
+"""Tests for compact tool output rendering."""
+
+import json
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from podhome_mcp.config import Config
+from podhome_mcp.output import render, select, trim
+from podhome_mcp.tools import register_tools
+
+
+class TestRender:
+    """Tests for render and its helpers."""
+
+    def test_plain_list_is_bare_json(self):
+        """Test an untruncated list renders as a compact JSON array."""
+        assert render([{"a": 1}, {"a": 2}]) == '[{"a":1},{"a":2}]'
+
+    def test_fields_and_trim(self):
+        """Test field selection and long-string truncation."""
+        out = json.loads(
+            render({"title": "t", "description": "x" * 30, "n": 1}, fields=["description"], max_field_chars=10)
+        )
+        assert out == {"description": "x" * 10 + "…[+20 chars]"}
+        assert select({"a": 1, "b": 2}, ["b", "c"]) == {"b": 2}
+        data = {"a": ["short"]}
+        assert trim(data, 10) is data
+
+    def test_byte_budget_pages(self):
+        """Test items beyond the byte budget are cut with a next_offset."""
+        items = [{"id": i, "text": "y" * 40} for i in range(10)]
+        out = json.loads(render(items, max_bytes=200, key="episodes", offset=20))
+        assert out["truncated"] is True
+        assert out["next_offset"] == 20 + len(out["episodes"])
+        assert 0 < len(out["episodes"]) < 10
+
+    def test_meta_envelope(self):
+        """Test meta values wrap the list and None values are dropped."""
+        out = json.loads(render([1], key="webhooks", meta={"errors": {"b": "boom"}, "x": None}))
+        assert out == {"webhooks": [1], "errors": {"b": "boom"}}
+
+
+class TestToolOutput:
+    """Tests for tools sharing the JSON output layer."""
+
+    @pytest.mark.asyncio
+    async def test_list_shows_is_json(self):
+        """Test list_shows returns the configured slugs as a JSON array."""
+        config = Config(shows={"a": "k1", "b": "k2"})
+        mcp = FastMCP("test")
+        registry = register_tools(mcp, config)
+        async with Client(mcp) as client:
+            result = await client.call_tool("list_shows", {})
+        assert json.loads(result.content[0].text) == ["a", "b"]
+        await registry.aclose()
@@ -0,0 +1,90 @@
+"""Tests for tool call profiling."""
+
+import json
+import time
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client, FastMCP
+
+from podhome_mcp.config import Config
+from podhome_mcp.profiling import Profiler, phase
+from podhome_mcp.tools import register_tools
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+def busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class TestProfiler:
+    """Tests for Profiler."""
+
+    @pytest.mark.asyncio
+    async def test_off_by_default(self, tmp_path):
+        """Test nothing is profiled or written unless armed or a threshold is set."""
+        profiler = Profiler(str(tmp_path))
+        async with profiler.session("t") as session:
+            assert session is None
+            with phase("http"):
+                pass
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_threshold(self, tmp_path):
+        """Test only calls at least as slow as the threshold are written."""
+        profiler = Profiler(str(tmp_path), threshold=0.05, interval=0.001)
+        async with profiler.session("fast"):
+            pass
+        async with profiler.session("slow") as session:
+            with phase("decode"):
+                busy(0.06)
+        assert session.phases["decode"] >= 0.06
+        (summary,) = profiler.captures
+        assert summary["tool"] == "slow" and summary["samples"] > 0
+        folded = open(summary["folded"]).read().splitlines()
+        assert any("test_profiling:busy" in line for line in folded)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded)
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_arm_counts_down(self, tmp_path):
+        """Test arming profiles exactly the next n calls."""
+        profiler = Profiler(str(tmp_path))
+        profiler.arm(2)
+        for _ in range(3):
+            async with profiler.session("t"):
+                pass
+        assert profiler.armed == 0
+        assert len(profiler.captures) == 2
+
+
+class TestProfileTool:
+    """Tests for the profile_next_calls tool."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_phases(self, tmp_path):
+        """Test a profiled tool call reports http, decode, render and fastmcp phases."""
+        respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=[{"episode_id": "e1", "title": "T"}])
+        )
+        config = Config(
+            shows={"show1": "key1"}, base_url=BASE_URL, rate_limit=0, profile_dir=str(tmp_path)
+        )
+        mcp = FastMCP("test")
+        registry = register_tools(mcp, config)
+        async with Client(mcp) as client:
+            armed = json.loads((await client.call_tool("profile_next_calls", {"n": 1})).content[0].text)
+            assert armed["armed"] == 1 and armed["directory"] == str(tmp_path)
+            await client.call_tool("list_episodes", {"show": "show1"})
+            await client.call_tool("list_shows", {})
+            report = json.loads((await client.call_tool("profile_next_calls", {"n": 0})).content[0].text)
+        (capture,) = report["recent"]
+        assert capture["tool"] == "list_episodes"
+        assert {"http", "decode", "render", "fastmcp", "tool_other"} <= capture["phases_ms"].keys()
+        await registry.aclose()
@@ -0,0 +1,137 @@
+"""Tests for rate limiting, retries and the circuit breaker."""
+
+import httpx
+import pytest
+import respx
+
+from podhome_mcp.client import PodhomeClient
+from podhome_mcp.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    TokenBucket,
+    parse_retry_after,
+)
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+class TestTokenBucket:
+    """Tests for the adaptive token bucket."""
+
+    def test_burst_then_refill(self, clock):
+        """Test the burst is spent first, then tokens refill at `rate`."""
+        bucket = TokenBucket(rate=2, burst=2, clock=clock)
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == 0
+        assert bucket.try_acquire() == pytest.approx(0.5)
+        clock.now = 0.5
+        assert bucket.try_acquire() == 0
+
+    def test_throttle_halves_rate_and_pauses(self, clock):
+        """Test a 429 halves the rate, honours Retry-After and then recovers."""
+        bucket = TokenBucket(rate=10, burst=5, clock=clock)
+        bucket.on_throttle(retry_after=3)
+        assert bucket.rate == 5
+        assert bucket.try_acquire() == pytest.approx(3)
+        for _ in range(20):
+            bucket.on_success()
+        assert bucket.rate == 10
+
+
+class TestRetryPolicy:
+    """Tests for backoff computation."""
+
+    def test_backoff_bounds(self):
+        """Test jittered delays stay within the exponential envelope."""
+        policy = RetryPolicy(max_attempts=4, base_delay=1, max_delay=3)
+        assert 0 <= policy.delay(0) <= 1
+        assert 0 <= policy.delay(2) <= 3
+        assert policy.delay(3) is None
+
+    def test_retry_after(self):
+        """Test Retry-After is honoured unless it exceeds max_delay."""
+        policy = RetryPolicy(max_attempts=3, base_delay=0.1, max_delay=5)
+        assert 2 <= policy.delay(0, retry_after=2) <= 2.1
+        assert policy.delay(0, retry_after=60) is None
+        assert parse_retry_after("7") == 7
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=1445412470) == 10
+
+
+class TestCircuitBreaker:
+    """Tests for circuit breaker state transitions."""
+
+    def test_open_probe_close(self, clock):
+        """Test open -> half-open single probe -> closed."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        breaker.check()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        clock.now = 10
+        breaker.check()
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_failed_probe_reopens(self, clock):
+        """Test a failed probe re-opens the circuit immediately."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        breaker.check()
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+
+class TestClientRetries:
+    """Tests for retry behaviour in PodhomeClient."""
+
+    @pytest.fixture
+    def client(self):
+        return PodhomeClient(
+            "test-api-key",
+            BASE_URL,
+            retry=RetryPolicy(max_attempts=3, base_delay=0.001, max_delay=1),
+            breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60),
+        )
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_get_retries_transient_errors(self, client):
+        """Test idempotent GETs are retried on 429/5xx."""
+        route = respx.get(f"{BASE_URL}/api/hook").mock(
+            side_effect=[
+                httpx.Response(503),
+                httpx.Response(429, headers={"Retry-After": "0"}),
+                httpx.Response(200, json=[{"integration_id": "1"}]),
+            ]
+        )
+        assert await client.list_webhooks() == [{"integration_id": "1"}]
+        assert route.call_count == 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_post_not_retried(self, client):
+        """Test non-idempotent writes are sent exactly once."""
+        route = respx.post(f"{BASE_URL}/api/createclip").mock(
+            return_value=httpx.Response(503)
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.create_clip({"episode_id": "1"})
+        assert route.call_count == 1
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_circuit_fails_fast(self, client):
+        """Test repeated server errors open the circuit."""
+        route = respx.get(f"{BASE_URL}/api/hook").mock(return_value=httpx.Response(500))
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.list_webhooks()
+        assert route.call_count == 3
+        with pytest.raises(CircuitOpenError):
+            await client.list_webhooks()
+        assert route.call_count == 3
@@ -0,0 +1,110 @@
+"""Tests for the server entry point."""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+
+import pytest
+
+from podhome_mcp.server import handle_shutdown, parse_args
+
+
+class TestParseArgs:
+    """Tests for command-line parsing."""
+
+    def test_defaults_defer_to_config(self):
+        """Test unset options are None so environment config applies."""
+        args = parse_args([])
+        assert args.transport is None
+        assert args.host is None
+        assert args.port is None
+
+    def test_http_options(self):
+        """Test HTTP transport options are parsed."""
+        args = parse_args(["--transport", "http", "--host", "0.0.0.0", "--port", "9000"])
+        assert args.transport == "http"
+        assert args.host == "0.0.0.0"
+        assert args.port == 9000
+
+    def test_check_startup_flag(self):
+        """Test --check-startup is parsed."""
+        assert parse_args(["--check-startup"]).check_startup is True
+
+
+class TestShutdown:
+    """Tests for the stdio SIGTERM handler."""
+
+    def test_ignores_further_sigterm(self):
+        """Test the handler interrupts once and ignores SIGTERM during cleanup."""
+        previous = signal.signal(signal.SIGTERM, handle_shutdown)
+        try:
+            with pytest.raises(KeyboardInterrupt):
+                handle_shutdown(signal.SIGTERM, None)
+            assert signal.getsignal(signal.SIGTERM) is signal.SIG_IGN
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+
+
+def run_python(code: str, **env: str) -> subprocess.CompletedProcess:
+    """Run ``code`` in a fresh interpreter that can import podhome_mcp."""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), **env},
+    )
+
+
+class TestStartup:
+    """Tests for cold-start cost."""
+
+    # Generous enough for slow CI machines; importing fastmcp alone takes >1s
+    IMPORT_BUDGET_SECONDS = 0.5
+    # Our own modules only, with fastmcp, httpx and pydantic already loaded
+    TOOLS_IMPORT_BUDGET_SECONDS = 0.25
+
+    def test_import_budget(self):
+        """Test importing the entry point stays cheap and defers heavy dependencies."""
+        result = run_python(
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import podhome_mcp.server\n"
+            "elapsed = time.perf_counter() - start\n"
+            "heavy = [m for m in ('fastmcp', 'httpx', 'pydantic_settings') if m in sys.modules]\n"
+            "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+        )
+        assert result.returncode == 0, result.stderr
+        report = json.loads(result.stdout)
+        assert report["heavy"] == []
+        assert report["elapsed"] < self.IMPORT_BUDGET_SECONDS
+
+    def test_tools_import_budget(self):
+        """Test importing the tool module after its dependencies is fast and skips optional extras."""
+        result = run_python(
+            "import json, sys, time\n"
+            "import fastmcp, httpx, pydantic_settings\n"
+            "start = time.perf_counter()\n"
+            "import podhome_mcp.tools\n"
+            "elapsed = time.perf_counter() - start\n"
+            "heavy = [m for m in ('numpy', 'boto3', 'botocore', 'PIL') if m in sys.modules]\n"
+            "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+        )
+        assert result.returncode == 0, result.stderr
+        report = json.loads(result.stdout)
+        assert report["heavy"] == []
+        assert report["elapsed"] < self.TOOLS_IMPORT_BUDGET_SECONDS
+
+    def test_check_startup_report(self):
+        """Test --check-startup times every phase up to the first tools/list."""
+        result = run_python(
+            "from podhome_mcp.server import main; main(['--check-startup'])",
+            PODHOME_SHOWS='{"show1": "key1"}',
+        )
+        assert result.returncode == 0, result.stderr
+        phases = [line.rsplit(None, 2)[0] for line in result.stdout.splitlines()]
+        assert phases[:4] == ["import fastmcp", "import podhome_mcp", "load_config", "register_tools"]
+        assert phases[-2].startswith("tools/list (")
+        assert phases[-1] == "total"
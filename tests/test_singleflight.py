@@ -0,0 +1,70 @@
+"""Tests for request coalescing."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from podhome_mcp.client import PodhomeClient
+from podhome_mcp.singleflight import SingleFlight
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+class TestSingleFlight:
+    """Tests for SingleFlight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_result(self):
+        """Test concurrent calls with one key run the work once."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [calls]
+
+        results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert flight.coalesced == 4
+        assert len(flight) == 0
+        await flight.do("k", work)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_exception_shared(self):
+        """Test every waiter sees the leader's exception."""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(flight.do("k", work) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+class TestClientCoalescing:
+    """Tests for coalesced reads in PodhomeClient."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_parallel_list_episodes(self):
+        """Test parallel identical reads issue one upstream request."""
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=[{"episode_id": "1"}])
+        )
+        client = PodhomeClient("test-api-key", BASE_URL)
+        results = await asyncio.gather(
+            *(client.list_episodes(status=2) for _ in range(4)),
+            client.list_episodes(status=1),
+        )
+        assert route.call_count == 2
+        assert results[0] == [{"episode_id": "1"}]
+        assert client.inflight.coalesced == 3
@@ -0,0 +1,192 @@
+"""Tests for S3/R2 media storage."""
+
+import json
+import os
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from podhome_mcp.cache import ResponseCache
+from podhome_mcp.client import ClientRegistry
+from podhome_mcp.config import Config
+from podhome_mcp.storage import MIN_PART_SIZE, FileSlice, MediaStorage
+from podhome_mcp.tools import register_tools
+
+BUCKET = "podcasts"
+
+
+class TestFileSlice:
+    """Tests for FileSlice."""
+
+    def test_reads_only_its_range(self, tmp_path):
+        """Test a slice reads, seeks and rewinds within its byte range."""
+        path = tmp_path / "f.bin"
+        path.write_bytes(bytes(range(100)))
+        with FileSlice(str(path), 10, 20) as part:
+            assert len(part) == 20
+            assert part.read(5) == bytes(range(10, 15))
+            assert part.read() == bytes(range(15, 30))
+            assert part.read() == b""
+            part.seek(0)
+            assert part.read(100) == bytes(range(10, 30))
+            assert part.seek(-5, os.SEEK_END) == 15
+
+
+@pytest.fixture
+def s3():
+    """Yield a boto3 S3 client backed by moto with one empty bucket."""
+    boto3 = pytest.importorskip("boto3")
+    moto = pytest.importorskip("moto")
+    with moto.mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        yield client
+
+
+@pytest.fixture
+def storage(s3):
+    return MediaStorage(
+        s3,
+        endpoint_url="https://s3.example.com",
+        default_bucket=BUCKET,
+        part_size=MIN_PART_SIZE,
+        concurrency=3,
+        head_cache=ResponseCache(60, 16),
+    )
+
+
+class TestMediaStorage:
+    """Tests for MediaStorage."""
+
+    @pytest.mark.asyncio
+    async def test_multipart_upload(self, storage, s3, tmp_path):
+        """Test a file larger than one part is uploaded intact in several parts."""
+        path = tmp_path / "episode.mp3"
+        data = os.urandom(2 * MIN_PART_SIZE + 1234)
+        path.write_bytes(data)
+        meta = await storage.upload(str(path), "shows/ep1.mp3")
+        assert meta["size_bytes"] == len(data)
+        assert meta["content_type"] == "audio/mpeg"
+        assert meta["etag"].strip('"').endswith("-3")
+        assert s3.get_object(Bucket=BUCKET, Key="shows/ep1.mp3")["Body"].read() == data
+
+    @pytest.mark.asyncio
+    async def test_small_upload_and_head_cache(self, storage, tmp_path):
+        """Test small files use one request and HeadObject results are cached."""
+        path = tmp_path / "clip.mp3"
+        path.write_bytes(b"x" * 100)
+        await storage.upload(str(path))
+        hits = storage.head_cache.hits
+        meta = await storage.head("clip.mp3")
+        assert meta["size_bytes"] == 100
+        assert storage.head_cache.hits == hits + 1
+
+        path.write_bytes(b"y" * 200)
+        meta = await storage.upload(str(path))
+        assert meta["size_bytes"] == 200
+
+    @pytest.mark.asyncio
+    async def test_missing_object(self, storage):
+        """Test a missing object raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await storage.head("missing.mp3")
+
+    @pytest.mark.asyncio
+    async def test_urls(self, storage, tmp_path):
+        """Test public URLs for custom domains, R2 accounts and presigning."""
+        path = tmp_path / "a b.mp3"
+        path.write_bytes(b"x")
+        await storage.upload(str(path))
+        assert storage.public_url("a b.mp3") == "https://s3.example.com/podcasts/a%20b.mp3"
+        assert (
+            storage.public_url("a b.mp3", custom_domain="https://cdn.example.com/")
+            == "https://cdn.example.com/a%20b.mp3"
+        )
+        storage.account_id = "acct"
+        assert storage.public_url("k") == "https://podcasts.acct.r2.cloudflarestorage.com/k"
+        resolved = await storage.resolve("a b.mp3", presign=True)
+        assert "Signature=" in resolved["public_url"]
+        assert resolved["size_bytes"] == 1
+
+
+class TestStorageTools:
+    """Tests for the storage tools."""
+
+    @pytest.mark.asyncio
+    async def test_not_configured(self):
+        """Test a clear error when no storage settings are present."""
+        config = Config(shows={"show1": "key1"})
+        mcp = FastMCP("test")
+        register_tools(mcp, config)
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "get_r2_public_url", {"bucket": BUCKET, "object_key": "a.mp3"}
+            )
+        assert result.content[0].text.startswith("Error: Storage is not configured")
+
+    @pytest.mark.asyncio
+    async def test_upload_then_resolve(self, s3, tmp_path):
+        """Test upload_media returns a URL that get_r2_public_url also resolves."""
+        config = Config(
+            shows={"show1": "key1"},
+            s3_endpoint_url="https://s3.us-east-1.amazonaws.com",
+            r2_access_key_id="id",
+            r2_secret_access_key="secret",
+            r2_public_domain="cdn.example.com",
+            s3_region="us-east-1",
+            storage_bucket=BUCKET,
+            media_root=str(tmp_path),
+        )
+        registry = ClientRegistry(config)
+        mcp = FastMCP("test")
+        register_tools(mcp, config, registry)
+        path = tmp_path / "ep.mp3"
+        path.write_bytes(b"audio")
+        async with Client(mcp) as client:
+            uploaded = json.loads(
+                (await client.call_tool("upload_media", {"path": str(path), "object_key": "s/ep.mp3"}))
+                .content[0]
+                .text
+            )
+            resolved = json.loads(
+                (await client.call_tool("get_r2_public_url", {"bucket": BUCKET, "object_key": "s/ep.mp3"}))
+                .content[0]
+                .text
+            )
+        assert uploaded["public_url"] == "https://cdn.example.com/s/ep.mp3"
+        assert resolved == uploaded
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_upload_confined_to_media_root(self, s3, tmp_path):
+        """Test upload_media needs PODHOME_MEDIA_ROOT and rejects paths resolving outside it."""
+        root = tmp_path / "media"
+        root.mkdir()
+        (root / "ep.mp3").write_bytes(b"audio")
+        secret = tmp_path / "secret.txt"
+        secret.write_bytes(b"key")
+        (root / "link.mp3").symlink_to(secret)
+        config = Config(
+            shows={"show1": "key1"},
+            s3_endpoint_url="https://s3.us-east-1.amazonaws.com",
+            r2_access_key_id="id",
+            r2_secret_access_key="secret",
+            s3_region="us-east-1",
+            storage_bucket=BUCKET,
+            media_root=str(root),
+        )
+        registry = ClientRegistry(config)
+        mcp = FastMCP("test")
+        register_tools(mcp, config, registry)
+        async with Client(mcp) as client:
+            for path in (secret, root / "link.mp3", root / ".." / "secret.txt"):
+                result = await client.call_tool("upload_media", {"path": str(path)})
+                assert "outside PODHOME_MEDIA_ROOT" in result.content[0].text
+            config.media_root = None
+            result = await client.call_tool("upload_media", {"path": str(root / "ep.mp3")})
+            assert result.content[0].text.startswith("Error: Reading local files is disabled")
+            config.media_root = str(root)
+            result = await client.call_tool("upload_media", {"path": str(root / "ep.mp3")})
+            assert json.loads(result.content[0].text)["object_key"] == "ep.mp3"
+        assert [o["Key"] for o in s3.list_objects_v2(Bucket=BUCKET)["Contents"]] == ["ep.mp3"]
+        await registry.aclose()
@@ -0,0 +1,165 @@
+"""Tests for the persistent episode store."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from podhome_mcp.client import ClientRegistry
+from podhome_mcp.codec import dumps
+from podhome_mcp.config import Config
+from podhome_mcp.store import EpisodeStore
+
+BASE_URL = "https://serve.podhome.fm"
+EPISODES = [{"episode_id": "e1", "title": "One", "chapters": [{"start": 0}]}]
+KEY = (None, None, True, None, None)
+
+
+class TestEpisodeStore:
+    """Tests for EpisodeStore."""
+
+    @pytest.mark.asyncio
+    async def test_batched_writes_survive_reopen(self, tmp_path):
+        """Test queued writes are visible at once and committed in one transaction."""
+        path = str(tmp_path / "store.sqlite3")
+        store = EpisodeStore(path, flush_interval=60)
+        for i in range(3):
+            await store.put("c1", (i,), dumps([{"episode_id": str(i)}]), etag=f'"{i}"')
+        stored, fresh = await store.get("c1", (2,))
+        assert fresh and stored.value == [{"episode_id": "2"}]
+        assert store.stats()["pending"] == 3
+        await store.aclose()
+        assert (store.flushes, store.writes) == (1, 3)
+
+        reopened = EpisodeStore(path)
+        stored, _ = await reopened.get("c1", (1,))
+        assert (stored.value, stored.etag) == ([{"episode_id": "1"}], '"1"')
+        await reopened.aclose()
+
+    @pytest.mark.asyncio
+    async def test_staleness_bounds(self, tmp_path, clock):
+        """Test rows go stale after ttl and disappear after max_age."""
+        store = EpisodeStore(str(tmp_path / "s.sqlite3"), ttl=60, max_age=3600, clock=clock)
+        await store.put("c1", KEY, dumps(EPISODES))
+        await store.flush()
+        clock.now += 61
+        stored, fresh = await store.get("c1", KEY)
+        assert stored.value == EPISODES and not fresh
+        clock.now += 3600
+        assert await store.get("c1", KEY) == (None, False)
+        await store.aclose()
+
+    @pytest.mark.asyncio
+    async def test_touch_only_updates_fetch_time(self, tmp_path, clock):
+        """Test a revalidation refreshes a row's age without rewriting its body."""
+        store = EpisodeStore(str(tmp_path / "s.sqlite3"), ttl=60, clock=clock)
+        await store.put("c1", KEY, dumps(EPISODES), etag='"v1"')
+        await store.flush()
+        clock.now += 61
+        store.touch("c1", KEY)
+        stored, fresh = await store.get("c1", KEY)
+        assert fresh and stored.fetched_at == clock.now
+        await store.flush()
+        assert store.writes == 1
+        stored, fresh = await store.get("c1", KEY)
+        assert fresh and (stored.value, stored.etag) == (EPISODES, '"v1"')
+        await store.aclose()
+
+    @pytest.mark.asyncio
+    async def test_put_dropped_when_cleared_meanwhile(self, tmp_path):
+        """Test a body still being compressed when its client is cleared is not stored."""
+        store = EpisodeStore(str(tmp_path / "s.sqlite3"))
+        put = asyncio.create_task(store.put("c1", KEY, dumps(EPISODES)))
+        await asyncio.sleep(0)
+        store.clear("c1")
+        await put
+        assert (await store.get("c1", KEY))[0] is None
+        await store.aclose()
+
+    @pytest.mark.asyncio
+    async def test_clear(self, tmp_path):
+        """Test clearing a client hides its rows before and after the flush."""
+        store = EpisodeStore(str(tmp_path / "s.sqlite3"))
+        await store.put("c1", KEY, dumps(EPISODES))
+        await store.put("c2", KEY, dumps(EPISODES))
+        await store.flush()
+        store.clear("c1")
+        assert (await store.get("c1", KEY))[0] is None
+        await store.flush()
+        assert (await store.get("c1", KEY))[0] is None
+        assert (await store.get("c2", KEY))[0] is not None
+        await store.aclose()
+
+
+class TestWarmRestart:
+    """Tests for the store behind PodhomeClient.list_episodes."""
+
+    def registry(self, tmp_path, **kwargs):
+        config = Config(
+            shows={"show1": "key1"},
+            base_url=BASE_URL,
+            rate_limit=0,
+            cache_dir=str(tmp_path),
+            **kwargs,
+        )
+        return ClientRegistry(config)
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_restart_is_served_from_disk(self, tmp_path):
+        """Test a new registry reuses what a previous one fetched."""
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=EPISODES, headers={"ETag": '"v1"'})
+        )
+        first = self.registry(tmp_path)
+        await first.get("show1").list_episodes(include_chapters=True)
+        await first.aclose()
+
+        second = self.registry(tmp_path)
+        client = second.get("show1")
+        assert await client.list_episodes(include_chapters=True) == EPISODES
+        assert await client.list_episodes(include_chapters=True) == EPISODES
+        assert route.call_count == 1
+        assert second.store.hits == 1
+        await second.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_stale_row_is_revalidated(self, tmp_path):
+        """Test a stale stored response is revalidated with its ETag."""
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            side_effect=[
+                httpx.Response(200, json=EPISODES, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+        first = self.registry(tmp_path, cache_ttl=0)
+        await first.get("show1").list_episodes()
+        await first.aclose()
+
+        second = self.registry(tmp_path, cache_ttl=0)
+        assert await second.get("show1").list_episodes() == EPISODES
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        await second.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_write_clears_store(self, tmp_path):
+        """Test a write through one registry hides stored lists from the next."""
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=EPISODES)
+        )
+        respx.post(f"{BASE_URL}/api/modify_episode").mock(
+            return_value=httpx.Response(200, json={})
+        )
+        first = self.registry(tmp_path)
+        client = first.get("show1")
+        await client.list_episodes()
+        await client.modify_episode({"episode_id": "e1", "title": "New"})
+        await first.aclose()
+
+        second = self.registry(tmp_path)
+        await second.get("show1").list_episodes()
+        assert route.call_count == 2
+        await second.aclose()
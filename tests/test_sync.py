@@ -0,0 +1,101 @@
+"""Tests for delta sync of episode lists."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client, FastMCP
+
+from podhome_mcp.config import Config
+from podhome_mcp.sync import EpisodeSync
+from podhome_mcp.tools import register_tools
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+class TestEpisodeSync:
+    """Tests for EpisodeSync."""
+
+    @pytest.mark.asyncio
+    async def test_added_removed_changed(self, fake_client):
+        """Test a diff reports added, removed and changed episodes with field names."""
+        client = fake_client(
+            [
+                {"episode_id": "a", "title": "A", "status": "Draft"},
+                {"episode_id": "b", "title": "B", "status": "Draft"},
+            ]
+        )
+        sync = EpisodeSync(client)
+        baseline = await sync.changes()
+        assert baseline["episodes"] == 2
+
+        client.episodes = [
+            {"episode_id": "a", "title": "A", "status": "Published", "publish_date": "2024"},
+            {"episode_id": "c", "title": "C"},
+        ]
+        delta = await sync.changes(baseline["token"])
+        assert delta["added"] == [{"episode_id": "c", "title": "C"}]
+        assert delta["removed"] == ["b"]
+        assert delta["changed"] == [
+            {
+                "episode_id": "a",
+                "fields": ["publish_date", "status"],
+                "values": {"publish_date": "2024", "status": "Published"},
+            }
+        ]
+        assert delta["token"] != baseline["token"]
+
+    @pytest.mark.asyncio
+    async def test_steady_state_and_stable_tokens(self, fake_client):
+        """Test an unchanged list yields the same token and an empty diff."""
+        client = fake_client([{"episode_id": "a", "title": "A"}])
+        sync = EpisodeSync(client)
+        token = (await sync.changes())["token"]
+        assert await sync.changes(token) == {"token": token, "added": [], "removed": [], "changed": []}
+        # Equal content in a new list object gives the same token
+        client.episodes = [{"title": "A", "episode_id": "a"}]
+        delta = await sync.changes(token)
+        assert delta["token"] == token and delta["changed"] == []
+
+    @pytest.mark.asyncio
+    async def test_expired_token_resets(self, fake_client):
+        """Test a token evicted from the snapshot history asks for a fresh baseline."""
+        client = fake_client([])
+        sync = EpisodeSync(client, max_snapshots=1)
+        old = (await sync.changes())["token"]
+        client.episodes = [{"episode_id": "a"}]
+        result = await sync.changes(old)
+        assert result["reset"] and result["episodes"] == 1
+
+
+class TestSyncTool:
+    """Tests for the sync_episodes tool."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_revalidates_each_call(self):
+        """Test each call revalidates the list and returns only the delta."""
+        first = [{"episode_id": "a", "title": "A", "description": "long"}]
+        route = respx.get(f"{BASE_URL}/api/episodes").mock(
+            side_effect=[
+                httpx.Response(200, json=first, headers={"ETag": '"1"'}),
+                httpx.Response(304),
+                httpx.Response(200, json=[*first, {"episode_id": "b", "title": "B", "description": "x"}]),
+            ]
+        )
+        config = Config(shows={"show1": "key1"}, base_url=BASE_URL, rate_limit=0)
+        mcp = FastMCP("test")
+        registry = register_tools(mcp, config)
+        async with Client(mcp) as client:
+
+            async def call(**kwargs):
+                result = await client.call_tool("sync_episodes", {"show": "show1", **kwargs})
+                return json.loads(result.content[0].text)
+
+            token = (await call())["token"]
+            assert (await call(since_token=token))["token"] == token
+            delta = await call(since_token=token)
+        assert delta["added"] == [{"episode_id": "b", "title": "B"}]
+        assert route.call_count == 3
+        await registry.aclose()
@@ -4,7 +4,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from podhome_mcp.config import Config
-from podhome_mcp.client import PodhomeClient
+from podhome_mcp.client import ClientRegistry, PodhomeClient
 
 
 class TestConfig:
@@ -64,7 +64,7 @@ class TestPodhomeClient:
     async def test_create_episode(self, client):
         """Test creating an episode."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"episodeId": "123"}
+        mock_response.content = b'{"episodeId": "123"}'
         mock_response.raise_for_status = MagicMock()
 
         client._client.post = AsyncMock(return_value=mock_response)
@@ -80,7 +80,7 @@ class TestPodhomeClient:
     async def test_list_episodes(self, client):
         """Test listing episodes."""
         mock_response = MagicMock()
-        mock_response.json.return_value = [{"episode_id": "123", "title": "Test"}]
+        mock_response.content = b'[{"episode_id": "123", "title": "Test"}]'
         mock_response.raise_for_status = MagicMock()
 
         client._client.get = AsyncMock(return_value=mock_response)
@@ -96,3 +96,41 @@ class TestPodhomeClient:
         client._client.aclose = AsyncMock()
         await client.aclose()
         client._client.aclose.assert_called_once()
+
+
+class TestClientRegistry:
+    """Tests for the pooled per-show client registry."""
+
+    @pytest.fixture
+    def config(self):
+        """Create a config with two shows sharing one API key."""
+        with patch.dict(
+            "os.environ",
+            {"PODHOME_SHOWS": '{"show1": "key1", "show2": "key1", "show3": "key3"}'},
+        ):
+            return Config()
+
+    def test_get_reuses_client(self, config):
+        """Test the same client is returned for repeated lookups."""
+        registry = ClientRegistry(config)
+        assert registry.get("show1") is registry.get("show1")
+        assert registry.get("show1") is registry.get("show2")
+        assert registry.get("show1") is not registry.get("show3")
+
+    def test_get_unknown_show(self, config):
+        """Test an unknown show raises before creating a client."""
+        registry = ClientRegistry(config)
+        with pytest.raises(ValueError):
+            registry.get("missing")
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_all_clients(self, config):
+        """Test closing the registry closes every pooled client."""
+        registry = ClientRegistry(config)
+        clients = [registry.get("show1"), registry.get("show3")]
+        for client in clients:
+            client._client.aclose = AsyncMock()
+        await registry.aclose()
+        for client in clients:
+            client._client.aclose.assert_called_once()
+        assert registry.get("show1") is not clients[0]
@@ -0,0 +1,162 @@
+"""Tests for transcript parsing and search."""
+
+import json
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client, FastMCP
+
+from podhome_mcp.client import ClientRegistry
+from podhome_mcp.config import Config
+from podhome_mcp.tools import register_tools
+from podhome_mcp.transcripts import TranscriptIndex, parse_transcript
+
+BASE_URL = "https://serve.podhome.fm"
+
+VTT = """WEBVTT
+
+1
+00:00:01.000 --> 00:00:04.500
+<v Chris>Welcome to the show.
+
+2
+00:01:02.250 --> 00:01:05.000
+Today we talk about Linux kernels
+and Rust drivers.
+"""
+
+EPISODES = [
+    {
+        "episode_id": "e1",
+        "title": "Kernel news",
+        "transcript": {"language": "en", "transcript_url": "https://cdn.example.com/e1.vtt"},
+    },
+    {
+        "episode_id": "e2",
+        "title": "Cooking",
+        "transcript": {"language": "en", "text": "We bake bread. Linux appears once."},
+    },
+    {"episode_id": "e3", "title": "No transcript"},
+]
+
+
+class TestParseTranscript:
+    """Tests for parse_transcript."""
+
+    def test_vtt(self):
+        """Test WebVTT cues become timed segments with tags stripped."""
+        segments = parse_transcript(VTT)
+        assert [(s.start, s.end) for s in segments] == [(1.0, 4.5), (62.25, 65.0)]
+        assert segments[0].text == "Welcome to the show."
+        assert segments[1].text == "Today we talk about Linux kernels and Rust drivers."
+
+    def test_srt_and_json(self):
+        """Test SRT timestamps and JSON segment lists are understood."""
+        srt = "1\n01:00:00,500 --> 01:00:02,000\nHello\n"
+        assert parse_transcript(srt)[0].start == 3600.5
+        data = json.dumps({"segments": [{"start_time": 3, "end_time": 4, "text": "Hi"}]})
+        segment = parse_transcript(data)[0]
+        assert (segment.start, segment.end, segment.text) == (3, 4, "Hi")
+
+    def test_plain_text(self):
+        """Test untimed text becomes a single segment without times."""
+        segment, = parse_transcript("just words")
+        assert (segment.start, segment.text) == (None, "just words")
+
+
+class TestTranscriptIndex:
+    """Tests for TranscriptIndex."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_search_ranks_and_timestamps(self):
+        """Test hits are ranked by relevance and carry segment times."""
+        episodes = respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=EPISODES)
+        )
+        vtt = respx.get("https://cdn.example.com/e1.vtt").mock(
+            return_value=httpx.Response(200, text=VTT)
+        )
+        registry = ClientRegistry(Config(shows={"show1": "key1"}, base_url=BASE_URL, rate_limit=0))
+        index = await registry.transcripts("show1").refresh()
+        assert len(index) == 2
+
+        hits = index.search("linux rust")
+        assert [h["episode_id"] for h in hits] == ["e1", "e2"]
+        assert hits[0]["matches"][0]["start"] == 62.25
+        assert hits[1]["matches"][0]["start"] is None
+        assert "X-API-KEY" not in vtt.calls[0].request.headers
+
+        await index.refresh()
+        assert episodes.call_count == 1
+        registry.get("show1").invalidate_episodes()
+        await index.refresh()
+        assert episodes.call_count == 2 and vtt.call_count == 1
+        await registry.aclose()
+
+    def test_incremental_update(self):
+        """Test re-adding an episode replaces its postings and removal drops them."""
+        index = TranscriptIndex(client=None)
+        index.add_episodes([{"id": "a", "transcript": {"text": "alpha beta"}}])
+        index.add_episodes([{"id": "a", "transcript": {"text": "gamma"}}])
+        assert index.search("alpha") == []
+        assert index.search("gamma")[0]["episode_id"] == "a"
+        # Same length, different text
+        index.add_episodes([{"id": "a", "transcript": {"text": "delta"}}])
+        assert index.search("gamma") == []
+        assert index.search("delta")[0]["episode_id"] == "a"
+        index.remove("a")
+        assert index.postings == {} and len(index) == 0
+
+    def test_failed_download_is_not_retried(self):
+        """Test a transcript URL that failed is skipped until it changes."""
+        index = TranscriptIndex(client=None)
+        index.failed["e1"] = "https://cdn.example.com/e1.vtt"
+        assert index.add_episodes(EPISODES[:1]) == []
+        changed = {**EPISODES[0], "transcript": {"transcript_url": "https://cdn.example.com/v2.vtt"}}
+        assert index.add_episodes([changed]) == [changed]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_transient_failure_is_retried(self):
+        """Test a 5xx transcript download is retried on a later refresh but a 404 is not."""
+        respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=EPISODES)
+        )
+        vtt = respx.get("https://cdn.example.com/e1.vtt").mock(
+            side_effect=[httpx.Response(503), httpx.Response(404)]
+        )
+        config = Config(shows={"show1": "key1"}, base_url=BASE_URL, rate_limit=0, cache_ttl=0)
+        registry = ClientRegistry(config)
+        index = await registry.transcripts("show1").refresh()
+        assert index.failed == {"e1": "https://cdn.example.com/e1.vtt"}
+        await index.refresh()
+        await index.refresh()
+        assert vtt.call_count == 2 and "e1" in index.failed
+        await registry.aclose()
+
+
+class TestSearchTool:
+    """Tests for the search_transcripts tool."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_tool(self):
+        """Test the tool reports hits and episodes whose transcript was unavailable."""
+        respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=EPISODES)
+        )
+        respx.get("https://cdn.example.com/e1.vtt").mock(return_value=httpx.Response(404))
+        config = Config(shows={"show1": "key1"}, base_url=BASE_URL, rate_limit=0)
+        registry = ClientRegistry(config)
+        mcp = FastMCP("test")
+        register_tools(mcp, config, registry)
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "search_transcripts", {"show": "show1", "query": "bread"}
+            )
+        data = json.loads(result.content[0].text)
+        assert [h["episode_id"] for h in data["hits"]] == ["e2"]
+        assert data["unavailable"] == ["e1"]
+        await registry.aclose()
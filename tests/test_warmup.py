@@ -0,0 +1,141 @@
+"""Tests for the background warm-up scheduler."""
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client, FastMCP
+
+from podhome_mcp.client import ClientRegistry
+from podhome_mcp.config import Config
+from podhome_mcp.tools import register_tools
+from podhome_mcp.warmup import WarmupScheduler
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+def make_registry(**shows) -> ClientRegistry:
+    return ClientRegistry(Config(shows=shows or {"show1": "key1"}, base_url=BASE_URL, rate_limit=0))
+
+
+class TestWarmupScheduler:
+    """Tests for WarmupScheduler."""
+
+    def test_enabled_by_transport(self):
+        """Test warm-up defaults to off for stdio and on for http, unless set explicitly."""
+        config = Config(shows={"show1": "key1"}, base_url=BASE_URL)
+        assert not config.warmup_enabled("stdio")
+        assert config.warmup_enabled("http")
+        config = Config(shows={"show1": "key1"}, base_url=BASE_URL, warmup=True)
+        assert config.warmup_enabled("stdio")
+        config = Config(shows={"show1": "key1"}, base_url=BASE_URL, warmup=True, cache_ttl=0)
+        assert not config.warmup_enabled("http")
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_prefetch_serves_calls_from_cache(self):
+        """Test startup fetches each API key's lists once and later reads hit the cache."""
+        episodes = respx.get(f"{BASE_URL}/api/episodes").mock(
+            return_value=httpx.Response(200, json=[{"episode_id": "e1"}])
+        )
+        hooks = respx.get(f"{BASE_URL}/api/hook").mock(
+            return_value=httpx.Response(200, json=[{"id": "h1"}])
+        )
+        registry = make_registry(a="key1", b="key1", c="key2")
+        scheduler = WarmupScheduler(registry, ["a", "b", "c"]).start()
+        await asyncio.wait_for(scheduler.warmed.wait(), 5)
+        assert episodes.call_count == 2 and hooks.call_count == 2
+        assert set(scheduler.stats()) == {"a", "c"}
+
+        assert await registry.get("b").list_episodes() == [{"episode_id": "e1"}]
+        assert await registry.get("c").list_webhooks() == [{"id": "h1"}]
+        assert registry.index("a").get("e1") is not None
+        assert episodes.call_count == 2 and hooks.call_count == 2
+        await scheduler.aclose()
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_interval_adapts_to_changes(self):
+        """Test unchanged lists lengthen the interval and changed lists shorten it."""
+        respx.get(f"{BASE_URL}/api/episodes").mock(
+            side_effect=[
+                httpx.Response(200, json=[{"episode_id": "e1"}], headers={"ETag": '"1"'}),
+                httpx.Response(304),
+                httpx.Response(200, json=[{"episode_id": "e2"}], headers={"ETag": '"2"'}),
+            ]
+        )
+        respx.get(f"{BASE_URL}/api/hook").mock(return_value=httpx.Response(200, json=[]))
+        registry = make_registry()
+        scheduler = WarmupScheduler(registry, ["show1"], min_interval=10, max_interval=40)
+        (state,) = scheduler._shows
+        state.interval = 20
+
+        await scheduler.refresh(state)
+        assert scheduler.stats()["show1"]["interval"] == 20
+        await scheduler.refresh(state)
+        assert scheduler.stats()["show1"]["interval"] == 30
+        await scheduler.refresh(state)
+        stats = scheduler.stats()["show1"]
+        assert stats["interval"] == 15 and stats["changes"] == 1 and stats["refreshes"] == 3
+        assert 15 * 0.8 <= state.due - asyncio.get_running_loop().time() <= 15
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_yields_to_tool_calls(self):
+        """Test a refresh waits while a tool call has a request in flight on the client."""
+        release = asyncio.Event()
+        seen = []
+
+        async def slow(request):
+            seen.append(registry.get("show1").foreground)
+            if len(seen) == 1:
+                await release.wait()
+            return httpx.Response(200, json=[])
+
+        respx.get(f"{BASE_URL}/api/episodes").mock(side_effect=slow)
+        respx.get(f"{BASE_URL}/api/hook").mock(return_value=httpx.Response(200, json=[]))
+        config = Config(shows={"show1": "key1"}, base_url=BASE_URL, rate_limit=0, cache_ttl=0)
+        mcp = FastMCP("test")
+        registry = register_tools(mcp, config)
+        scheduler = WarmupScheduler(registry, ["show1"], idle_poll=0.01)
+        async with Client(mcp) as client:
+            call = asyncio.create_task(client.call_tool("list_episodes", {"show": "show1"}))
+            while not seen:
+                await asyncio.sleep(0.01)
+            scheduler.start()
+            await asyncio.sleep(0.05)
+            assert len(seen) == 1
+            release.set()
+            await call
+            await asyncio.wait_for(scheduler.warmed.wait(), 5)
+        assert seen[0] == 1 and not any(seen[1:])
+        assert scheduler.stats()["show1"]["deferred"] == 1
+        await scheduler.aclose()
+        await registry.aclose()
+
+
+class TestWebhookCache:
+    """Tests for caching of the webhook list."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_register_invalidates(self):
+        """Test registering a webhook drops the cached list."""
+        route = respx.get(f"{BASE_URL}/api/hook").mock(
+            side_effect=[httpx.Response(200, json=[]), httpx.Response(200, json=[{"id": "h1"}])]
+        )
+        respx.post(f"{BASE_URL}/api/hook").mock(return_value=httpx.Response(200, json={"id": "h1"}))
+        registry = make_registry()
+        client = registry.get("show1")
+        assert await client.list_webhooks() == []
+        assert await client.list_webhooks() == []
+        await client.register_webhook({"url": "https://example.com/hook"})
+        assert await client.list_webhooks() == [{"id": "h1"}]
+        assert route.call_count == 2
+        assert client.hooks_cache.stats()["hits"] == 1
+        # Webhook lookups don't show up in the episode cache counters
+        assert registry.cache_stats()["show1"]["hits"] == 0
+        await registry.aclose()
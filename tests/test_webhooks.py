@@ -0,0 +1,211 @@
+"""Tests for the embedded webhook receiver and event log."""
+
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+import respx
+from fastmcp import Client, FastMCP
+
+from podhome_mcp.client import ClientRegistry
+from podhome_mcp.config import Config
+from podhome_mcp.tools import register_tools
+from podhome_mcp.webhooks import EventLog, WebhookReceiver, parse_event
+
+BASE_URL = "https://serve.podhome.fm"
+
+
+@pytest.fixture
+def config():
+    return Config(shows={"show1": "key1"}, base_url=BASE_URL, rate_limit=0)
+
+
+class TestEventLog:
+    """Tests for EventLog."""
+
+    @pytest.mark.asyncio
+    async def test_wait_wakes_on_matching_event(self):
+        """Test a waiter is woken by a matching event and skips others."""
+        log = EventLog()
+        waiter = asyncio.create_task(log.wait("show1", event="episode_live", timeout=1))
+        await asyncio.sleep(0)
+        await log.publish("show2", "episode_live", "e1", {})
+        await log.publish("show1", "episode_published", "e1", {})
+        await log.publish("show1", "episode_live", "e2", {})
+        event = await waiter
+        assert (event.seq, event.episode_id) == (3, "e2")
+
+    @pytest.mark.asyncio
+    async def test_cursor_returns_past_events(self):
+        """Test events published before the call are found via ``after``."""
+        log = EventLog()
+        await log.publish("show1", "episode_published", "e1", {})
+        await log.publish("show1", "episode_published", "e2", {})
+        event = await log.wait("show1", after=1, timeout=0)
+        assert event.episode_id == "e2"
+        assert await log.wait("show1", after=2, timeout=0) is None
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        """Test None is returned when nothing arrives in time."""
+        log = EventLog()
+        assert await log.wait("show1", episode="e1", timeout=0.01) is None
+
+    @pytest.mark.asyncio
+    async def test_bounded(self):
+        """Test only the most recent events are kept."""
+        log = EventLog(max_events=2)
+        for i in range(3):
+            await log.publish("show1", "episode_live", f"e{i}", {})
+        assert len(log) == 2
+        assert log.find("show1").episode_id == "e1"
+
+
+class TestParseEvent:
+    """Tests for parse_event."""
+
+    def test_nested_episode(self):
+        """Test the episode ID is found in a nested record."""
+        body = json.dumps({"action_type": "episode_live", "episode": {"id": 7}}).encode()
+        assert parse_event(body)[:2] == ("episode_live", "7")
+
+    def test_empty_body(self):
+        """Test an empty body is accepted."""
+        assert parse_event(b"") == (None, None, {})
+
+
+class TestWebhookReceiver:
+    """Tests for WebhookReceiver."""
+
+    @pytest.mark.asyncio
+    async def test_delivery_invalidates_cache_and_publishes(self, config):
+        """Test a delivery clears the episode cache and reaches the event log."""
+        registry = ClientRegistry(config)
+        receiver = await WebhookReceiver(registry, secret="s3cret").start()
+        try:
+            with respx.mock:
+                respx.route(host="127.0.0.1").pass_through()
+                route = respx.get(f"{BASE_URL}/api/episodes").mock(
+                    return_value=httpx.Response(200, json=[{"episode_id": "e1"}])
+                )
+                client = registry.get("show1")
+                await client.list_episodes()
+                url = receiver.url_for("show1", "episode_published", local=True)
+                assert url.endswith("/hooks/show1/episode_published?token=s3cret")
+                async with httpx.AsyncClient() as http:
+                    r = await http.post(url, json={"episode_id": "e1"})
+                    assert r.status_code == 204
+                    bad = await http.post(url.replace("s3cret", "nope"), json={})
+                    assert bad.status_code == 401
+                    unknown = await http.post(url.replace("show1", "other"), json={})
+                    assert unknown.status_code == 404
+                await client.list_episodes()
+                assert route.call_count == 2
+            event = registry.events.find("show1")
+            assert (event.event, event.episode_id) == ("episode_published", "e1")
+            assert len(registry.events) == 1
+        finally:
+            await receiver.aclose()
+            await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_delivery_unquotes_path(self):
+        """Test a slug escaped by url_for is matched to its show on delivery."""
+        registry = ClientRegistry(
+            Config(shows={"my show": "key1"}, base_url=BASE_URL, rate_limit=0)
+        )
+        receiver = WebhookReceiver(registry, public_url="https://hooks.example.com")
+        url = receiver.url_for("my show", "episode_live")
+        assert url == "https://hooks.example.com/hooks/my%20show/episode_live"
+        status = await receiver.deliver("POST", urlsplit(url).path, b'{"episode_id": "e1"}')
+        assert status == 204
+        assert registry.events.find("my show").event == "episode_live"
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_unknown_event_path(self, config):
+        """Test only known action types are accepted as the event path segment."""
+        registry = ClientRegistry(config)
+        receiver = WebhookReceiver(registry)
+        assert await receiver.deliver("POST", "/hooks/show1/anything", b"{}") == 404
+        assert await receiver.deliver("POST", "/hooks/show1", b'{"action_type": "x"}') == 204
+        assert registry.events.find("show1").event == "unknown"
+        await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_requires_secret_off_loopback(self, config):
+        """Test the receiver won't listen on a non-loopback address without a secret."""
+        registry = ClientRegistry(config)
+        with pytest.raises(ValueError, match="PODHOME_WEBHOOK_SECRET"):
+            await WebhookReceiver(registry, "0.0.0.0").start()
+        receiver = await WebhookReceiver(registry, "0.0.0.0", secret="s3cret").start()
+        await receiver.aclose()
+        await registry.aclose()
+
+
+class TestWebhookTools:
+    """Tests for the webhook-related tools."""
+
+    @pytest.mark.asyncio
+    async def test_wait_for_event(self, config):
+        """Test wait_for_event returns the next delivered event."""
+        registry = ClientRegistry(config)
+        registry.receiver = await WebhookReceiver(registry).start()
+        mcp = FastMCP("test")
+        register_tools(mcp, config, registry)
+        try:
+            async with Client(mcp) as client:
+                call = asyncio.create_task(
+                    client.call_tool(
+                        "wait_for_event", {"show": "show1", "episode_id": "e2", "timeout": 5}
+                    )
+                )
+                await asyncio.sleep(0.05)
+                async with httpx.AsyncClient() as http:
+                    for eid in ("e1", "e2"):
+                        await http.post(
+                            registry.receiver.url_for("show1", "episode_live", local=True),
+                            json={"episode_id": eid},
+                        )
+                event = json.loads((await call).content[0].text)
+                assert (event["seq"], event["event"]) == (2, "episode_live")
+
+                result = await client.call_tool(
+                    "wait_for_event", {"show": "show1", "after": 2, "timeout": 0}
+                )
+                assert json.loads(result.content[0].text) == {"timeout": True, "cursor": 2}
+        finally:
+            await registry.receiver.aclose()
+            await registry.aclose()
+
+    @pytest.mark.asyncio
+    async def test_register_webhook_defaults_to_receiver(self, config):
+        """Test register_webhook points at the receiver when no url is given."""
+        registry = ClientRegistry(config)
+        mcp = FastMCP("test")
+        register_tools(mcp, config, registry)
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "register_webhook", {"show": "show1", "action_type": "episode_live"}
+            )
+            assert result.content[0].text.startswith("Error: url is required")
+
+            registry.receiver = WebhookReceiver(registry)
+            result = await client.call_tool(
+                "register_webhook", {"show": "show1", "action_type": "episode_live"}
+            )
+            assert "PODHOME_WEBHOOK_PUBLIC_URL" in result.content[0].text
+
+            registry.receiver.public_url = "https://hooks.example.com/"
+            with respx.mock:
+                route = respx.post(f"{BASE_URL}/api/hook").mock(
+                    return_value=httpx.Response(200, json={"integration_id": "i1"})
+                )
+                await client.call_tool(
+                    "register_webhook", {"show": "show1", "action_type": "episode_live"}
+                )
+            sent = json.loads(route.calls[0].request.content)
+            assert sent["url"] == "https://hooks.example.com/hooks/show1/episode_live"
+        await registry.aclose()